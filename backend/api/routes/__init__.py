@@ -4,6 +4,8 @@
 
 import logging
 
+from fastapi import APIRouter
+
 from backend.api.routes.batch import get_batch_router
 from backend.api.routes.candidates import get_candidates_router
 from backend.api.routes.cv import get_cv_router
@@ -17,14 +19,16 @@ logger = logging.getLogger(__name__)
 
 def register_dashboard_routes(app, db):
     """
-    Register all dashboard/HR API routers with the FastAPI app.
+    Register all dashboard/HR API routers with the FastAPI app under one /api parent router.
     Mount my_resumes first so /api/my-resumes/{id}/job-recommendations and /download are matched before /api/my-resumes/{id}.
     """
-    app.include_router(get_my_resumes_router(db), prefix="/api")
-    app.include_router(get_dashboard_stats_router(db), prefix="/api")
-    app.include_router(get_candidates_router(db), prefix="/api")
-    app.include_router(get_cv_router(db), prefix="/api")
-    app.include_router(get_jobs_router(db), prefix="/api")
-    app.include_router(get_export_router(db), prefix="/api")
-    app.include_router(get_batch_router(db), prefix="/api")
+    api = APIRouter(prefix="/api")
+    api.include_router(get_my_resumes_router(db))
+    api.include_router(get_dashboard_stats_router(db))
+    api.include_router(get_candidates_router(db))
+    api.include_router(get_cv_router(db))
+    api.include_router(get_jobs_router(db))
+    api.include_router(get_export_router(db))
+    api.include_router(get_batch_router(db))
+    app.include_router(api)
     logger.info("✅ Dashboard API routes registered successfully")
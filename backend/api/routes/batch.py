@@ -4,7 +4,6 @@
 
 import asyncio
 import hashlib
-import io
 import logging
 import os
 import shutil
@@ -12,21 +11,23 @@ import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from bson import ObjectId
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, UploadFile
 from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Annotated
 
+from backend.api.routes.common import get_job_post_cached
 from backend.config import Config
 from backend.core.dependencies import require_manager_or_admin
 from backend.models.user import UserModel
 from backend.services.hr.batch_processing import (
+    CV_NAME_TRANSLATION,
     BatchProcessor,
     import_candidates_from_uploads,
     process_candidates_from_directory,
 )
-from backend.services.hr.data_export import DataExporter
+from backend.services.hr.data_export import EXPORT_PROJECTION, DataExporter
+from backend.utils.object_ids import is_object_id, parse_object_ids
 
 ALLOWED_CV_EXTENSIONS = (".pdf", ".doc", ".docx")
 HASH_CHUNK_SIZE = 1024 * 1024  # 1 MB
@@ -81,10 +82,9 @@ def get_batch_router(db: Any):
             job_id = body.job_id
             candidates = body.candidates
             max_concurrent = body.max_concurrent
-            if not ObjectId.is_valid(job_id):
+            if not is_object_id(job_id):
                 raise HTTPException(status_code=400, detail="Invalid job id")
-            jobs_collection = db.hr_job_posts
-            job = await jobs_collection.find_one({"_id": ObjectId(job_id)})
+            job = await get_job_post_cached(db, job_id)
             if not job:
                 raise HTTPException(status_code=404, detail="Job posting not found")
 
@@ -106,7 +106,7 @@ def get_batch_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error processing batch: {str(e)}")
+            logger.exception("Error processing batch: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.post("/batch/upload")
@@ -151,7 +151,7 @@ def get_batch_router(db: Any):
                 relative_path: Optional[str] = relative_paths[idx] if idx < len(relative_paths) else ""
                 source_folder = _parent_folder_from_relative_path(relative_path or filename)
 
-                stem = Path(safe_name).stem.replace("_", " ").replace("-", " ").strip()
+                stem = Path(safe_name).stem.translate(CV_NAME_TRANSLATION).strip()
                 display_name = stem or "Candidate"
                 candidates.append({
                     "name": display_name,
@@ -202,7 +202,7 @@ def get_batch_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error uploading batch CVs: {str(e)}")
+            logger.exception("Error uploading batch CVs: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
@@ -215,7 +215,7 @@ def get_batch_router(db: Any):
         _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
     ):
         try:
-            if not ObjectId.is_valid(job_id):
+            if not is_object_id(job_id):
                 raise HTTPException(status_code=400, detail="Invalid job id")
 
             # Confine directory processing to an allowed base directory to prevent
@@ -231,8 +231,7 @@ def get_batch_router(db: Any):
                 )
             cv_directory = str(requested)
 
-            jobs_collection = db.hr_job_posts
-            job = await jobs_collection.find_one({"_id": ObjectId(job_id)})
+            job = await get_job_post_cached(db, job_id)
             if not job:
                 raise HTTPException(status_code=404, detail="Job posting not found")
 
@@ -258,40 +257,41 @@ def get_batch_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error processing directory batch: {str(e)}")
+            logger.exception("Error processing directory batch: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.get("/batch/{batch_id}/export")
     async def export_batch_results(
         batch_id: str,
+        background_tasks: BackgroundTasks,
         format: str = Query("csv", pattern="^(csv|xlsx)$"),
         _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
     ):
         try:
             candidates_collection = db.candidates
-            candidates: List[Dict[str, Any]] = []
+            cursor = None
+            first = None
 
             batch_meta = await db.batch_imports.find_one({"batch_id": batch_id})
             if batch_meta:
-                export_ids = [
-                    cid
-                    for cid in (
-                        batch_meta.get("candidate_ids", [])
-                        + batch_meta.get("duplicate_candidate_ids", [])
-                    )
-                    if cid and ObjectId.is_valid(cid)
-                ]
-                if export_ids:
+                export_oids = parse_object_ids(
+                    batch_meta.get("candidate_ids", [])
+                    + batch_meta.get("duplicate_candidate_ids", [])
+                )
+                if export_oids:
                     cursor = candidates_collection.find(
-                        {"_id": {"$in": [ObjectId(cid) for cid in export_ids]}}
+                        {"_id": {"$in": list(export_oids.values())}},
+                        EXPORT_PROJECTION,
                     ).limit(BATCH_EXPORT_MAX_ROWS)
-                    candidates = await cursor.to_list(length=BATCH_EXPORT_MAX_ROWS)
+                    first = await anext(cursor, None)
 
-            if not candidates:
-                cursor = candidates_collection.find({"batch_id": batch_id}).limit(BATCH_EXPORT_MAX_ROWS)
-                candidates = await cursor.to_list(length=BATCH_EXPORT_MAX_ROWS)
+            if first is None:
+                cursor = candidates_collection.find(
+                    {"batch_id": batch_id}, EXPORT_PROJECTION
+                ).limit(BATCH_EXPORT_MAX_ROWS)
+                first = await anext(cursor, None)
 
-            if not candidates:
+            if first is None:
                 raise HTTPException(
                     status_code=404,
                     detail="Batch not found or has no exportable candidates.",
@@ -299,17 +299,28 @@ def get_batch_router(db: Any):
 
             exporter = DataExporter()
 
+            async def _candidates():
+                yield first
+                async for doc in cursor:
+                    yield doc
+
             if format == "csv":
-                csv_data = exporter.export_to_csv(candidates, output_path=None)
                 return StreamingResponse(
-                    io.StringIO(csv_data),
+                    exporter.stream_csv(_candidates()),
                     media_type="text/csv",
                     headers={"Content-Disposition": f"attachment; filename=batch_{batch_id}.csv"},
                 )
             else:
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
                     tmp_path = tmp.name
-                exporter.export_to_excel(candidates, tmp_path)
+                try:
+                    await exporter.stream_excel(_candidates(), tmp_path)
+                except BaseException:
+                    # No response will be sent, so the background task below would never run.
+                    os.unlink(tmp_path)
+                    raise
+                # Delete the workbook once the response has been sent.
+                background_tasks.add_task(os.unlink, tmp_path)
                 return FileResponse(
                     tmp_path,
                     media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
@@ -318,7 +329,7 @@ def get_batch_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error exporting batch: {str(e)}")
+            logger.exception("Error exporting batch: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     return router
@@ -3,18 +3,36 @@
 # ============================================================================
 
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Annotated
 
 from backend.core.dependencies import require_manager_or_admin
+from backend.core.mongodb import get_str_id_collection
 from backend.models.user import UserModel
 
 logger = logging.getLogger(__name__)
 
 
+def _build_candidates_query(
+    job_id: Optional[str], min_score: Optional[int], max_score: Optional[int]
+) -> Dict[str, Any]:
+    """Mongo filter shared by the candidates list and count endpoints."""
+    query: Dict[str, Any] = {}
+    if job_id:
+        query["job_id"] = job_id
+    if min_score is not None or max_score is not None:
+        score_query = {}
+        if min_score is not None:
+            score_query["$gte"] = min_score
+        if max_score is not None:
+            score_query["$lte"] = max_score
+        query["evaluation_score"] = score_query
+    return query
+
+
 def get_candidates_router(db: Any):
     router = APIRouter(tags=["Candidates"])
 
@@ -30,32 +48,42 @@ def get_candidates_router(db: Any):
         _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
     ):
         try:
-            query = {}
-            if job_id:
-                query["job_id"] = job_id
-            if min_score is not None or max_score is not None:
-                score_query = {}
-                if min_score is not None:
-                    score_query["$gte"] = min_score
-                if max_score is not None:
-                    score_query["$lte"] = max_score
-                query["evaluation_score"] = score_query
+            query = _build_candidates_query(job_id, min_score, max_score)
 
             sort_field = "evaluation_score" if sort_by == "score" else "candidate_name" if sort_by == "name" else "timestamp"
             sort_direction = -1 if sort_order == "desc" else 1
 
-            candidates_collection = db.candidates
-            total = await candidates_collection.count_documents(query)
-            cursor = candidates_collection.find(query).sort(sort_field, sort_direction).skip(offset).limit(limit)
-            candidates = await cursor.to_list(length=limit)
+            # Over-fetch one row to detect a next page instead of counting the
+            # whole result set on every page load (see /candidates/count).
+            candidates_collection = get_str_id_collection(db, "candidates")
+            cursor = candidates_collection.find(query).sort(sort_field, sort_direction).skip(offset).limit(limit + 1)
+            candidates = await cursor.to_list(length=limit + 1)
+            has_more = len(candidates) > limit
+            candidates = candidates[:limit]
 
-            for candidate in candidates:
-                if "_id" in candidate:
-                    candidate["_id"] = str(candidate["_id"])
+            return {"limit": limit, "offset": offset, "has_more": has_more, "candidates": candidates}
+        except Exception as e:
+            logger.exception("Error fetching candidates: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
 
-            return {"total": total, "limit": limit, "offset": offset, "candidates": candidates}
+    @router.get("/candidates/count")
+    async def get_candidates_count(
+        job_id: Optional[str] = Query(None),
+        min_score: Optional[int] = Query(None, ge=0, le=100),
+        max_score: Optional[int] = Query(None, ge=0, le=100),
+        _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
+    ):
+        try:
+            query = _build_candidates_query(job_id, min_score, max_score)
+            candidates_collection = db.candidates
+            if query:
+                total = await candidates_collection.count_documents(query)
+            else:
+                # Unfiltered listing: collection metadata count, no scan.
+                total = await candidates_collection.estimated_document_count()
+            return {"total": total}
         except Exception as e:
-            logger.error(f"Error fetching candidates: {str(e)}")
+            logger.exception("Error counting candidates: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.get("/candidates/{candidate_id}")
@@ -64,7 +92,7 @@ def get_candidates_router(db: Any):
         _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
     ):
         try:
-            candidates_collection = db.candidates
+            candidates_collection = get_str_id_collection(db, "candidates")
             try:
                 object_id = ObjectId(candidate_id)
                 query = {"_id": object_id}
@@ -74,13 +102,11 @@ def get_candidates_router(db: Any):
             candidate = await candidates_collection.find_one(query)
             if not candidate:
                 raise HTTPException(status_code=404, detail="Candidate not found")
-            if "_id" in candidate:
-                candidate["_id"] = str(candidate["_id"])
             return candidate
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error fetching candidate detail: {str(e)}")
+            logger.exception("Error fetching candidate detail: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     return router
@@ -5,45 +5,80 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import orjson
 from bson import ObjectId
 from pydantic import BaseModel, Field
 
+from backend.config import Config
+from backend.utils.object_ids import parse_object_ids
+from backend.utils.ttl_cache import TTLCache
+
+# job_id -> hr_job_posts document, see get_job_post_cached.
+_job_cache = TTLCache(ttl=Config.JOB_CACHE_TTL, maxsize=256)
+
+
+def _json_default(value: Any) -> Any:
+    """orjson fallback for BSON/Python types it does not serialize natively."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
 
 def json_safe(doc: dict) -> dict:
-    """Convert MongoDB document to JSON-serializable dict."""
-    out = {}
-    for k, v in doc.items():
-        if isinstance(v, ObjectId):
-            out[k] = str(v)
-        elif hasattr(v, "isoformat"):
-            out[k] = v.isoformat() if v else None
-        elif isinstance(v, dict):
-            out[k] = json_safe(v)
-        elif isinstance(v, list):
-            out[k] = [json_safe(x) if isinstance(x, dict) else x for x in v]
-        else:
-            out[k] = v
-    return out
-
-
-async def fetch_docs_by_ids(collection, ids: list) -> dict:
+    """Convert MongoDB document to JSON-serializable dict.
+
+    The tree walk happens inside orjson (C) rather than in a recursive Python
+    loop; ObjectId becomes str and datetimes ISO-8601 strings as before.
+    """
+    return orjson.loads(
+        orjson.dumps(doc, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    )
+
+
+async def fetch_docs_by_ids(collection, ids: list, projection: Optional[dict] = None) -> dict:
     """Fetch multiple MongoDB documents by _id in a single query.
 
     Returns a dict keyed by stringified _id for O(1) lookup when enriching
     list endpoints that would otherwise N+1 loop with find_one per id.
+    Duplicate ids are queried once; pass ``projection`` to fetch only the
+    fields the caller needs. Keys are the caller's id strings, so results can
+    be looked up with the same values that were passed in.
     """
-    valid_oids = [ObjectId(cid) for cid in ids if cid and ObjectId.is_valid(str(cid))]
-    if not valid_oids:
+    oid_map = parse_object_ids(ids)
+    if not oid_map:
         return {}
-    cursor = collection.find({"_id": {"$in": valid_oids}})
-    docs = await cursor.to_list(length=len(valid_oids))
-    return {str(doc["_id"]): doc for doc in docs}
+    key_by_oid = {oid: key for key, oid in oid_map.items()}
+    cursor = collection.find({"_id": {"$in": list(key_by_oid)}}, projection)
+    # Build the map straight off the cursor; no intermediate list, no str(ObjectId).
+    return {key_by_oid.get(doc["_id"], str(doc["_id"])): doc async for doc in cursor}
+
 
+async def get_job_post_cached(db, job_id: str) -> Optional[dict]:
+    """Fetch a job posting by _id through a short per-worker TTL cache.
+
+    Batch kickoffs for the same job reuse the document instead of hitting
+    MongoDB each time. The returned dict is shared; treat it as read-only.
+    """
+    if Config.JOB_CACHE_TTL > 0:
+        job = _job_cache.get(job_id)
+        if job is not None:
+            return job
+    job = await db.hr_job_posts.find_one({"_id": ObjectId(job_id)})
+    if job is not None and Config.JOB_CACHE_TTL > 0:
+        _job_cache.set(job_id, job)
+    return job
 
-def normalize_job_doc(doc: dict) -> dict:
-    """Ensure job document has job_title, job_description, hr_email, createdAt for API response."""
+
+def normalize_job_doc(doc: dict, copy: bool = True) -> dict:
+    """Ensure job document has job_title, job_description, hr_email, createdAt for API response.
+
+    Pass ``copy=False`` for documents the caller owns (e.g. fresh from a cursor)
+    to fill the fields in place instead of copying the document first.
+    """
     try:
-        out = dict(doc) if doc else {}
+        out = (dict(doc) if copy else doc) if doc else {}
         if "_id" in out:
             out["_id"] = str(out["_id"])
         ja = out.get("jobApplication")
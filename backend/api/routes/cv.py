@@ -12,16 +12,31 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from typing import Annotated
 
+from backend.config import Config
 from backend.core.dependencies import get_optional_user
 from backend.models.user import UserModel
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 logger = logging.getLogger(__name__)
 
 
-def _save_upload_to_path(upload_file, dest_path: str) -> None:
-    """Write uploaded file to disk (sync; run via asyncio.to_thread)."""
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size limit."""
+
+
+def _save_upload_to_path(upload_file, dest_path: str, max_bytes: int) -> None:
+    """Copy an upload to disk in chunks, stopping once it exceeds ``max_bytes``.
+
+    Sync; run via asyncio.to_thread.
+    """
+    written = 0
     with open(dest_path, "wb") as buffer:
-        shutil.copyfileobj(upload_file, buffer)
+        while chunk := upload_file.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > max_bytes:
+                raise UploadTooLarge(f"File exceeds {max_bytes} bytes")
+            buffer.write(chunk)
 
 
 def get_cv_router(db: Any):
@@ -34,6 +49,7 @@ def get_cv_router(db: Any):
         cv_file: UploadFile = File(...),
         current_user: Annotated[Optional[UserModel], Depends(get_optional_user)] = None,
     ):
+        temp_dir = None
         try:
             if not cv_file.filename or not cv_file.filename.lower().endswith(('.pdf', '.doc', '.docx')):
                 raise HTTPException(
@@ -44,9 +60,20 @@ def get_cv_router(db: Any):
             temp_dir = tempfile.mkdtemp()
             temp_file_path = os.path.join(temp_dir, cv_file.filename or "upload.pdf")
 
-            await asyncio.to_thread(_save_upload_to_path, cv_file.file, temp_file_path)
+            try:
+                await asyncio.to_thread(
+                    _save_upload_to_path,
+                    cv_file.file,
+                    temp_file_path,
+                    Config.MAX_CV_UPLOAD_MB * 1024 * 1024,
+                )
+            except UploadTooLarge:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {Config.MAX_CV_UPLOAD_MB} MB."
+                )
 
-            logger.info(f"Processing CV for {candidate_name} ({candidate_email})")
+            logger.info("Processing CV for %s (%s)", candidate_name, candidate_email)
 
             from backend.services.hr.automation import process_cv_upload
 
@@ -64,14 +91,8 @@ def get_cv_router(db: Any):
                 user_email=user_email,
             )
 
-            try:
-                os.remove(temp_file_path)
-                os.rmdir(temp_dir)
-            except Exception:
-                pass
-
             resume_id = result.get("candidate_id", "")
-            logger.info(f"Successfully processed CV for {candidate_name}, candidate_id={resume_id}")
+            logger.info("Successfully processed CV for %s, candidate_id=%s", candidate_name, resume_id)
 
             return {
                 "success": True,
@@ -88,7 +109,11 @@ def get_cv_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error processing CV: {str(e)}")
+            logger.exception("Error processing CV: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
+        finally:
+            # The upload is only needed while processing; remove it on every path.
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
     return router
@@ -12,6 +12,11 @@ from typing import Annotated
 from backend.api.routes.common import json_safe, DashboardStats
 from backend.core.dependencies import require_manager_or_admin
 from backend.models.user import UserModel
+from backend.services.hr.score_distribution import (
+    SCORE_RANGES,
+    distribution_rows,
+    get_job_score_counts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +102,16 @@ def get_dashboard_stats_router(db: Any):
                             },
                             {"$sort": {"evaluation_score": -1}},
                             {"$limit": 10},
+                            {
+                                "$project": {
+                                    "_id": 0,
+                                    "candidate_name": 1,
+                                    "candidate_email": 1,
+                                    "evaluation_score": 1,
+                                    "job_title": 1,
+                                    "timestamp": 1,
+                                }
+                            },
                         ],
                     }
                 },
@@ -152,7 +167,7 @@ def get_dashboard_stats_router(db: Any):
                 top_candidates=top_safe,
             )
         except Exception as e:
-            logger.error(f"Error fetching dashboard stats: {str(e)}")
+            logger.exception("Error fetching dashboard stats: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.get("/analytics/score-distribution")
@@ -161,31 +176,9 @@ def get_dashboard_stats_router(db: Any):
         _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
     ):
         try:
-            distribution = []
-            ranges = ["0-49", "50-59", "60-69", "70-79", "80-89", "90-100"]
-            total = 0
-
             if job_id and getattr(db, "candidate_evaluations", None):
-                evals_collection = db.candidate_evaluations
-                pipeline = [
-                    {"$match": {"job_id": job_id}},
-                    {
-                        "$bucket": {
-                            "groupBy": "$score",
-                            "boundaries": [0, 50, 60, 70, 80, 90, 100],
-                            "default": "other",
-                            "output": {"count": {"$sum": 1}},
-                        }
-                    },
-                ]
-                result = await (await evals_collection.aggregate(pipeline)).to_list(None)
-                for i, bucket in enumerate(result):
-                    distribution.append({
-                        "range": ranges[i] if i < len(ranges) else "other",
-                        "count": bucket.get("count", 0),
-                        "percentage": 0,
-                    })
-                total = sum(d["count"] for d in distribution)
+                # Indexed $bucket over the job's evaluations (see score_distribution).
+                counts = await get_job_score_counts(db, job_id)
             else:
                 query = {}
                 if job_id:
@@ -196,28 +189,26 @@ def get_dashboard_stats_router(db: Any):
                     {
                         "$bucket": {
                             "groupBy": "$evaluation_score",
-                            "boundaries": [0, 50, 60, 70, 80, 90, 100],
+                            "boundaries": [0, 50, 60, 70, 80, 90, 101],
                             "default": "other",
                             "output": {"count": {"$sum": 1}},
                         }
                     },
                 ]
                 result = await (await candidates_collection.aggregate(pipeline)).to_list(None)
-                for i, bucket in enumerate(result):
-                    distribution.append({
-                        "range": ranges[i] if i < len(ranges) else "other",
-                        "count": bucket.get("count", 0),
-                        "percentage": 0,
-                    })
-                total = sum(d["count"] for d in distribution)
-
-            for d in distribution:
-                if total > 0:
-                    d["percentage"] = round((d["count"] / total) * 100, 2)
-
+                # $bucket omits empty buckets, so map by lower bound, not position.
+                by_bound = dict(zip([0, 50, 60, 70, 80, 90], SCORE_RANGES))
+                counts = {}
+                for bucket in result:
+                    label = by_bound.get(bucket.get("_id"))
+                    if label:
+                        counts[label] = bucket.get("count", 0)
+
+            distribution = [row for row in distribution_rows(counts) if row["count"]]
+            total = sum(d["count"] for d in distribution)
             return {"total": total, "distribution": distribution}
         except Exception as e:
-            logger.error(f"Error fetching score distribution: {str(e)}")
+            logger.exception("Error fetching score distribution: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     return router
@@ -2,20 +2,19 @@
 # Export candidates (CSV / Excel)
 # ============================================================================
 
-import io
 import logging
+import os
 import tempfile
 from datetime import datetime
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Form, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException
 from fastapi.responses import FileResponse, StreamingResponse
 from typing import Annotated
 
-from backend.api.routes.common import fetch_docs_by_ids
 from backend.core.dependencies import require_manager_or_admin
 from backend.models.user import UserModel
-from backend.services.hr.data_export import DataExporter
+from backend.services.hr.data_export import EXPORT_PROJECTION, DataExporter
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +27,7 @@ def get_export_router(db: Any):
 
     @router.post("/export/candidates")
     async def export_candidates_data(
+        background_tasks: BackgroundTasks,
         job_id: Optional[str] = Form(None),
         format: str = Form("csv", pattern="^(csv|xlsx)$"),
         min_score: Optional[int] = Form(None),
@@ -35,7 +35,6 @@ def get_export_router(db: Any):
         _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
     ):
         try:
-            candidates = []
             if job_id and getattr(db, "candidate_evaluations", None):
                 score_query = {}
                 if min_score is not None:
@@ -45,26 +44,35 @@ def get_export_router(db: Any):
                 evals_query = {"job_id": job_id}
                 if score_query:
                     evals_query["score"] = score_query
-                evals_cursor = db.candidate_evaluations.find(evals_query).sort("timestamp", -1).limit(EXPORT_MAX_ROWS)
-                evals = await evals_cursor.to_list(length=EXPORT_MAX_ROWS)
-                candidates_collection = db.candidates
-                candidate_ids = [ev.get("candidate_id") for ev in evals if ev.get("candidate_id")]
-                cand_map = await fetch_docs_by_ids(candidates_collection, candidate_ids)
-                for ev in evals:
-                    cid = ev.get("candidate_id")
-                    cand = cand_map.get(str(cid)) if cid else None
-                    row = {
-                        "_id": cid,
-                        "candidate_name": (cand or {}).get("candidate_name", ""),
-                        "candidate_email": (cand or {}).get("candidate_email", ""),
-                        "summary": (cand or {}).get("summary", ""),
-                        "evaluation_score": ev.get("score"),
-                        "evaluation": ev.get("evaluation", {}),
-                        "skills_match": ev.get("skills_match", {}),
-                        "tag": ev.get("tag", ""),
-                        "timestamp": ev.get("timestamp", ""),
-                    }
-                    candidates.append(row)
+                # One round trip: join each evaluation to its candidate server-side.
+                pipeline = [
+                    {"$match": evals_query},
+                    {"$sort": {"timestamp": -1}},
+                    {"$limit": EXPORT_MAX_ROWS},
+                    {
+                        "$addFields": {
+                            "cand_oid": {
+                                "$convert": {"input": "$candidate_id", "to": "objectId", "onError": None, "onNull": None}
+                            }
+                        }
+                    },
+                    {"$lookup": {"from": "candidates", "localField": "cand_oid", "foreignField": "_id", "as": "cand"}},
+                    {"$unwind": {"path": "$cand", "preserveNullAndEmptyArrays": True}},
+                    {
+                        "$project": {
+                            "_id": "$candidate_id",
+                            "candidate_name": {"$ifNull": ["$cand.candidate_name", ""]},
+                            "candidate_email": {"$ifNull": ["$cand.candidate_email", ""]},
+                            "summary": {"$ifNull": ["$cand.summary", ""]},
+                            "evaluation_score": "$score",
+                            "evaluation": {"$ifNull": ["$evaluation", {}]},
+                            "skills_match": {"$ifNull": ["$skills_match", {}]},
+                            "tag": {"$ifNull": ["$tag", ""]},
+                            "timestamp": {"$ifNull": ["$timestamp", ""]},
+                        }
+                    },
+                ]
+                cursor = await db.candidate_evaluations.aggregate(pipeline)
             else:
                 query = {}
                 if job_id:
@@ -77,24 +85,29 @@ def get_export_router(db: Any):
                         score_query["$lte"] = max_score
                     query["evaluation_score"] = score_query
                 candidates_collection = db.candidates
-                cursor = candidates_collection.find(query).sort("timestamp", -1).limit(EXPORT_MAX_ROWS)
-                candidates = await cursor.to_list(length=EXPORT_MAX_ROWS)
+                cursor = (
+                    candidates_collection.find(query, EXPORT_PROJECTION)
+                    .sort("timestamp", -1)
+                    .limit(EXPORT_MAX_ROWS)
+                )
 
-            if not candidates:
+            # Peek one document so an empty result still gets a 404 before streaming starts.
+            first = await anext(cursor, None)
+            if first is None:
                 raise HTTPException(status_code=404, detail="No candidates found matching criteria")
 
-            for candidate in candidates:
-                if "_id" in candidate:
-                    candidate["_id"] = str(candidate["_id"])
-
             exporter = DataExporter()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+            async def _candidates():
+                yield first
+                async for doc in cursor:
+                    yield doc
+
             if format == "csv":
                 filename = f"candidates_export_{timestamp}.csv"
-                csv_data = exporter.export_to_csv(candidates, output_path=None)
                 return StreamingResponse(
-                    io.StringIO(csv_data),
+                    exporter.stream_csv(_candidates()),
                     media_type="text/csv",
                     headers={"Content-Disposition": f"attachment; filename={filename}"},
                 )
@@ -102,7 +115,14 @@ def get_export_router(db: Any):
                 filename = f"candidates_export_{timestamp}.xlsx"
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
                     tmp_path = tmp.name
-                exporter.export_to_excel(candidates, tmp_path)
+                try:
+                    await exporter.stream_excel(_candidates(), tmp_path)
+                except BaseException:
+                    # No response will be sent, so the background task below would never run.
+                    os.unlink(tmp_path)
+                    raise
+                # Delete the workbook once the response has been sent.
+                background_tasks.add_task(os.unlink, tmp_path)
                 return FileResponse(
                     tmp_path,
                     media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
@@ -111,7 +131,7 @@ def get_export_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error exporting candidates: {str(e)}")
+            logger.exception("Error exporting candidates: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     return router
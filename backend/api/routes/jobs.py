@@ -2,6 +2,7 @@
 # Jobs API routes (CRUD, evaluate-all)
 # ============================================================================
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Optional
@@ -10,9 +11,10 @@ from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Annotated
 
-from backend.api.routes.common import json_safe, normalize_job_doc, CreateJobRequest, fetch_docs_by_ids
+from backend.api.routes.common import json_safe, normalize_job_doc, CreateJobRequest
 from backend.core.dependencies import get_current_active_user, require_manager_or_admin
 from backend.models.user import UserModel
+from backend.utils.object_ids import is_object_id
 from backend.utils.ulid_helper import generate_ulid
 
 logger = logging.getLogger(__name__)
@@ -32,13 +34,21 @@ def get_jobs_router(db: Any):
             if active_only:
                 query["active"] = True
             jobs_collection = db.hr_job_posts
-            total = await jobs_collection.count_documents(query)
-            cursor = jobs_collection.find(query).sort("createdAt", -1).limit(limit)
-            jobs = await cursor.to_list(length=limit)
-            normalized = [normalize_job_doc(j) for j in jobs]
+            # job_skills is the evaluator's cached extraction; the listing never shows it.
+            cursor = jobs_collection.find(query, {"job_skills": 0}).sort("createdAt", -1).limit(limit)
+
+            async def _normalized_page() -> list:
+                # Normalize as documents arrive; the raw page is never held as a list.
+                return [normalize_job_doc(j, copy=False) async for j in cursor]
+
+            # Count and page are independent; run both round trips concurrently.
+            total, normalized = await asyncio.gather(
+                jobs_collection.count_documents(query),
+                _normalized_page(),
+            )
             return {"total": total, "limit": limit, "jobs": normalized}
         except Exception as e:
-            logger.error(f"Error fetching jobs: {str(e)}")
+            logger.exception("Error fetching jobs: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.get("/jobs/{job_id}")
@@ -50,7 +60,7 @@ def get_jobs_router(db: Any):
             if not job_id:
                 raise HTTPException(status_code=400, detail="Job id required")
             jobs_collection = db.hr_job_posts
-            if ObjectId.is_valid(job_id):
+            if is_object_id(job_id):
                 query = {"_id": ObjectId(job_id)}
             else:
                 query = {"ulid": job_id}
@@ -72,7 +82,7 @@ def get_jobs_router(db: Any):
     ):
         """Return candidates ranked by evaluation score for this job (from job evaluation workflow)."""
         try:
-            if not ObjectId.is_valid(job_id):
+            if not is_object_id(job_id):
                 raise HTTPException(status_code=400, detail="Invalid job id")
             jobs_collection = db.hr_job_posts
             job_doc = await jobs_collection.find_one({"_id": ObjectId(job_id)})
@@ -80,7 +90,6 @@ def get_jobs_router(db: Any):
                 raise HTTPException(status_code=404, detail="Job not found")
 
             evaluations_collection = getattr(db, "candidate_evaluations", None)
-            candidates_collection = db.candidates
 
             if refresh:
                 from backend.services.hr.automation import evaluate_job_against_all_candidates
@@ -88,49 +97,59 @@ def get_jobs_router(db: Any):
                 if not result.get("success"):
                     raise HTTPException(status_code=400, detail=result.get("error", "Evaluation failed"))
 
-            rankings = []
+            items = []
             if evaluations_collection is not None:
-                ev_cursor = evaluations_collection.find({"job_id": job_id}).sort("score", -1)
-                ev_docs = await ev_cursor.to_list(length=200)
-                for ev in ev_docs:
-                    rankings.append({
-                        "candidate_id": ev.get("candidate_id"),
+                # One round trip: rank evaluations and join each to its candidate server-side.
+                pipeline = [
+                    {"$match": {"job_id": job_id}},
+                    {"$sort": {"score": -1}},
+                    {"$limit": 200},
+                    {
+                        "$addFields": {
+                            "cand_oid": {
+                                "$convert": {"input": "$candidate_id", "to": "objectId", "onError": None, "onNull": None}
+                            }
+                        }
+                    },
+                    {
+                        "$lookup": {
+                            "from": "candidates",
+                            "localField": "cand_oid",
+                            "foreignField": "_id",
+                            "as": "cand",
+                            "pipeline": [{"$project": {"candidate_name": 1, "candidate_email": 1, "summary": 1}}],
+                        }
+                    },
+                    {"$unwind": {"path": "$cand", "preserveNullAndEmptyArrays": True}},
+                    {"$project": {"candidate_id": 1, "score": 1, "evaluation": 1, "tag": 1, "cand": 1}},
+                ]
+                ev_cursor = await evaluations_collection.aggregate(pipeline)
+                rank = 0
+                async for ev in ev_cursor:
+                    rank += 1
+                    cid = ev.get("candidate_id")
+                    cand = ev.get("cand")
+                    evaluation = ev.get("evaluation") or {}
+                    items.append({
+                        "rank": rank,
+                        "candidate": {
+                            "_id": str(cand["_id"]),
+                            "candidate_name": cand.get("candidate_name", ""),
+                            "candidate_email": cand.get("candidate_email", ""),
+                            "summary": cand.get("summary", ""),
+                        } if cand else {"_id": cid, "candidate_name": "Unknown", "candidate_email": "", "summary": ""},
                         "score": ev.get("score"),
-                        "evaluation": ev.get("evaluation", {}),
-                        "tag": ev.get("tag", ""),
+                        "reasoning": evaluation.get("reasoning"),
+                        "strengths": evaluation.get("strengths", []),
+                        "gaps": evaluation.get("gaps", []),
+                        "decision": evaluation.get("decision"),
+                        "tag": ev.get("tag"),
                     })
-
-            candidate_ids = [r.get("candidate_id") for r in rankings if r.get("candidate_id")]
-            candidate_map = {}
-            if candidate_ids:
-                raw_map = await fetch_docs_by_ids(candidates_collection, candidate_ids)
-                for cid, cand in raw_map.items():
-                    candidate_map[cid] = {
-                        "_id": str(cand.get("_id", cid)),
-                        "candidate_name": cand.get("candidate_name", ""),
-                        "candidate_email": cand.get("candidate_email", ""),
-                        "summary": cand.get("summary", ""),
-                    }
-            items = []
-            for rank, r in enumerate(rankings, start=1):
-                cid = r.get("candidate_id")
-                cand = candidate_map.get(cid) if cid else None
-                evaluation = r.get("evaluation") or {}
-                items.append({
-                    "rank": rank,
-                    "candidate": cand or {"_id": cid, "candidate_name": "Unknown", "candidate_email": "", "summary": ""},
-                    "score": r.get("score"),
-                    "reasoning": evaluation.get("reasoning"),
-                    "strengths": evaluation.get("strengths", []),
-                    "gaps": evaluation.get("gaps", []),
-                    "decision": evaluation.get("decision"),
-                    "tag": r.get("tag"),
-                })
             return {"total": len(items), "rankings": items}
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error fetching job candidate recommendations: {str(e)}")
+            logger.exception("Error fetching job candidate recommendations: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.post("/jobs/{job_id}/evaluate-all")
@@ -139,7 +158,7 @@ def get_jobs_router(db: Any):
         _: Annotated[UserModel, Depends(require_manager_or_admin)] = None,
     ):
         try:
-            if not ObjectId.is_valid(job_id):
+            if not is_object_id(job_id):
                 raise HTTPException(status_code=400, detail="Invalid job id")
             from backend.services.hr.automation import evaluate_job_against_all_candidates
             result = await evaluate_job_against_all_candidates(job_id, db, write_evaluations=True)
@@ -154,7 +173,7 @@ def get_jobs_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error evaluating job against all candidates: {str(e)}")
+            logger.exception("Error evaluating job against all candidates: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.post("/jobs")
@@ -3,23 +3,70 @@
 # ============================================================================
 
 import asyncio
+import base64
+import json
 import logging
 from datetime import timedelta
-from typing import Any
+from typing import Any, Iterator, Optional, Tuple
 
 from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from typing import Annotated
 
 from backend.api.routes.common import json_safe, normalize_job_doc, fetch_docs_by_ids
 from backend.core.dependencies import get_current_active_user
 from backend.models.user import UserModel
+from backend.services.storage import get_storage
+from backend.utils.object_ids import is_object_id
 
 logger = logging.getLogger(__name__)
 
-# Exclude from list/detail response (internal or job-specific)
-MY_RESUMES_EXCLUDE = ("cv_link", "cv_object_name", "local_cv_path", "user_id", "user_email", "evaluation_score", "evaluation")
+# Exclude from list/detail response (internal or job-specific; owner_key is left on
+# documents written by an earlier version)
+MY_RESUMES_EXCLUDE = ("cv_link", "cv_object_name", "local_cv_path", "user_id", "user_email", "owner_key", "evaluation_score", "evaluation")
+
+
+def _encode_cursor(timestamp: Any, oid: ObjectId) -> str:
+    """Opaque next-page token for list_my_resumes: the last row's (timestamp, _id)."""
+    raw = json.dumps([timestamp, str(oid)], default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(token: str) -> Tuple[Any, ObjectId]:
+    try:
+        timestamp, oid = json.loads(base64.urlsafe_b64decode(token.encode()))
+        return timestamp, ObjectId(oid)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _keyset_after(position: Tuple[Any, ObjectId]) -> dict:
+    """Filter for rows after ``position`` in (timestamp desc, _id desc) order.
+
+    Missing/null timestamps sort after every string in descending order, so
+    they follow once the timestamped rows run out.
+    """
+    timestamp, oid = position
+    if timestamp is None:
+        return {"timestamp": None, "_id": {"$lt": oid}}
+    return {
+        "$or": [
+            {"timestamp": {"$lt": timestamp}},
+            {"timestamp": timestamp, "_id": {"$lt": oid}},
+            {"timestamp": None},
+        ]
+    }
+
+
+def _open_cv_stream(object_name: str) -> Tuple[Optional[int], Iterator[bytes]]:
+    # get_storage() is cached; its first call also connects to MinIO, so it
+    # runs here on the worker thread rather than on the event loop.
+    return get_storage().download_file_stream(object_name)
+
+
+def _cv_download_url(object_name: str) -> str:
+    return get_storage().get_file_url(object_name, timedelta(hours=1))
 
 
 def get_my_resumes_router(db: Any):
@@ -33,7 +80,7 @@ def get_my_resumes_router(db: Any):
         resume_id: str,
         current_user: Annotated[UserModel, Depends(get_current_active_user)] = None,
     ):
-        if not ObjectId.is_valid(resume_id):
+        if not is_object_id(resume_id):
             raise HTTPException(status_code=400, detail="Invalid resume id")
         candidates_collection = db.candidates
         doc = await candidates_collection.find_one({"_id": ObjectId(resume_id)})
@@ -49,21 +96,16 @@ def get_my_resumes_router(db: Any):
         if not object_name:
             raise HTTPException(status_code=404, detail="CV file not stored for this resume. CVs are stored in MinIO.")
 
-        from backend.services.storage import get_storage
-        storage = get_storage()
-        # MinIO download is synchronous; offload to a thread.
-        file_bytes = await asyncio.to_thread(storage.download_file, object_name)
+        # Opening the MinIO object is blocking; offload it. The chunk iterator
+        # is synchronous, so StreamingResponse drains it in its threadpool.
+        size, chunks = await asyncio.to_thread(_open_cv_stream, object_name)
         filename = object_name.split("/")[-1] if "/" in object_name else "resume.pdf"
         if not filename.lower().endswith(".pdf"):
             filename = "resume.pdf"
-        return Response(
-            content=file_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(len(file_bytes)),
-            },
-        )
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+        if size is not None:
+            headers["Content-Length"] = str(size)
+        return StreamingResponse(chunks, media_type="application/pdf", headers=headers)
 
     @router.get("/my-resumes/{resume_id}/job-recommendations")
     async def get_my_resume_job_recommendations(
@@ -72,7 +114,7 @@ def get_my_resumes_router(db: Any):
         refresh: bool = Query(False, description="Run job evaluation workflow for all jobs and then return rankings"),
     ):
         try:
-            if not ObjectId.is_valid(resume_id):
+            if not is_object_id(resume_id):
                 raise HTTPException(status_code=400, detail="Invalid resume id")
             candidates_collection = db.candidates
             doc = await candidates_collection.find_one({"_id": ObjectId(resume_id)})
@@ -123,7 +165,7 @@ def get_my_resumes_router(db: Any):
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error fetching job recommendations: {str(e)}")
+            logger.exception("Error fetching job recommendations: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.get("/my-resumes/{resume_id}")
@@ -131,10 +173,13 @@ def get_my_resumes_router(db: Any):
         resume_id: str,
         current_user: Annotated[UserModel, Depends(get_current_active_user)] = None,
     ):
-        if not ObjectId.is_valid(resume_id):
+        if not is_object_id(resume_id):
             raise HTTPException(status_code=400, detail="Invalid resume id")
         candidates_collection = db.candidates
-        doc = await candidates_collection.find_one({"_id": ObjectId(resume_id)})
+        doc = await candidates_collection.find_one(
+            {"_id": ObjectId(resume_id)},
+            {k: 0 for k in ("local_cv_path", "user_email", "owner_key", "evaluation_score", "evaluation")},
+        )
         if not doc:
             raise HTTPException(status_code=404, detail="Resume not found")
         doc_user_id = doc.get("user_id")
@@ -147,16 +192,13 @@ def get_my_resumes_router(db: Any):
         object_name = doc.get("cv_object_name")
         if object_name:
             try:
-                from backend.services.storage import get_storage
-                storage = get_storage()
                 # Presigned URL generation calls MinIO synchronously; offload it.
-                download_url = await asyncio.to_thread(
-                    storage.get_file_url, object_name, timedelta(hours=1)
-                )
+                download_url = await asyncio.to_thread(_cv_download_url, object_name)
             except Exception as e:
-                logger.warning(f"Could not generate CV download URL: {e}")
+                logger.warning("Could not generate CV download URL: %s", e)
         doc["download_url"] = download_url
-        for k in ("cv_object_name", "local_cv_path", "user_id", "user_email", "evaluation_score", "evaluation"):
+        # Needed above for the ownership check and download URL; not part of the response.
+        for k in ("cv_object_name", "user_id"):
             doc.pop(k, None)
         return json_safe(doc)
 
@@ -164,28 +206,47 @@ def get_my_resumes_router(db: Any):
     async def list_my_resumes(
         current_user: Annotated[UserModel, Depends(get_current_active_user)] = None,
         limit: int = Query(50, ge=1, le=100),
-        skip: int = Query(0, ge=0),
+        after: Optional[str] = Query(None, description="next_cursor from the previous page"),
     ):
         try:
             candidates_collection = db.candidates
-            query = {
+            # Owned by user_id, or by candidate_email for documents without one
+            # (user_id: None matches both a missing and a null field).
+            owner_query = {
                 "$or": [
                     {"user_id": str(current_user.id)},
-                    {"user_id": {"$exists": False}, "candidate_email": current_user.email},
                     {"user_id": None, "candidate_email": current_user.email},
                 ]
             }
-            cursor = candidates_collection.find(query).sort("timestamp", -1).skip(skip).limit(limit)
-            raw_items = await cursor.to_list(length=limit)
-            total = await candidates_collection.count_documents(query)
-
-            items = []
-            for doc in raw_items:
-                out = {k: v for k, v in doc.items() if k not in MY_RESUMES_EXCLUDE}
-                items.append(json_safe(out))
-            return {"total": total, "limit": limit, "skip": skip, "resumes": items}
+            query = owner_query
+            if after:
+                query = {"$and": [owner_query, _keyset_after(_decode_cursor(after))]}
+            # Keyset pagination on (timestamp, _id): cost stays O(limit) however
+            # deep the client pages, unlike skip(). One extra row tells us if
+            # there is a next page.
+            cursor = (
+                candidates_collection.find(query, {k: 0 for k in MY_RESUMES_EXCLUDE})
+                .sort([("timestamp", -1), ("_id", -1)])
+                .limit(limit + 1)
+            )
+            # Page and count are independent; run both round trips concurrently.
+            raw_items, total = await asyncio.gather(
+                cursor.to_list(length=limit + 1),
+                candidates_collection.count_documents(owner_query),
+            )
+
+            next_cursor = None
+            if len(raw_items) > limit:
+                raw_items = raw_items[:limit]
+                last = raw_items[-1]
+                next_cursor = _encode_cursor(last.get("timestamp"), last["_id"])
+
+            items = [json_safe(doc) for doc in raw_items]
+            return {"total": total, "limit": limit, "next_cursor": next_cursor, "resumes": items}
+        except HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Error listing my resumes: {str(e)}")
+            logger.exception("Error listing my resumes: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     return router
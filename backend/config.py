@@ -3,6 +3,7 @@ Configuration Management with Multi-LLM Support
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Optional
@@ -11,6 +12,24 @@ from typing import Optional
 load_dotenv()
 
 
+# Provider -> Config attribute holding its API key / model name. LLM_PROVIDER
+# is lower-cased when read, so lookups need no normalization. Attribute names
+# (not values) are stored so runtime overrides of Config are still honoured.
+# Google Gemini support removed ("gemini": "GEMINI_API_KEY" / "GEMINI_MODEL").
+_PROVIDER_KEY_ATTRS = {
+    "openai": "OPENAI_API_KEY",
+    "azure": "AZURE_OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "ollama": None,  # No API key needed
+}
+_PROVIDER_MODEL_ATTRS = {
+    "openai": "OPENAI_MODEL",
+    "azure": "AZURE_OPENAI_MODEL",
+    "anthropic": "ANTHROPIC_MODEL",
+    "ollama": "OLLAMA_MODEL",
+}
+
+
 class Config:
     """Application configuration with multi-LLM provider support"""
 
@@ -80,10 +99,23 @@ class Config:
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "hr_pass")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "hr_users")
 
+    # Connection pool per worker: steady-state connections plus burst headroom
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+    # Seconds to wait for a free pooled connection before failing the request
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+    # Recycle connections older than this (seconds) to dodge server/proxy idle cutoffs
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+    # Seconds allowed to establish a new PostgreSQL connection
+    DB_CONNECT_TIMEOUT: int = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
+
     @property
     def DATABASE_URL(self) -> str:
-        """Generate SQLAlchemy database URL"""
-        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+        """Generate SQLAlchemy database URL (async asyncpg driver)"""
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
 
 
     # ========================================================================
@@ -94,6 +126,14 @@ class Config:
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440"))  # 24 hours
 
+    # Seconds an authenticated user row is cached per worker (0 disables the cache).
+    # Invalidation only reaches the worker that made the change, so other workers can
+    # keep accepting a deleted/deactivated/re-roled user for up to this long.
+    AUTH_USER_CACHE_TTL: int = int(os.getenv("AUTH_USER_CACHE_TTL", "5"))
+
+    # Seconds a verified JWT (sha256 of the token -> subject) is cached per worker (0 disables).
+    AUTH_TOKEN_CACHE_TTL: int = int(os.getenv("AUTH_TOKEN_CACHE_TTL", "30"))
+
 
     # ========================================================================
     # FASTAPI CONFIGURATION
@@ -105,6 +145,9 @@ class Config:
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     WORKERS: int = int(os.getenv("WORKERS", "4"))
 
+    # Log output: "text" (human-readable) or "json" (one JSON object per line)
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").lower()
+
     # CORS allowed origins (comma-separated). Avoid "*" together with credentials.
     CORS_ORIGINS: str = os.getenv(
         "CORS_ORIGINS",
@@ -119,6 +162,24 @@ class Config:
         str(Path(__file__).resolve().parent.parent / "uploads"),
     )
 
+    # Seconds a job posting fetched by the batch endpoints is cached per worker (0 disables).
+    JOB_CACHE_TTL: int = int(os.getenv("JOB_CACHE_TTL", "300"))
+
+    # Seconds an LLM CV extraction is cached per worker, keyed by a hash of the CV text (0 disables).
+    CV_EXTRACTION_CACHE_TTL: int = int(os.getenv("CV_EXTRACTION_CACHE_TTL", "604800"))
+
+    # PDFs with at least this many pages have their text extracted across a
+    # process pool of PDF_PARALLEL_WORKERS processes, started with the app
+    # (0 pages or fewer than 2 workers disables it).
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "20"))
+    PDF_PARALLEL_WORKERS: int = int(os.getenv("PDF_PARALLEL_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+    # OCR PDFs without a text layer (scans) when pdf2image and pytesseract are installed.
+    PDF_OCR_FALLBACK: bool = os.getenv("PDF_OCR_FALLBACK", "true").lower() == "true"
+
+    # Largest CV accepted by the single-upload endpoint, in megabytes.
+    MAX_CV_UPLOAD_MB: int = int(os.getenv("MAX_CV_UPLOAD_MB", "20"))
+
     @classmethod
     def get_cors_origins(cls) -> list:
         """Parse CORS_ORIGINS into a list of origins (drops blanks)."""
@@ -134,23 +195,10 @@ class Config:
         Get API key for current LLM provider
 
         Returns:
-            API key string or None
+            API key string or None (e.g. ollama needs no key)
         """
-        provider = cls.LLM_PROVIDER.lower()
-
-        if provider == "openai":
-            return cls.OPENAI_API_KEY
-        elif provider == "azure":
-            return cls.AZURE_OPENAI_API_KEY
-        elif provider == "anthropic":
-            return cls.ANTHROPIC_API_KEY
-        # Google Gemini support removed
-        # elif provider == "gemini":
-        #     return cls.GEMINI_API_KEY
-        elif provider in ["ollama"]:
-            return None  # No API key needed
-        else:
-            return None
+        attr = _PROVIDER_KEY_ATTRS.get(cls.LLM_PROVIDER)
+        return getattr(cls, attr) if attr else None
 
     @classmethod
     def get_llm_model(cls) -> str:
@@ -160,21 +208,8 @@ class Config:
         Returns:
             Model name string
         """
-        provider = cls.LLM_PROVIDER.lower()
-
-        if provider == "openai":
-            return cls.OPENAI_MODEL
-        elif provider == "azure":
-            return cls.AZURE_OPENAI_MODEL
-        elif provider == "anthropic":
-            return cls.ANTHROPIC_MODEL
-        # Google Gemini support removed
-        # elif provider == "gemini":
-        #     return cls.GEMINI_MODEL
-        elif provider == "ollama":
-            return cls.OLLAMA_MODEL
-        else:
-            return ""
+        attr = _PROVIDER_MODEL_ATTRS.get(cls.LLM_PROVIDER)
+        return getattr(cls, attr) if attr else ""
 
     @classmethod
     def validate(cls) -> bool:
@@ -217,6 +252,12 @@ class Config:
         }
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Config:
+    """Shared Config instance (settings are read from the environment once, at import)."""
+    return Config()
+
+
 # Validate configuration on import (with warning instead of error)
 try:
     Config.validate()
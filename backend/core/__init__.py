@@ -12,6 +12,7 @@ from backend.core.dependencies import (
     require_admin,
     require_manager_or_admin,
     require_any_role,
+    invalidate_cached_user,
 )
 
 __all__ = [
@@ -31,4 +32,5 @@ __all__ = [
     "require_admin",
     "require_manager_or_admin",
     "require_any_role",
+    "invalidate_cached_user",
 ]
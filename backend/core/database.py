@@ -4,45 +4,72 @@
 
 """
 PostgreSQL database connection for user authentication and management
+
+Uses SQLAlchemy's asyncio extension (asyncpg driver) so auth routes run on the
+event loop instead of FastAPI's threadpool.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from backend.config import Config
+import asyncio
+from typing import AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from backend.config import get_settings
 
-config = Config()
+config = get_settings()
 
-engine = create_engine(
+engine = create_async_engine(
     config.DATABASE_URL,
     pool_pre_ping=True,
-    echo=config.DEBUG,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_timeout=config.DB_POOL_TIMEOUT,
+    pool_recycle=config.DB_POOL_RECYCLE,
+    # asyncpg names its connect timeout "timeout"
+    connect_args={"timeout": config.DB_CONNECT_TIMEOUT},
+    # SQL tracing is controlled by the "sqlalchemy.engine" logger level (see main.py).
+    echo=False,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 Base = declarative_base()
 
 
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     """Dependency to get database session."""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+async def init_db():
     """Initialize database tables."""
     from backend.models.user import UserModel  # noqa: F401
 
     try:
-        Base.metadata.create_all(bind=engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
     except Exception as e:
         if "already exists" not in str(e):
             raise
 
 
-def drop_all_tables():
+async def warm_pool(size: int = config.DB_POOL_SIZE) -> None:
+    """Open ``size`` pooled connections up front so early requests skip the handshake."""
+
+    async def _checkout():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_checkout() for _ in range(size)))
+
+
+async def drop_all_tables():
     """Drop all database tables (USE WITH CAUTION!)."""
-    Base.metadata.drop_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
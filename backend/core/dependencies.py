@@ -2,17 +2,84 @@
 # AUTHENTICATION AND AUTHORIZATION DEPENDENCIES
 # ============================================================================
 
-import asyncio
+import hashlib
+import logging
+import time
 from typing import Optional, List
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.core.database import get_db
+from backend.config import Config
+from backend.core.database import SessionLocal
 from backend.models.user import UserModel
 from backend.schemas.auth import UserRole, TokenData
 from backend.services.security import decode_access_token, validate_token_payload
 from backend.crud.user import get_user_by_email
+from backend.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# email -> detached UserModel (or _NO_USER); saves a users lookup on every authenticated request.
+_user_cache = TTLCache(ttl=Config.AUTH_USER_CACHE_TTL, maxsize=4096)
+# sha256(token) -> (subject, exp) for tokens whose signature verified; saves re-verifying
+# it. Holds no user state: the user itself is always resolved through _user_cache,
+# which invalidate_cached_user clears.
+_token_cache = TTLCache(ttl=Config.AUTH_TOKEN_CACHE_TTL, maxsize=10000)
+
+# Cached "no such user" result, so tokens for deleted accounts don't re-query.
+_NO_USER = object()
+
+# HS* verification is a single HMAC (microseconds), cheaper than a thread hop;
+# RSA/ECDSA verification is slow enough to stall the event loop, so offload it.
+_OFFLOAD_JWT_DECODE = not Config.ALGORITHM.upper().startswith("HS")
+
+
+async def _token_subject(token: str) -> Optional[str]:
+    """Return the verified ``sub`` of an access token, or None if it is invalid/expired.
+
+    Verified tokens are cached by hash; a cached subject is only returned while
+    the token's own ``exp`` is still in the future. Invalid tokens are not
+    cached, so junk tokens cannot evict valid entries.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    if Config.AUTH_TOKEN_CACHE_TTL > 0:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            subject, exp = cached
+            if exp > time.time():
+                return subject
+            _token_cache.pop(key)
+
+    if _OFFLOAD_JWT_DECODE:
+        payload = await run_in_threadpool(decode_access_token, token)
+    else:
+        payload = decode_access_token(token)
+    if payload is None or not validate_token_payload(payload):
+        return None
+    subject = payload.get("sub") or None
+    exp = payload.get("exp")
+
+    if subject and Config.AUTH_TOKEN_CACHE_TTL > 0 and isinstance(exp, (int, float)) and exp > time.time():
+        _token_cache.set(key, (subject, exp))
+    return subject
+
+
+async def _load_user_detached(db: AsyncSession, email: str) -> Optional[UserModel]:
+    """Load a user and detach it from the request session so it can be cached."""
+    user = await get_user_by_email(db, email)
+    if user is not None:
+        db.expunge(user)
+    return user
+
+
+def invalidate_cached_user(email: Optional[str] = None, user_id: Optional[str] = None) -> None:
+    """Drop a user from the auth cache after it was updated or deleted."""
+    if email:
+        _user_cache.pop(email)
+    if user_id:
+        _user_cache.discard_where(lambda u: u is not _NO_USER and str(u.id) == str(user_id))
 
 
 oauth2_scheme = OAuth2PasswordBearer(
@@ -21,39 +88,49 @@ oauth2_scheme = OAuth2PasswordBearer(
 )
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> UserModel:
-    """Dependency to get current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+async def _resolve_user(
+    token: Optional[str] = Depends(oauth2_scheme)
+) -> Optional[UserModel]:
+    """Return the user a bearer token belongs to, or None for any auth failure.
 
+    Shared by get_current_user and get_optional_user, so FastAPI's per-request
+    dependency cache resolves the token once even when both are used.
+    """
     if not token:
-        raise credentials_exception
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
-    if not validate_token_payload(payload):
-        raise credentials_exception
-
-    email = payload.get("sub")
+        return None
+    email = await _token_subject(token)
     if not email:
-        raise credentials_exception
+        return None
+
+    user = _user_cache.get(email) if Config.AUTH_USER_CACHE_TTL > 0 else None
+    if user is _NO_USER:
+        return None
+    if user is not None:
+        return user
 
     try:
-        # SQLAlchemy session is synchronous; run off the event loop.
-        user = await asyncio.to_thread(get_user_by_email, db, email)
+        # Short-lived session: the connection goes back to the pool right after
+        # the lookup instead of being held for the rest of the request.
+        async with SessionLocal() as db:
+            user = await _load_user_detached(db, email)
     except Exception as e:
-        import logging
-        logging.getLogger(__name__).exception("get_user_by_email failed: %s", e)
-        raise credentials_exception
-    if user is None:
-        raise credentials_exception
+        logger.exception("get_user_by_email failed: %s", e)
+        return None
+    if Config.AUTH_USER_CACHE_TTL > 0:
+        _user_cache.set(email, user if user is not None else _NO_USER)
+    return user
+
 
+async def get_current_user(
+    user: Optional[UserModel] = Depends(_resolve_user)
+) -> UserModel:
+    """Dependency to get current authenticated user from JWT token."""
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
@@ -82,22 +159,32 @@ async def get_current_superuser(
 
 
 class RoleChecker:
-    """Dependency class for role-based access control."""
+    """Dependency class for role-based access control.
+
+    Checkers with the same allowed roles compare equal, so FastAPI's
+    per-request dependency cache resolves them once.
+    """
 
     def __init__(self, allowed_roles: List[UserRole]):
         self.allowed_roles = allowed_roles
+        self._allowed = frozenset(r.value if hasattr(r, "value") else r for r in allowed_roles)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RoleChecker) and self._allowed == other._allowed
 
-    def __call__(
+    def __hash__(self) -> int:
+        return hash(self._allowed)
+
+    async def __call__(
         self,
         current_user: UserModel = Depends(get_current_active_user)
     ) -> UserModel:
         role = getattr(current_user, "role", None)
         role_value = role.value if hasattr(role, "value") else role
-        allowed_values = {r.value if hasattr(r, "value") else r for r in self.allowed_roles}
-        if role_value not in allowed_values:
+        if role_value not in self._allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required role: one of {list(allowed_values)}"
+                detail=f"Access denied. Required role: one of {sorted(self._allowed)}"
             )
         return current_user
 
@@ -110,13 +197,7 @@ require_any_role = RoleChecker([UserRole.JOB_SEEKER, UserRole.HR_MANAGER, UserRo
 
 
 async def get_optional_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    user: Optional[UserModel] = Depends(_resolve_user)
 ) -> Optional[UserModel]:
     """Optional authentication - doesn't raise error if no token."""
-    if not token:
-        return None
-    try:
-        return await get_current_user(token, db)
-    except HTTPException:
-        return None
+    return user
@@ -4,17 +4,70 @@
 
 import logging
 import os
+from bson import ObjectId
+from bson.codec_options import TypeDecoder, TypeRegistry
 from pymongo import ASCENDING, DESCENDING, AsyncMongoClient
 
 logger = logging.getLogger(__name__)
 
 MONGODB_URL = os.environ.get("MONGODB_URL", "mongodb://localhost:27017")
-client = AsyncMongoClient(MONGODB_URL)
+# Connection pool bounds per worker; min keeps warm sockets for the first requests.
+MONGODB_MAX_POOL_SIZE = int(os.environ.get("MONGODB_MAX_POOL_SIZE", "100"))
+MONGODB_MIN_POOL_SIZE = int(os.environ.get("MONGODB_MIN_POOL_SIZE", "10"))
+# Idle pooled sockets are closed after this long (ms).
+MONGODB_MAX_IDLE_TIME_MS = int(os.environ.get("MONGODB_MAX_IDLE_TIME_MS", "60000"))
+# How long an operation waits for a reachable server before failing (ms).
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "3000"))
+# Wire compression, in preference order; empty disables it. zlib needs nothing extra;
+# zstd needs the zstandard package, which is not a declared dependency.
+MONGODB_COMPRESSORS = os.environ.get("MONGODB_COMPRESSORS", "zlib")
+
+client = AsyncMongoClient(
+    MONGODB_URL,
+    maxPoolSize=MONGODB_MAX_POOL_SIZE,
+    minPoolSize=MONGODB_MIN_POOL_SIZE,
+    maxIdleTimeMS=MONGODB_MAX_IDLE_TIME_MS,
+    serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+    **({"compressors": MONGODB_COMPRESSORS} if MONGODB_COMPRESSORS else {}),
+)
+_db = client.get_database("ai-hr-automation")
 
 
 def get_mongo_db():
-    """Return MongoDB database instance for ai-hr-automation."""
-    return client.get_database("ai-hr-automation")
+    """Return the shared MongoDB database handle for ai-hr-automation."""
+    return _db
+
+
+async def connect_mongo() -> None:
+    """Open the client's connection pool so the first request doesn't pay for it."""
+    await client.admin.command("ping")
+
+
+async def close_mongo() -> None:
+    """Close the client and its pooled connections."""
+    await client.close()
+
+
+class _ObjectIdAsStr(TypeDecoder):
+    """Decode BSON ObjectIds straight to their hex string."""
+
+    bson_type = ObjectId
+
+    def transform_bson(self, value):
+        return str(value)
+
+
+def get_str_id_collection(db, name: str):
+    """Return ``db[name]`` with ObjectIds decoded as ``str``.
+
+    For read paths whose documents go straight into API responses: ids come
+    out of the BSON decoder already JSON-safe, with no per-document fix-up
+    loop in Python. Queries may still pass ObjectId values as usual.
+    """
+    codec_options = db.codec_options.with_options(
+        type_registry=TypeRegistry([_ObjectIdAsStr()])
+    )
+    return db.get_collection(name, codec_options=codec_options)
 
 
 async def ensure_indexes(db) -> None:
@@ -24,16 +77,34 @@ async def ensure_indexes(db) -> None:
     common lookups (by user, email, batch, job, score) avoid collection scans.
     """
     specs = [
-        (db.candidates, [("user_id", ASCENDING)], {}),
-        (db.candidates, [("candidate_email", ASCENDING)], {}),
+        # my-resumes lists by owner (user_id, or candidate_email for documents without
+        # one), newest first: one index per $or branch, each in the keyset sort order so
+        # the branches merge without an in-memory sort. They also serve plain
+        # user_id / candidate_email lookups.
+        (db.candidates, [("user_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)], {}),
+        (db.candidates, [("candidate_email", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)], {}),
         (db.candidates, [("batch_id", ASCENDING)], {}),
         (db.candidates, [("file_hash", ASCENDING)], {"unique": True, "sparse": True}),
         (db.candidates, [("source_folder", ASCENDING)], {}),
         (db.candidates, [("timestamp", DESCENDING)], {}),
+        (db.candidates, [("job_id", ASCENDING), ("timestamp", DESCENDING)], {}),
+        (
+            db.candidates,
+            [("job_id", ASCENDING), ("evaluation_score", DESCENDING), ("timestamp", DESCENDING)],
+            {},
+        ),
+        # No index for the "has extracted_cv_data or summary" filter used by bulk
+        # evaluation: nearly every candidate matches it, so a collection scan is
+        # the best plan, and indexing the large summary/CV fields would only add
+        # write cost. (Partial indexes can't express the $ne "" predicate either.)
+        # Also covers the per-job score distribution aggregation (score_distribution).
         (db.candidate_evaluations, [("job_id", ASCENDING), ("score", DESCENDING)], {}),
+        (db.candidate_evaluations, [("job_id", ASCENDING), ("timestamp", DESCENDING)], {}),
         (db.candidate_evaluations, [("candidate_id", ASCENDING), ("score", DESCENDING)], {}),
+        # Upsert key for save_evaluations.
         (db.candidate_evaluations, [("candidate_id", ASCENDING), ("job_id", ASCENDING)], {"unique": True}),
         (db.hr_job_posts, [("createdAt", DESCENDING)], {}),
+        (db.hr_job_posts, [("active", ASCENDING), ("createdAt", DESCENDING)], {}),
         (db.hr_job_posts, [("ulid", ASCENDING)], {}),
         (db.batch_imports, [("batch_id", ASCENDING)], {"unique": True}),
     ]
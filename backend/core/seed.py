@@ -22,7 +22,7 @@ import os
 from backend.core.database import SessionLocal
 from backend.crud.user import create_user, get_user_by_email
 from backend.schemas.auth import UserCreate, UserRole
-from backend.services.security import get_password_hash, verify_password
+from backend.services.security import get_password_hash_async, verify_password_async
 
 logger = logging.getLogger(__name__)
 
@@ -53,54 +53,52 @@ def _default_accounts() -> list[dict]:
     ]
 
 
-def seed_default_users() -> None:
+async def seed_default_users() -> None:
     """Create/repair the default demo accounts. Safe to call on every startup."""
     if os.getenv("SEED_DEFAULT_USERS", "true").lower() in ("false", "0", "no"):
         logger.info("SEED_DEFAULT_USERS disabled; skipping default account seeding")
         return
 
-    db = SessionLocal()
-    try:
-        created, repaired = 0, 0
-        for acct in _default_accounts():
-            try:
-                existing = get_user_by_email(db, acct["email"])
-                if existing is None:
-                    create_user(
-                        db,
-                        UserCreate(
-                            email=acct["email"],
-                            name=acct["name"],
-                            password=acct["password"],
-                            role=acct["role"],
-                            is_active=True,
-                            is_superuser=acct["is_superuser"],
-                        ),
-                    )
-                    created += 1
-                    logger.info(f"Seeded default account: {acct['email']} ({acct['role'].value})")
-                elif not _password_ok(acct["password"], existing.hashed_password):
-                    # Stale/mismatched/invalid hash (e.g. from SQL init) -> reset so documented creds work
-                    existing.hashed_password = get_password_hash(acct["password"])
-                    db.commit()
-                    repaired += 1
-                    logger.warning(f"Reset password for default account: {acct['email']}")
-            except Exception as acct_err:
-                db.rollback()
-                logger.warning(f"Failed to seed default account {acct['email']}: {acct_err}")
-        if created or repaired:
-            logger.info(f"Default account seeding done (created={created}, repaired={repaired})")
-        else:
-            logger.info("Default accounts already present and valid")
-    except Exception as e:
-        logger.warning(f"Default account seeding skipped/failed: {e}")
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        try:
+            created, repaired = 0, 0
+            for acct in _default_accounts():
+                try:
+                    existing = await get_user_by_email(db, acct["email"])
+                    if existing is None:
+                        await create_user(
+                            db,
+                            UserCreate(
+                                email=acct["email"],
+                                name=acct["name"],
+                                password=acct["password"],
+                                role=acct["role"],
+                                is_active=True,
+                                is_superuser=acct["is_superuser"],
+                            ),
+                        )
+                        created += 1
+                        logger.info("Seeded default account: %s (%s)", acct['email'], acct['role'].value)
+                    elif not await _password_ok(acct["password"], existing.hashed_password):
+                        # Stale/mismatched/invalid hash (e.g. from SQL init) -> reset so documented creds work
+                        existing.hashed_password = await get_password_hash_async(acct["password"])
+                        await db.commit()
+                        repaired += 1
+                        logger.warning("Reset password for default account: %s", acct['email'])
+                except Exception as acct_err:
+                    await db.rollback()
+                    logger.warning("Failed to seed default account %s: %s", acct['email'], acct_err)
+            if created or repaired:
+                logger.info("Default account seeding done (created=%s, repaired=%s)", created, repaired)
+            else:
+                logger.info("Default accounts already present and valid")
+        except Exception as e:
+            logger.warning("Default account seeding skipped/failed: %s", e)
 
 
-def _password_ok(password: str, hashed: str) -> bool:
-    """verify_password, treating a malformed/unknown hash as a non-match rather than raising."""
+async def _password_ok(password: str, hashed: str) -> bool:
+    """verify_password_async, treating a malformed/unknown hash as a non-match rather than raising."""
     try:
-        return verify_password(password, hashed)
+        return await verify_password_async(password, hashed)
     except Exception:
         return False
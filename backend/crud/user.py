@@ -4,17 +4,25 @@
 
 """
 CRUD operations for User model
+
+Read queries attach ``raiseload("*")``: any relationship added to UserModel
+later must be eager-loaded explicitly, otherwise accessing it raises
+InvalidRequestError instead of silently issuing one SELECT per row.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+import logging
+from typing import Optional, List, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select, func
+from sqlalchemy.orm import raiseload
 from backend.models.user import UserModel
 from backend.schemas.auth import UserCreate, UserUpdate
-from backend.services.security import get_password_hash, verify_password
+from backend.services.security import get_password_hash_async, verify_password_async
+
+logger = logging.getLogger(__name__)
 
 
-def get_user(db: Session, user_id: str) -> Optional[UserModel]:
+async def get_user(db: AsyncSession, user_id: str) -> Optional[UserModel]:
     """
     Get user by ID
 
@@ -25,10 +33,13 @@ def get_user(db: Session, user_id: str) -> Optional[UserModel]:
     Returns:
         User model if found, None otherwise
     """
-    return db.query(UserModel).filter(UserModel.id == user_id).first()
+    result = await db.execute(
+        select(UserModel).options(raiseload("*")).where(UserModel.id == user_id)
+    )
+    return result.scalar_one_or_none()
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[UserModel]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[UserModel]:
     """
     Get user by email
 
@@ -39,11 +50,14 @@ def get_user_by_email(db: Session, email: str) -> Optional[UserModel]:
     Returns:
         User model if found, None otherwise
     """
-    return db.query(UserModel).filter(UserModel.email == email).first()
+    result = await db.execute(
+        select(UserModel).options(raiseload("*")).where(UserModel.email == email)
+    )
+    return result.scalar_one_or_none()
 
 
-def get_users(
-    db: Session,
+async def get_users(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     role: Optional[str] = None,
@@ -61,19 +75,25 @@ def get_users(
 
     Returns:
         List of user models
+
+    Note:
+        UserModel has no relationships and the ``User`` response schema only
+        reads column attributes, so the page is loaded by this one SELECT; no
+        selectinload/joinedload options are needed for serialization.
     """
-    query = db.query(UserModel)
+    query = select(UserModel).options(raiseload("*"))
 
     # Apply filters
     if role:
-        query = query.filter(UserModel.role == role)
+        query = query.where(UserModel.role == role)
     if is_active is not None:
-        query = query.filter(UserModel.is_active == is_active)
+        query = query.where(UserModel.is_active == is_active)
 
-    return query.offset(skip).limit(limit).all()
+    result = await db.execute(query.offset(skip).limit(limit))
+    return list(result.scalars().all())
 
 
-def create_user(db: Session, user: UserCreate) -> UserModel:
+async def create_user(db: AsyncSession, user: UserCreate) -> UserModel:
     """
     Create new user
 
@@ -84,28 +104,30 @@ def create_user(db: Session, user: UserCreate) -> UserModel:
     Returns:
         Created user model
     """
-    # Hash password
-    hashed_password = get_password_hash(user.password)
-
-    # Create user model
-    db_user = UserModel(
-        email=user.email,
-        name=user.name,
-        hashed_password=hashed_password,
-        role=user.role,
-        is_active=user.is_active,
-        is_superuser=user.is_superuser
+    # Hash password (bcrypt is CPU-bound; keep it off the event loop)
+    hashed_password = await get_password_hash_async(user.password)
+
+    # Single INSERT ... RETURNING: the row comes back with its server/column
+    # defaults filled in, so no unit-of-work flush or refresh SELECT is needed.
+    result = await db.execute(
+        insert(UserModel)
+        .values(
+            email=user.email,
+            name=user.name,
+            hashed_password=hashed_password,
+            role=user.role,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser
+        )
+        .returning(UserModel)
     )
-
-    # Save to database
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db_user = result.scalar_one()
+    await db.commit()
 
     return db_user
 
 
-def update_user(db: Session, user_id: str, user_update: UserUpdate) -> Optional[UserModel]:
+async def update_user(db: AsyncSession, user_id: str, user_update: UserUpdate) -> Optional[UserModel]:
     """
     Update user
 
@@ -117,7 +139,7 @@ def update_user(db: Session, user_id: str, user_update: UserUpdate) -> Optional[
     Returns:
         Updated user model if found, None otherwise
     """
-    db_user = get_user(db, user_id)
+    db_user = await get_user(db, user_id)
     if not db_user:
         return None
 
@@ -126,13 +148,13 @@ def update_user(db: Session, user_id: str, user_update: UserUpdate) -> Optional[
     for field, value in update_data.items():
         setattr(db_user, field, value)
 
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
 
     return db_user
 
 
-def delete_user(db: Session, user_id: str) -> bool:
+async def delete_user(db: AsyncSession, user_id: str) -> bool:
     """
     Delete user
 
@@ -143,17 +165,17 @@ def delete_user(db: Session, user_id: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    db_user = get_user(db, user_id)
+    db_user = await get_user(db, user_id)
     if not db_user:
         return False
 
-    db.delete(db_user)
-    db.commit()
+    await db.delete(db_user)
+    await db.commit()
 
     return True
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[UserModel]:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[UserModel]:
     """
     Authenticate user with email and password
 
@@ -165,26 +187,23 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[UserMo
     Returns:
         User model if authentication successful, None otherwise
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
-    user = get_user_by_email(db, email)
+    user = await get_user_by_email(db, email)
     if not user:
-        logger.warning(f"Authentication failed - User not found: {email}")
+        logger.warning("Authentication failed - User not found: %s", email)
         return None
 
-    logger.info(f"User found: {email}, verifying password...")
-    logger.debug(f"Stored hash length: {len(user.hashed_password)}, hash prefix: {user.hashed_password[:10]}...")
+    logger.info("User found: %s, verifying password...", email)
+    logger.debug("Stored hash length: %s, hash prefix: %s...", len(user.hashed_password), user.hashed_password[:10])
 
-    if not verify_password(password, user.hashed_password):
-        logger.warning(f"Authentication failed - Password mismatch for: {email}")
+    if not await verify_password_async(password, user.hashed_password):
+        logger.warning("Authentication failed - Password mismatch for: %s", email)
         return None
 
-    logger.info(f"Authentication successful for: {email}")
+    logger.info("Authentication successful for: %s", email)
     return user
 
 
-def count_users(db: Session, role: Optional[str] = None) -> int:
+async def count_users(db: AsyncSession, role: Optional[str] = None) -> int:
     """
     Count total users
 
@@ -195,7 +214,27 @@ def count_users(db: Session, role: Optional[str] = None) -> int:
     Returns:
         Number of users
     """
-    query = db.query(UserModel)
+    query = select(func.count(UserModel.id))
     if role:
-        query = query.filter(UserModel.role == role)
-    return query.count()
+        query = query.where(UserModel.role == role)
+    return (await db.execute(query)).scalar_one()
+
+
+async def count_users_by_role(db: AsyncSession) -> Dict[str, int]:
+    """
+    Count users grouped by role in a single query
+
+    Args:
+        db: Database session
+
+    Returns:
+        Mapping of role value to number of users
+    """
+    result = await db.execute(
+        select(UserModel.role, func.count(UserModel.id)).group_by(UserModel.role)
+    )
+    rows = result.all()
+    return {
+        (role.value if hasattr(role, "value") else role): count
+        for role, count in rows
+    }
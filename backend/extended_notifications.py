@@ -83,14 +83,14 @@ class TelegramNotifier:
                 result = response.json()
 
                 if result.get("ok"):
-                    logger.info(f"Telegram message sent to {chat_id}")
+                    logger.info("Telegram message sent to %s", chat_id)
                     return {
                         "success": True,
                         "message_id": result.get("result", {}).get("message_id"),
                         "channel": "telegram"
                     }
                 else:
-                    logger.error(f"Telegram API error: {result.get('description')}")
+                    logger.error("Telegram API error: %s", result.get('description'))
                     return {
                         "success": False,
                         "error": result.get("description"),
@@ -98,7 +98,7 @@ class TelegramNotifier:
                     }
 
         except Exception as e:
-            logger.error(f"Failed to send Telegram message: {str(e)}")
+            logger.error("Failed to send Telegram message: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -195,7 +195,7 @@ class DiscordNotifier:
                 response = await client.post(self.webhook_url, json=payload)
                 response.raise_for_status()
 
-                logger.info(f"Discord message sent via webhook")
+                logger.info("Discord message sent via webhook")
                 return {
                     "success": True,
                     "status_code": response.status_code,
@@ -203,7 +203,7 @@ class DiscordNotifier:
                 }
 
         except Exception as e:
-            logger.error(f"Failed to send Discord message: {str(e)}")
+            logger.error("Failed to send Discord message: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -323,7 +323,7 @@ class NotificationManager:
             Send result
         """
         if channel.value not in self.channels:
-            logger.error(f"Channel not registered: {channel.value}")
+            logger.error("Channel not registered: %s", channel.value)
             return {
                 "success": False,
                 "error": f"Channel not registered: {channel.value}",
@@ -339,7 +339,7 @@ class NotificationManager:
             return await notifier.send_candidate_alert(message_data)
 
         else:
-            logger.error(f"Unsupported channel: {channel.value}")
+            logger.error("Unsupported channel: %s", channel.value)
             return {
                 "success": False,
                 "error": f"Unsupported channel: {channel.value}",
@@ -371,7 +371,7 @@ class NotificationManager:
                 result = await self.send_to_channel(channel, target, message_data)
                 results[channel_name] = result
             except Exception as e:
-                logger.error(f"Failed to send to {channel_name}: {str(e)}")
+                logger.error("Failed to send to %s: %s", channel_name, e)
                 results[channel_name] = {
                     "success": False,
                     "error": str(e)
@@ -402,7 +402,7 @@ async def send_extended_notifications_node(state: Dict[str, Any]) -> Dict[str, A
     score = state.get("evaluation_score", 0)
 
     if score < 70:
-        logger.info(f"Score {score} below threshold, skipping extended notifications")
+        logger.info("Score %s below threshold, skipping extended notifications", score)
         return state
 
     # Initialize notification manager
@@ -425,7 +425,7 @@ async def send_extended_notifications_node(state: Dict[str, Any]) -> Dict[str, A
     results = await manager.broadcast(state)
 
     # Log results
-    logger.info(f"Extended notifications sent: {results.get('successful')}/{results.get('total_channels')} successful")
+    logger.info("Extended notifications sent: %s/%s successful", results.get('successful'), results.get('total_channels'))
 
     # Update state
     state["extended_notifications_sent"] = True
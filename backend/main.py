@@ -2,32 +2,56 @@
 # AI HR Automation API - Modular Entry Point
 # ============================================================================
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Dict
 
 import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 
 from backend.config import Config
-from backend.core.database import init_db
-from backend.core.mongodb import ensure_indexes, get_mongo_db
+from backend.core.database import engine, init_db, warm_pool
+from backend.core.mongodb import (
+    close_mongo,
+    connect_mongo,
+    ensure_indexes,
+    get_mongo_db,
+)
 from backend.api.auth import router as auth_router
+from backend.services.hr.automation import warm_workflows
 from backend.api.dashboard import register_dashboard_routes
 from backend.schemas.hr_api import HealthResponse
+from backend.utils.compression import SelectiveGZipMiddleware
+from backend.utils.json_logging import configure_logging
+from backend.utils.pdf_text import shutdown_pdf_pool, start_pdf_pool
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+configure_logging(Config.LOG_FORMAT)
 logger = logging.getLogger(__name__)
+# INFO logs each SQL statement (what echo=True did); WARNING skips building those records.
+logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO if Config.DEBUG else logging.WARNING)
+
+
+# (unix second, ISO-8601 UTC string) for the most recent second seen by _now_iso().
+_last_ts: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601 at second resolution, formatted once per second."""
+    global _last_ts
+    t = int(time.time())
+    if t != _last_ts[0]:
+        _last_ts = (t, datetime.fromtimestamp(t, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    return _last_ts[1]
 
 
 @asynccontextmanager
@@ -36,24 +60,28 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 80)
     logger.info("🚀 Starting AI HR Automation API")
     logger.info("=" * 80)
-    logger.info(f"Host: {Config.HOST}:{Config.PORT}")
+    logger.info("Host: %s:%s", Config.HOST, Config.PORT)
     logger.info("=" * 80)
 
     try:
         Config.validate()
         logger.info("✅ Configuration validated successfully")
     except ValueError as e:
-        logger.error(f"❌ Configuration validation failed: {e}")
+        logger.error("❌ Configuration validation failed: %s", e)
         logger.warning("⚠️  API will start but may not function correctly")
 
     try:
-        init_db()
+        await init_db()
         logger.info("✅ Database tables initialized successfully")
+        try:
+            await warm_pool()
+        except Exception as warm_err:
+            logger.warning("⚠️  PostgreSQL pool warm-up failed: %s", warm_err)
         try:
             from backend.core.seed import seed_default_users
-            seed_default_users()
+            await seed_default_users()
         except Exception as seed_err:
-            logger.warning(f"⚠️  Default account seeding failed: {seed_err}")
+            logger.warning("⚠️  Default account seeding failed: %s", seed_err)
     except Exception as e:
         err_msg = str(e).lower()
         if "name resolution" in err_msg or "could not translate host" in err_msg or "connection" in err_msg:
@@ -68,15 +96,36 @@ async def lifespan(app: FastAPI):
             logger.exception("❌ Database initialization failed")
         logger.warning("⚠️  User authentication may not work correctly")
 
+    try:
+        warm_workflows()
+        logger.info("✅ LangGraph workflows compiled")
+    except Exception as wf_err:
+        logger.warning("⚠️  Workflow compilation failed: %s", wf_err)
+
+    # Spawns the PDF page-extraction workers once; they are reused for every long CV.
+    if Config.PDF_PARALLEL_MIN_PAGES > 0:
+        start_pdf_pool(Config.PDF_PARALLEL_WORKERS)
+
+    app.state.mongo_db = db
+    try:
+        await connect_mongo()
+        logger.info("✅ MongoDB connection established")
+    except Exception as mongo_err:
+        logger.warning("⚠️  MongoDB ping failed: %s", mongo_err)
+
     try:
         await ensure_indexes(db)
         logger.info("✅ MongoDB indexes ensured")
     except Exception as idx_err:
-        logger.warning(f"⚠️  MongoDB index creation failed: {idx_err}")
+        logger.warning("⚠️  MongoDB index creation failed: %s", idx_err)
 
     yield
 
     logger.info("👋 Shutting down AI HR Automation API")
+    await engine.dispose()
+    await close_mongo()
+    # Waits for the workers to exit; off the loop so it can't stall other shutdown work.
+    await asyncio.to_thread(shutdown_pdf_pool)
 
 
 app = FastAPI(
@@ -86,8 +135,13 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Compress JSON list/export responses; small bodies aren't worth the CPU.
+# PDF and xlsx downloads are already compressed and pass through as-is.
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 _cors_origins = Config.get_cors_origins()
 if "*" in _cors_origins:
     # "*" cannot be combined with credentials per the CORS spec; drop credentials.
@@ -158,7 +212,7 @@ async def health_check():
     """Health check endpoint."""
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.now().isoformat(),
+        timestamp=_now_iso(),
         service="AI HR Automation",
         config={"llm_provider": Config.LLM_PROVIDER},
     )
@@ -180,24 +234,24 @@ from fastapi.exceptions import RequestValidationError
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    logger.error(f"Validation error on {request.url}: {exc.errors()}")
-    return JSONResponse(
+    logger.error("Validation error on %s: %s", request.url, exc.errors())
+    return ORJSONResponse(
         status_code=422,
-        content={"detail": exc.errors()},
+        content={"detail": jsonable_encoder(exc.errors())},
         headers=_cors_error_headers(request),
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.exception("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
             "error": "Internal server error",
             "detail": str(exc) if Config.DEBUG else "An error occurred processing your request",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
         },
         headers=_cors_error_headers(request),
     )
@@ -205,13 +259,13 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "error": exc.detail,
             "path": str(request.url),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
         },
         headers=_cors_error_headers(request),
     )
@@ -6,12 +6,30 @@
 SQLAlchemy User model for PostgreSQL
 """
 
-from datetime import datetime
 from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from backend.core.database import Base
 from backend.schemas.auth import UserRole
+from backend.utils.ulid_helper import uuid7
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC.
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
 
 
 class UserModel(Base):
@@ -19,7 +37,7 @@ class UserModel(Base):
     User model for authentication and authorization
 
     Attributes:
-        id: UUID primary key
+        id: UUID primary key (UUIDv7)
         email: User's email address (unique)
         name: User's full name
         hashed_password: Bcrypt hashed password
@@ -31,7 +49,8 @@ class UserModel(Base):
     """
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # UUIDv7 is time-ordered, so new rows append to the right edge of the PK index.
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String, unique=True, index=True, nullable=False)
     name = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
@@ -39,14 +58,24 @@ class UserModel(Base):
     role = Column(
         SQLEnum(UserRole),
         default=UserRole.JOB_SEEKER,
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     is_active = Column(Boolean, default=True, nullable=False)
     is_superuser = Column(Boolean, default=False, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Timestamps come from the database clock. ``default``/``onupdate`` render the
+    # expression into the INSERT/UPDATE (works on tables created before the
+    # server defaults existed); ``server_default`` covers rows written outside the ORM.
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=utcnow(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
+        nullable=False,
+    )
 
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
@@ -79,27 +79,31 @@ class JobSkills(BaseModel):
 
 
 def reduce_latest(current, new):
+    """Last-write-wins reducer. The state schemas below use plain fields instead:
+    LangGraph stores those in LastValue channels, which give the same result
+    for these linear graphs without a reducer call per key per step."""
     return new
 
 
 class CVExtractionState(TypedDict, total=False):
     """State for Graph1: CV upload -> extract -> summary -> save. No job/evaluation fields."""
-    candidate_name: Annotated[str, reduce_latest]
-    candidate_email: Annotated[str, reduce_latest]
-    cv_file_path: Annotated[str, reduce_latest]
-    cv_file_url: Annotated[str, reduce_latest]
-    cv_object_name: Annotated[str, reduce_latest]
-    cv_link: Annotated[str, reduce_latest]
-    extracted_cv_data: Annotated[dict, reduce_latest]
-    summary: Annotated[str, reduce_latest]
-    timestamp: Annotated[str, reduce_latest]
-    errors: Annotated[list[str], reduce_latest]
+    candidate_name: str
+    candidate_email: str
+    cv_file_path: str
+    cv_file_url: str
+    cv_object_name: str
+    cv_link: str
+    extracted_cv_data: dict
+    summary: str
+    timestamp: str
+    errors: list[str]
     messages: Annotated[list[AnyMessage], add_messages]
     # Optional for "My Resumes" association
-    user_id: Annotated[str, reduce_latest]
-    user_email: Annotated[str, reduce_latest]
+    user_id: str
+    user_email: str
     # Set by save_candidate_to_mongodb
-    candidate_id: Annotated[str, reduce_latest]
+    candidate_id: str
+    _candidate_oid: Any
     # Injected by caller for persistence node (db reference)
     _candidates_collection: Any
 
@@ -107,28 +111,28 @@ class CVExtractionState(TypedDict, total=False):
 class JobEvaluationState(TypedDict, total=False):
     """State for Graph2: one job + one candidate (from DB). No cv_file_path."""
     # Job side
-    job_id: Annotated[str, reduce_latest]
-    job_title: Annotated[str, reduce_latest]
-    job_description: Annotated[str, reduce_latest]
-    job_description_html: Annotated[str, reduce_latest]
-    hr_email: Annotated[str, reduce_latest]
-    job_skills: Annotated[JobSkills, reduce_latest]
+    job_id: str
+    job_title: str
+    job_description: str
+    job_description_html: str
+    hr_email: str
+    job_skills: JobSkills
     # Candidate side (from MongoDB)
-    candidate_id: Annotated[str, reduce_latest]
-    candidate_name: Annotated[str, reduce_latest]
-    candidate_email: Annotated[str, reduce_latest]
-    summary: Annotated[str, reduce_latest]
-    extracted_cv_data: Annotated[dict, reduce_latest]
-    cv_link: Annotated[str, reduce_latest]
+    candidate_id: str
+    candidate_name: str
+    candidate_email: str
+    summary: str
+    extracted_cv_data: dict
+    cv_link: str
     # Outputs
-    evaluation: Annotated[dict, reduce_latest]
-    skills_match: Annotated[dict, reduce_latest]
-    evaluation_score: Annotated[int, reduce_latest]
-    tag: Annotated[str, reduce_latest]
-    notification_message: Annotated[str, reduce_latest]
-    notify_hr: Annotated[bool, reduce_latest]
-    timestamp: Annotated[str, reduce_latest]
-    errors: Annotated[list[str], reduce_latest]
+    evaluation: dict
+    skills_match: dict
+    evaluation_score: int
+    tag: str
+    notification_message: str
+    notify_hr: bool
+    timestamp: str
+    errors: list[str]
     messages: Annotated[list[AnyMessage], add_messages]
 
 
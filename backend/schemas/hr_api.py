@@ -6,9 +6,8 @@ from typing import Dict, Any, List, Optional
 from bson import ObjectId
 from pydantic import BaseModel, EmailStr, Field, model_validator, ConfigDict, field_serializer, field_validator
 from pydantic.alias_generators import to_camel
-from bs4 import BeautifulSoup
-import re
 
+from backend.utils.html_text import html_to_text
 from backend.utils.ulid_helper import generate_ulid
 
 
@@ -72,23 +71,12 @@ class JobApplication(BaseModel):
 
     @model_validator(mode='after')
     def strip_html_and_assign(self) -> 'JobApplication':
+        # Stored job posts already carry the derived text; only parse when it's
+        # missing or is still the raw HTML (create_job stores the same string in both).
+        if self.description and self.description != self.description_html:
+            return self
         if self.description_html:
-            soup = BeautifulSoup(self.description_html, "html.parser")
-            block_elements = ['p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                              'ul', 'ol', 'blockquote', 'pre', 'hr']
-            for tag in soup.find_all(block_elements):
-                tag.insert_before('\n\n')
-                tag.insert_after('\n\n')
-            for li in soup.find_all('li'):
-                li.insert_before('\n• ')
-            for br in soup.find_all('br'):
-                br.replace_with('\n')
-            text = soup.get_text()
-            text = re.sub(r'[ \t]+', ' ', text)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            text = '\n'.join(line.strip() for line in text.split('\n'))
-            text = text.strip()
-            self.description = text
+            self.description = html_to_text(self.description_html)
         return self
 
 
@@ -99,7 +87,8 @@ class HRJobPost(BaseModel):
         validation_alias="_id",
         serialization_alias="id"
     )
-    ulid: Optional[str] = Field(default_factory=generate_ulid)
+    # Missing/empty ulids are filled in by generate_ulid_if_missing (validate_default runs it for omitted fields).
+    ulid: Optional[str] = Field(default=None, validate_default=True)
     job_application: JobApplication = Field(
         validation_alias="jobApplication",
         serialization_alias="jobApplication"
@@ -2,9 +2,11 @@
 # AI-Powered HR Automation – entrypoints (graph and nodes live in graph/ and nodes/)
 # ============================================================================
 
+import asyncio
+import heapq
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from backend.schemas.hr import JobSkills
 from backend.services.hr.graph import (
@@ -12,6 +14,54 @@ from backend.services.hr.graph import (
     create_job_evaluation_workflow,
 )
 from backend.services.hr.graph.nodes.job_skills import extract_job_skills
+from backend.services.hr.score_distribution import save_evaluations
+from backend.utils.object_ids import is_object_id
+from backend.utils.tasks import start_eager
+
+
+# Fields Graph2 reads from stored documents (see _job_doc_to_state,
+# _candidate_doc_to_state and _get_job_skills); everything else stays in MongoDB.
+# Job HTML is left out: the graph works from the plain-text description.
+EVAL_CANDIDATE_PROJECTION = {
+    "candidate_name": 1,
+    "candidate_email": 1,
+    "summary": 1,
+    "extracted_cv_data": 1,
+    "cv_link": 1,
+}
+EVAL_JOB_PROJECTION = {
+    "job_title": 1,
+    "job_description": 1,
+    "job_skills": 1,
+    "hr_email": 1,
+    "hr.email": 1,
+    "jobApplication.title": 1,
+    "jobApplication.description": 1,
+    "job_application.title": 1,
+    "job_application.description": 1,
+}
+
+
+# Candidates fetched per cursor round trip / evaluations per bulk write when
+# evaluating one job against every candidate.
+EVAL_CURSOR_BATCH_SIZE = 100
+EVAL_WRITE_BATCH = 100
+# Candidates with something for Graph2 to read. $nin with null also excludes
+# missing fields, so explicit nulls and empty values are filtered server-side.
+EVALUABLE_CANDIDATE_QUERY = {
+    "$or": [
+        {"extracted_cv_data": {"$nin": [None, {}]}},
+        {"summary": {"$nin": [None, ""]}},
+    ]
+}
+
+
+def _has_cv_content(candidate_doc: dict) -> bool:
+    """True if the candidate has a non-blank summary or extracted CV data to evaluate."""
+    summary = candidate_doc.get("summary")
+    if isinstance(summary, str):
+        summary = summary.strip()
+    return bool(summary or candidate_doc.get("extracted_cv_data"))
 
 
 @lru_cache(maxsize=1)
@@ -26,6 +76,12 @@ def _job_evaluation_app():
     return create_job_evaluation_workflow()
 
 
+def warm_workflows() -> None:
+    """Compile both graphs up front so the first upload/evaluation doesn't pay for it."""
+    _cv_extraction_app()
+    _job_evaluation_app()
+
+
 async def _get_job_skills(job_doc: dict, jobs_collection: Any) -> JobSkills:
     """Return job skills, using the cached value on the job document when present.
 
@@ -127,9 +183,24 @@ async def evaluate_job_against_candidate(
     When ``job_skills`` is provided the graph reuses it and skips the job-skills
     LLM call, which avoids re-extracting the same skills for every candidate.
     """
+    return await _evaluate_states(
+        _job_doc_to_state(job_doc), _candidate_doc_to_state(candidate_doc), job_skills
+    )
+
+
+async def _evaluate_states(
+    job_state: dict,
+    candidate_state: dict,
+    job_skills: Optional[JobSkills] = None,
+) -> dict:
+    """Run Graph2 from already-converted job/candidate state fields.
+
+    The evaluate-all loops convert their fixed side (the job, or the candidate)
+    once and only convert the document that changes per iteration.
+    """
     initial_state = {
-        **_job_doc_to_state(job_doc),
-        **_candidate_doc_to_state(candidate_doc),
+        **job_state,
+        **candidate_state,
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "errors": [],
         "messages": [],
@@ -145,8 +216,13 @@ async def evaluate_job_against_all_candidates(
     db: Any,
     *,
     write_evaluations: bool = True,
+    max_concurrent: int = 5,
 ) -> dict:
-    """Load job and all candidates with extracted_cv_data/summary, run Graph2 for each, write to candidate_evaluations."""
+    """Load job and all candidates with extracted_cv_data/summary, run Graph2 for each, write to candidate_evaluations.
+
+    Candidates are streamed from the cursor and evaluated by ``max_concurrent``
+    workers; results keep the candidates' query order.
+    """
     from bson import ObjectId
 
     jobs_collection = db.hr_job_posts
@@ -155,21 +231,20 @@ async def evaluate_job_against_all_candidates(
     if write_evaluations and evaluations_collection is None:
         evaluations_collection = db.candidate_evaluations
 
-    job_doc = await jobs_collection.find_one({"_id": ObjectId(job_id)})
+    job_doc = await jobs_collection.find_one({"_id": ObjectId(job_id)}, EVAL_JOB_PROJECTION)
     if not job_doc:
         return {"success": False, "error": f"Job {job_id} not found", "evaluated": 0}
 
-    query = {"$or": [{"extracted_cv_data": {"$exists": True, "$ne": {}}}, {"summary": {"$exists": True, "$ne": ""}}]}
-    cursor = candidates_collection.find(query)
-    candidates = await cursor.to_list(length=None)
-
     # Extract (and cache) job skills once, then reuse for every candidate.
     job_skills = await _get_job_skills(job_doc, jobs_collection)
+    job_state = _job_doc_to_state(job_doc)
 
-    results = []
-    for candidate_doc in candidates:
+    async def _eval_one(candidate_doc: dict) -> Tuple[dict, Optional[dict]]:
+        if not _has_cv_content(candidate_doc):
+            # Passed the query but still empty (e.g. a blank summary); don't spend an LLM call on it.
+            return {"candidate_id": str(candidate_doc.get("_id", "")), "score": None, "skipped": True}, None
         try:
-            state = await evaluate_job_against_candidate(job_doc, candidate_doc, job_skills=job_skills)
+            state = await _evaluate_states(job_state, _candidate_doc_to_state(candidate_doc), job_skills)
             candidate_id = state.get("candidate_id") or str(candidate_doc.get("_id", ""))
             eval_doc = {
                 "candidate_id": candidate_id,
@@ -178,17 +253,52 @@ async def evaluate_job_against_all_candidates(
                 "evaluation": state.get("evaluation", {}),
                 "skills_match": state.get("skills_match", {}),
                 "tag": state.get("tag", ""),
-                "timestamp": state.get("timestamp", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                "timestamp": state.get("timestamp") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             }
-            if write_evaluations and evaluations_collection is not None:
-                await evaluations_collection.update_one(
-                    {"candidate_id": candidate_id, "job_id": job_id},
-                    {"$set": eval_doc},
-                    upsert=True,
-                )
-            results.append({"candidate_id": candidate_id, "score": state.get("evaluation_score"), "tag": state.get("tag")})
+            row = {"candidate_id": candidate_id, "score": state.get("evaluation_score"), "tag": state.get("tag")}
+            return row, eval_doc
         except Exception as e:
-            results.append({"candidate_id": str(candidate_doc.get("_id", "")), "error": str(e)})
+            return {"candidate_id": str(candidate_doc.get("_id", "")), "error": str(e)}, None
+
+    # Stream candidates through a bounded queue to max_concurrent workers, so
+    # fetching overlaps evaluation and only a few documents are held at once.
+    # Evaluations are written in EVAL_WRITE_BATCH-sized bulk writes as they finish.
+    cursor = candidates_collection.find(EVALUABLE_CANDIDATE_QUERY, EVAL_CANDIDATE_PROJECTION).batch_size(EVAL_CURSOR_BATCH_SIZE)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+    rows: Dict[int, dict] = {}
+    pending: List[dict] = []
+
+    async def _flush() -> None:
+        if not pending or not write_evaluations or evaluations_collection is None:
+            pending.clear()
+            return
+        batch = pending[:]
+        pending.clear()
+        await save_evaluations(evaluations_collection, batch)
+
+    async def _produce() -> None:
+        index = 0
+        async for candidate_doc in cursor:
+            await queue.put((index, candidate_doc))
+            index += 1
+        for _ in range(max_concurrent):
+            await queue.put(None)
+
+    async def _work() -> None:
+        while (item := await queue.get()) is not None:
+            index, candidate_doc = item
+            rows[index], eval_doc = await _eval_one(candidate_doc)
+            if eval_doc is not None:
+                pending.append(eval_doc)
+                if len(pending) >= EVAL_WRITE_BATCH:
+                    await _flush()
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_produce())
+        for _ in range(max_concurrent):
+            tg.create_task(_work())
+    await _flush()
+    results = [rows[i] for i in range(len(rows))]
 
     return {
         "success": True,
@@ -204,9 +314,12 @@ async def evaluate_candidate_against_all_jobs(
     *,
     write_evaluations: bool = True,
     job_limit: int = 50,
+    max_concurrent: int = 5,
 ) -> dict:
     """Load one candidate and all jobs, run Graph2 (job evaluation workflow) for each job,
     write to candidate_evaluations, return ranked list of jobs by score (desc).
+
+    Jobs are evaluated concurrently, at most ``max_concurrent`` at a time.
     """
     from bson import ObjectId
 
@@ -216,52 +329,72 @@ async def evaluate_candidate_against_all_jobs(
     if write_evaluations and evaluations_collection is None:
         evaluations_collection = db.candidate_evaluations
 
-    if not ObjectId.is_valid(candidate_id):
+    if not is_object_id(candidate_id):
         return {"success": False, "error": "Invalid candidate id", "rankings": []}
 
-    candidate_doc = await candidates_collection.find_one({"_id": ObjectId(candidate_id)})
+    candidate_doc = await candidates_collection.find_one(
+        {"_id": ObjectId(candidate_id)}, EVAL_CANDIDATE_PROJECTION
+    )
     if not candidate_doc:
         return {"success": False, "error": "Candidate not found", "rankings": []}
-    if not candidate_doc.get("summary") and not candidate_doc.get("extracted_cv_data"):
+    if not _has_cv_content(candidate_doc):
         return {"success": False, "error": "Candidate has no summary or extracted_cv_data for evaluation", "rankings": []}
 
-    cursor = jobs_collection.find({}).sort("createdAt", -1).limit(job_limit)
+    cursor = jobs_collection.find({}, EVAL_JOB_PROJECTION).sort("createdAt", -1).limit(job_limit)
     job_docs = await cursor.to_list(length=job_limit)
 
-    rankings = []
-    for job_doc in job_docs:
-        jid = str(job_doc.get("_id", ""))
-        try:
-            # Reuse each job's cached skills (extracted once per job on first use).
-            job_skills = await _get_job_skills(job_doc, jobs_collection)
-            state = await evaluate_job_against_candidate(job_doc, candidate_doc, job_skills=job_skills)
-            score = state.get("evaluation_score")
-            evaluation = state.get("evaluation", {})
-            eval_doc = {
-                "candidate_id": candidate_id,
-                "job_id": jid,
-                "score": score,
-                "evaluation": evaluation,
-                "skills_match": state.get("skills_match", {}),
-                "tag": state.get("tag", ""),
-                "timestamp": state.get("timestamp", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-            }
-            if write_evaluations and evaluations_collection is not None:
-                await evaluations_collection.update_one(
-                    {"candidate_id": candidate_id, "job_id": jid},
-                    {"$set": eval_doc},
-                    upsert=True,
-                )
-            rankings.append({
-                "job_id": jid,
-                "score": score,
-                "evaluation": evaluation,
-                "tag": state.get("tag", ""),
-            })
-        except Exception as e:
-            rankings.append({"job_id": jid, "score": None, "error": str(e)})
+    candidate_state = _candidate_doc_to_state(candidate_doc)
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-    rankings.sort(key=lambda x: (x.get("score") is None, -(x.get("score") or 0)))
+    async def _eval_one(job_doc: dict, index: int) -> Tuple[int, dict, Optional[dict]]:
+        jid = str(job_doc.get("_id", ""))
+        async with semaphore:
+            try:
+                # Reuse each job's cached skills (extracted once per job on first use).
+                job_skills = await _get_job_skills(job_doc, jobs_collection)
+                state = await _evaluate_states(_job_doc_to_state(job_doc), candidate_state, job_skills)
+                score = state.get("evaluation_score")
+                evaluation = state.get("evaluation", {})
+                eval_doc = {
+                    "candidate_id": candidate_id,
+                    "job_id": jid,
+                    "score": score,
+                    "evaluation": evaluation,
+                    "skills_match": state.get("skills_match", {}),
+                    "tag": state.get("tag", ""),
+                    "timestamp": state.get("timestamp") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                }
+                row = {
+                    "job_id": jid,
+                    "score": score,
+                    "evaluation": evaluation,
+                    "tag": state.get("tag", ""),
+                }
+                return index, row, eval_doc
+            except Exception as e:
+                return index, {"job_id": jid, "score": None, "error": str(e)}, None
+
+    # Push each scored job into a ranking heap as its evaluation finishes, so
+    # ranking overlaps the remaining LLM calls instead of starting after the
+    # slowest one. Unscored rows (errors) skip the heap and go last; query
+    # position breaks ties in both, as the old stable sort did.
+    scored: List[Tuple[float, int, dict]] = []
+    unscored: List[Tuple[int, dict]] = []
+    eval_docs: List[dict] = []
+    tasks = start_eager(_eval_one(j, index) for index, j in enumerate(job_docs))
+    for next_done in asyncio.as_completed(tasks):
+        index, row, eval_doc = await next_done
+        score = row.get("score")
+        if score is None:
+            unscored.append((index, row))
+        else:
+            heapq.heappush(scored, (-score, index, row))
+        if eval_doc is not None:
+            eval_docs.append(eval_doc)
+    unscored.sort(key=lambda item: item[0])
+    rankings = [heapq.heappop(scored)[2] for _ in range(len(scored))] + [row for _, row in unscored]
+    if write_evaluations and evaluations_collection is not None:
+        await save_evaluations(evaluations_collection, eval_docs)
 
     return {
         "success": True,
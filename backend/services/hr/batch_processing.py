@@ -4,20 +4,25 @@
 
 import asyncio
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from backend.services.hr.automation import (
     process_cv_upload,
     evaluate_job_against_all_candidates,
 )
 from backend.schemas.hr_api import HRJobPost
+from backend.utils.tasks import gather_eager
 from backend.utils.ulid_helper import generate_ulid
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Turns CV filename separators into spaces to derive a display name ("jane_doe-cv" -> "jane doe cv").
+CV_NAME_TRANSLATION = str.maketrans("_-", "  ")
+
 
 class BatchProcessor:
     """Handles batch processing: Graph1 (CV extraction) + Graph2 (job evaluation). Requires db."""
@@ -50,16 +55,20 @@ class BatchProcessor:
     ) -> Dict[str, Any]:
         """Graph1 per candidate (extract + save to DB), then Graph2 for job vs all candidates."""
         batch_start_time = datetime.now()
-        logger.info(f"Starting batch {batch_id} with {len(candidates)} candidates (Graph1 + Graph2)")
+        logger.info("Starting batch %s with %s candidates (Graph1 + Graph2)", batch_id, len(candidates))
 
         candidates_collection = db.candidates
-        results = []
-        for candidate_data in candidates:
+        # ObjectIds of the documents Graph1 inserted, taken from the save node.
+        candidate_oids: List[Any] = []
+
+        async def upload_one(candidate_data: Dict[str, Any]) -> Dict[str, Any]:
             async with self.semaphore:
                 try:
                     result = await process_cv_upload(candidate_data, candidates_collection)
                     cid = result.get("candidate_id", "")
-                    results.append({
+                    if result.get("_candidate_oid") is not None:
+                        candidate_oids.append(result["_candidate_oid"])
+                    return {
                         "success": True,
                         "batch_id": batch_id,
                         "candidate_name": result.get("candidate_name"),
@@ -67,23 +76,24 @@ class BatchProcessor:
                         "candidate_id": cid,
                         "result": result,
                         "timestamp": datetime.now().isoformat(),
-                    })
+                    }
                 except Exception as e:
-                    logger.error(f"CV upload failed for {candidate_data.get('name')}: {e}")
-                    results.append({
+                    logger.error("CV upload failed for %s: %s", candidate_data.get('name'), e)
+                    return {
                         "success": False,
                         "batch_id": batch_id,
                         "candidate_name": candidate_data.get("name"),
                         "error": str(e),
                         "timestamp": datetime.now().isoformat(),
-                    })
+                    }
+
+        # Fan out so up to max_concurrent CV extractions run at once; order is preserved.
+        results = await gather_eager(upload_one(c) for c in candidates)
 
         successful = sum(1 for r in results if r.get("success"))
-        candidate_ids = [r["candidate_id"] for r in results if r.get("success") and r.get("candidate_id")]
-        if candidate_ids:
-            from bson import ObjectId
+        if candidate_oids:
             await candidates_collection.update_many(
-                {"_id": {"$in": [ObjectId(cid) for cid in candidate_ids if cid]}},
+                {"_id": {"$in": candidate_oids}},
                 {"$set": {"batch_id": batch_id}},
             )
 
@@ -97,12 +107,15 @@ class BatchProcessor:
 
         eval_summary = None
         if job_id:
-            eval_summary = await evaluate_job_against_all_candidates(job_id, db, write_evaluations=True)
+            eval_summary = await evaluate_job_against_all_candidates(
+                job_id, db, write_evaluations=True, max_concurrent=self.max_concurrent
+            )
             scores = [r.get("score") for r in (eval_summary.get("results") or []) if r.get("score") is not None]
         else:
             scores = []
 
-        total_processing_time = (datetime.now() - batch_start_time).total_seconds()
+        completed_at = datetime.now()
+        total_processing_time = (completed_at - batch_start_time).total_seconds()
         batch_summary = {
             "batch_id": batch_id,
             "total_candidates": len(candidates),
@@ -114,11 +127,11 @@ class BatchProcessor:
             "highest_score": max(scores) if scores else 0,
             "lowest_score": min(scores) if scores else 0,
             "started_at": batch_start_time.isoformat(),
-            "completed_at": datetime.now().isoformat(),
+            "completed_at": completed_at.isoformat(),
             "results": results,
             "evaluation_summary": eval_summary,
         }
-        logger.info(f"Batch {batch_id} completed: {successful}/{len(candidates)} CVs saved, job evaluations written")
+        logger.info("Batch %s completed: %s/%s CVs saved, job evaluations written", batch_id, successful, len(candidates))
         return batch_summary
 
 
@@ -149,10 +162,11 @@ class BatchProcessor:
             batch_id = generate_ulid()
 
         batch_start_time = datetime.now()
-        logger.info(f"Starting import batch {batch_id} with {len(candidates)} candidates (Graph1 only)")
+        logger.info("Starting import batch %s with %s candidates (Graph1 only)", batch_id, len(candidates))
 
         candidates_collection = db.candidates
         seen_hashes_in_batch: set[str] = set()
+        candidate_oids: List[Any] = []
 
         async def import_one(candidate_data: Dict[str, Any]) -> Dict[str, Any]:
             async with self.semaphore:
@@ -192,8 +206,11 @@ class BatchProcessor:
 
                     result = await process_cv_upload(candidate_data, candidates_collection)
                     cid = result.get("candidate_id", "")
-                    await self._backfill_candidate_identity(candidates_collection, cid, result)
-                    await self._set_source_metadata(candidates_collection, cid, file_hash, source_folder)
+                    oid = result.get("_candidate_oid")
+                    if oid is not None:
+                        candidate_oids.append(oid)
+                    await self._backfill_candidate_identity(candidates_collection, oid, result)
+                    await self._set_source_metadata(candidates_collection, oid, file_hash, source_folder)
                     return {
                         "success": True,
                         "batch_id": batch_id,
@@ -204,7 +221,7 @@ class BatchProcessor:
                         "timestamp": datetime.now().isoformat(),
                     }
                 except Exception as e:
-                    logger.error(f"CV import failed for {candidate_data.get('name')}: {e}")
+                    logger.error("CV import failed for %s: %s", candidate_data.get('name'), e)
                     return {
                         "success": False,
                         "batch_id": batch_id,
@@ -214,15 +231,14 @@ class BatchProcessor:
                         "timestamp": datetime.now().isoformat(),
                     }
 
-        results = list(await asyncio.gather(*(import_one(c) for c in candidates)))
+        results = await gather_eager(import_one(c) for c in candidates)
 
         successful = sum(1 for r in results if r.get("success"))
         duplicates = sum(1 for r in results if r.get("duplicate"))
         candidate_ids = [r["candidate_id"] for r in results if r.get("success") and r.get("candidate_id")]
-        if candidate_ids:
-            from bson import ObjectId
+        if candidate_oids:
             await candidates_collection.update_many(
-                {"_id": {"$in": [ObjectId(cid) for cid in candidate_ids if cid]}},
+                {"_id": {"$in": candidate_oids}},
                 {"$set": {"batch_id": batch_id}},
             )
 
@@ -244,10 +260,11 @@ class BatchProcessor:
             },
         )
 
-        total_processing_time = (datetime.now() - batch_start_time).total_seconds()
+        completed_at = datetime.now()
+        total_processing_time = (completed_at - batch_start_time).total_seconds()
         logger.info(
-            f"Import batch {batch_id} completed: {successful}/{len(candidates)} CVs saved, "
-            f"{duplicates} duplicate(s) skipped"
+            "Import batch %s completed: %s/%s CVs saved, %s duplicate(s) skipped",
+            batch_id, successful, len(candidates), duplicates,
         )
         return {
             "batch_id": batch_id,
@@ -258,7 +275,7 @@ class BatchProcessor:
             "total_processing_time_seconds": total_processing_time,
             "average_score": None,
             "started_at": batch_start_time.isoformat(),
-            "completed_at": datetime.now().isoformat(),
+            "completed_at": completed_at.isoformat(),
             "results": results,
         }
 
@@ -271,6 +288,7 @@ class BatchProcessor:
         summary: Dict[str, Any],
     ) -> None:
         """Persist batch metadata so export works even when all uploads were duplicates."""
+        now = datetime.now().isoformat()
         try:
             await db.batch_imports.update_one(
                 {"batch_id": batch_id},
@@ -280,14 +298,14 @@ class BatchProcessor:
                         "candidate_ids": candidate_ids,
                         "duplicate_candidate_ids": duplicate_candidate_ids,
                         "summary": summary,
-                        "completed_at": datetime.now().isoformat(),
+                        "completed_at": now,
                     },
-                    "$setOnInsert": {"created_at": datetime.now().isoformat()},
+                    "$setOnInsert": {"created_at": now},
                 },
                 upsert=True,
             )
         except Exception as e:
-            logger.warning(f"Failed to save batch import record for {batch_id}: {e}")
+            logger.warning("Failed to save batch import record for %s: %s", batch_id, e)
 
     @staticmethod
     async def _find_duplicate(candidates_collection: Any, file_hash: Optional[str]) -> Optional[Dict[str, Any]]:
@@ -300,18 +318,18 @@ class BatchProcessor:
                 {"candidate_name": 1, "candidate_email": 1, "source_folder": 1},
             )
         except Exception as e:
-            logger.warning(f"Duplicate lookup failed for hash {file_hash[:12]}...: {e}")
+            logger.warning("Duplicate lookup failed for hash %s...: %s", file_hash[:12], e)
             return None
 
     @staticmethod
     async def _set_source_metadata(
         candidates_collection: Any,
-        candidate_id: str,
+        candidate_oid: Any,
         file_hash: Optional[str],
         source_folder: str,
     ) -> None:
         """Persist the CV content hash (dedup key) and source folder (e.g. date folder)."""
-        if not candidate_id:
+        if candidate_oid is None:
             return
         updates: Dict[str, Any] = {}
         if file_hash:
@@ -320,24 +338,23 @@ class BatchProcessor:
             updates["source_folder"] = source_folder
         if not updates:
             return
-        from bson import ObjectId
         try:
             await candidates_collection.update_one(
-                {"_id": ObjectId(candidate_id)},
+                {"_id": candidate_oid},
                 {"$set": updates},
             )
         except Exception as e:
-            logger.warning(f"Failed to set source metadata for {candidate_id}: {e}")
+            logger.warning("Failed to set source metadata for %s: %s", candidate_oid, e)
 
     @staticmethod
     async def _backfill_candidate_identity(
         candidates_collection: Any,
-        candidate_id: str,
+        candidate_oid: Any,
         result: Dict[str, Any],
     ) -> None:
         """Update saved candidate doc's name/email from extracted personal_info when the
         original (filename-derived / placeholder) values are missing or clearly worse."""
-        if not candidate_id:
+        if candidate_oid is None:
             return
         personal = (result.get("extracted_cv_data") or {}).get("personal_info") or {}
         extracted_name = (personal.get("name") or "").strip()
@@ -357,14 +374,13 @@ class BatchProcessor:
                 updates["candidate_name"] = extracted_name
 
         if updates:
-            from bson import ObjectId
             try:
                 await candidates_collection.update_one(
-                    {"_id": ObjectId(candidate_id)},
+                    {"_id": candidate_oid},
                     {"$set": updates},
                 )
             except Exception as e:
-                logger.warning(f"Failed to backfill identity for {candidate_id}: {e}")
+                logger.warning("Failed to backfill identity for %s: %s", candidate_oid, e)
 
 
 async def process_candidates_batch(
@@ -393,6 +409,20 @@ async def import_candidates_from_uploads(
     return await processor.import_batch(candidates, db=db)
 
 
+def _list_pdf_files(cv_directory: str) -> List[Tuple[str, str]]:
+    """Return (stem, path) for each PDF in the directory, in one scandir pass.
+
+    The suffix check is case-insensitive, so a file is listed once even on
+    case-insensitive filesystems (where *.pdf and *.PDF globs both match it).
+    """
+    with os.scandir(cv_directory) as entries:
+        return [
+            (os.path.splitext(entry.name)[0], entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".pdf") and entry.is_file()
+        ]
+
+
 async def process_candidates_from_directory(
     cv_directory: str,
     hr_job_post: HRJobPost,
@@ -402,24 +432,25 @@ async def process_candidates_from_directory(
     """Process all CVs from a directory (Graph1 + Graph2). db required."""
     cv_dir = Path(cv_directory)
 
-    if not cv_dir.exists():
+    if not cv_dir.is_dir():
         raise ValueError(f"Directory not found: {cv_directory}")
 
-    cv_files = list(cv_dir.glob("*.pdf")) + list(cv_dir.glob("*.PDF"))
+    # Directory listing is blocking I/O; keep it off the event loop.
+    cv_files = await asyncio.to_thread(_list_pdf_files, cv_directory)
 
     if not cv_files:
         raise ValueError(f"No PDF files found in {cv_directory}")
 
     candidates = []
-    for cv_path in cv_files:
-        name = cv_path.stem.replace("_", " ").replace("-", " ")
+    for stem, cv_path in cv_files:
+        name = stem.translate(CV_NAME_TRANSLATION)
         candidates.append({
             "name": name,
             "email": f"{name.lower().replace(' ', '.')}@example.com",
-            "cv_file_path": str(cv_path),
+            "cv_file_path": cv_path,
         })
 
-    logger.info(f"Found {len(candidates)} CV files in {cv_directory}")
+    logger.info("Found %s CV files in %s", len(candidates), cv_directory)
 
     processor = BatchProcessor(max_concurrent=max_concurrent)
     return await processor.process_batch(candidates, hr_job_post, db=db)
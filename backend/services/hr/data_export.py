@@ -6,9 +6,10 @@
 Export candidate data to CSV and Excel formats
 """
 
+import asyncio
 import csv
 import io
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterable, AsyncIterator, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -24,6 +25,90 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CSV_COLUMNS = [
+    "timestamp",
+    "candidate_name",
+    "candidate_email",
+    "job_title",
+    "score",
+    "decision",
+    "summary",
+    "cv_link",
+    "strengths",
+    "gaps",
+    "matched_skills",
+    "missing_skills",
+    "reasoning",
+    "processing_time_seconds"
+]
+# Index of the score column, which gets a per-row conditional format in Excel.
+_SCORE_COL = CSV_COLUMNS.index("score")
+CSV_STREAM_CHUNK_ROWS = 500
+# Rows collected from the cursor before each worker-thread write in stream_excel.
+EXCEL_WRITE_BATCH_ROWS = 500
+# Both Excel exports write rows strictly in order, so xlsxwriter can flush each
+# row to its temp file instead of keeping every cell in memory until close().
+EXCEL_WORKBOOK_OPTIONS = {"constant_memory": True}
+
+# Candidate document fields read by the CSV/Excel writers; pass as a Mongo
+# projection so exports don't pull full parsed CVs over the wire. The writers
+# never read _id, so it is left out too (no ObjectId to decode or stringify).
+EXPORT_PROJECTION = {
+    "_id": 0,
+    **{
+        field: 1
+        for field in (
+            "timestamp",
+            "candidate_name",
+            "candidate_email",
+            "job_title",
+            "evaluation_score",
+            "evaluation",
+            "summary",
+            "cv_link",
+            "skills_match",
+            "processing_time_seconds",
+            "success",
+        )
+    },
+}
+
+
+class _SummaryStats:
+    """Running totals for the Excel summary sheet, filled one document at a time.
+
+    Scores count only from successful evaluations with a numeric
+    ``evaluation_score``.
+    """
+
+    __slots__ = ("total", "successful", "scored", "score_sum", "max_score", "min_score", "high", "low")
+
+    def __init__(self) -> None:
+        self.total = self.successful = self.scored = 0
+        self.score_sum = 0.0
+        self.max_score = float("-inf")
+        self.min_score = float("inf")
+        self.high = self.low = 0
+
+    def add(self, item: Dict[str, Any]) -> None:
+        self.total += 1
+        if not item.get("success", True):
+            return
+        self.successful += 1
+        score = item.get("evaluation_score")
+        if not isinstance(score, (int, float)):
+            return
+        self.scored += 1
+        self.score_sum += score
+        if score > self.max_score:
+            self.max_score = score
+        if score < self.min_score:
+            self.min_score = score
+        if score >= 70:
+            self.high += 1
+        elif score < 50:
+            self.low += 1
+
 
 class DataExporter:
     """
@@ -57,88 +142,94 @@ class DataExporter:
             logger.warning("No data to export")
             return ""
 
-        # Define CSV columns
-        columns = [
-            "timestamp",
-            "candidate_name",
-            "candidate_email",
-            "job_title",
-            "score",
-            "decision",
-            "summary",
-            "cv_link",
-            "strengths",
-            "gaps",
-            "matched_skills",
-            "missing_skills",
-            "reasoning",
-            "processing_time_seconds"
-        ]
-
-        # Prepare output
-        output = io.StringIO() if output_path is None else None
-
         if output_path:
-            file_handle = open(output_path, 'w', newline='', encoding='utf-8')
-            writer = csv.writer(file_handle)
-        else:
-            writer = csv.writer(output)
-
-        # Write headers
-        if include_headers:
-            writer.writerow(columns)
-
-        # Write data rows
-        for item in data:
-            row = []
-
-            # Extract nested data safely
-            evaluation = item.get("evaluation", {})
+            with open(output_path, 'w', newline='', encoding='utf-8') as file_handle:
+                self._write_csv(file_handle, data, include_headers)
+            logger.info("Exported %s records to %s", len(data), output_path)
+            return output_path
 
-            # Build row data
-            row.append(item.get("timestamp", ""))
-            row.append(item.get("candidate_name", ""))
-            row.append(item.get("candidate_email", ""))
-            row.append(item.get("job_title", ""))
+        output = io.StringIO()
+        self._write_csv(output, data, include_headers)
+        logger.info("Generated CSV with %s records", len(data))
+        return output.getvalue()
 
+    @classmethod
+    def _write_csv(cls, handle, data: List[Dict[str, Any]], include_headers: bool) -> None:
+        """Write header and rows to a text handle; rows go through one writerows() call."""
+        writer = csv.writer(handle)
+        if include_headers:
+            writer.writerow(CSV_COLUMNS)
+        writer.writerows(map(cls._csv_row, data))
+
+    @staticmethod
+    def _csv_row(item: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Build one CSV row (in CSV_COLUMNS order) from a candidate document."""
+        # Extract nested data safely; stored documents may hold explicit nulls
+        evaluation = item.get("evaluation") or {}
+        strengths = evaluation.get("strengths")
+        gaps = evaluation.get("gaps")
+        skills_match = item.get("skills_match") or {}
+        strong = skills_match.get("strong")
+        missing = skills_match.get("missing")
+
+        return (
+            item.get("timestamp", ""),
+            item.get("candidate_name", ""),
+            item.get("candidate_email", ""),
+            item.get("job_title", ""),
             # Score and decision
-            row.append(item.get("evaluation_score", evaluation.get("score", "")))
-            row.append(evaluation.get("decision", ""))
-
-            # Summary
-            row.append(item.get("summary", ""))
-
-            # CV Link
-            row.append(item.get("cv_link", ""))
-
+            item.get("evaluation_score", evaluation.get("score", "")),
+            evaluation.get("decision", ""),
+            item.get("summary", ""),
+            item.get("cv_link", ""),
             # Strengths and gaps
-            strengths = evaluation.get("strengths", [])
-            gaps = evaluation.get("gaps", [])
-            row.append("; ".join(strengths) if strengths else "")
-            row.append("; ".join(gaps) if gaps else "")
-
+            "; ".join(strengths) if strengths else "",
+            "; ".join(gaps) if gaps else "",
             # Skills match
-            skills_match = item.get("skills_match", {})
-            row.append("; ".join(skills_match.get("strong", [])))
-            row.append("; ".join(skills_match.get("missing", [])))
+            "; ".join(strong) if strong else "",
+            "; ".join(missing) if missing else "",
+            evaluation.get("reasoning", ""),
+            item.get("processing_time_seconds", ""),
+        )
 
-            # Reasoning
-            row.append(evaluation.get("reasoning", ""))
+    async def stream_csv(
+        self,
+        data: AsyncIterable[Dict[str, Any]],
+        chunk_rows: int = CSV_STREAM_CHUNK_ROWS,
+        include_headers: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Stream candidate data as CSV text chunks
 
-            # Processing time
-            row.append(item.get("processing_time_seconds", ""))
+        Rows are written as documents arrive, so memory stays bounded by
+        ``chunk_rows`` instead of the size of the export.
 
-            writer.writerow(row)
+        Args:
+            data: Async iterable of candidate result dictionaries (e.g. a Mongo cursor)
+            chunk_rows: Number of rows buffered per yielded chunk
+            include_headers: Whether to include column headers
 
-        if output_path:
-            file_handle.close()
-            logger.info(f"Exported {len(data)} records to {output_path}")
-            return output_path
-        else:
-            csv_content = output.getvalue()
-            output.close()
-            logger.info(f"Generated CSV with {len(data)} records")
-            return csv_content
+        Yields:
+            CSV text chunks
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if include_headers:
+            writer.writerow(CSV_COLUMNS)
+
+        count = 0
+        async for item in data:
+            writer.writerow(self._csv_row(item))
+            count += 1
+            if count % chunk_rows == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+
+        tail = buffer.getvalue()
+        if tail:
+            yield tail
+        logger.info("Streamed CSV with %s records", count)
 
     def export_to_excel(
         self,
@@ -157,18 +248,94 @@ class DataExporter:
         Returns:
             File path to saved Excel file
         """
+        self._require_xlsx()
+
+        if not data:
+            logger.warning("No data to export")
+            return ""
+
+        workbook = xlsxwriter.Workbook(output_path, EXCEL_WORKBOOK_OPTIONS)
+        worksheet, formats = self._start_candidates_sheet(workbook, sheet_name)
+        for row_idx, item in enumerate(data, start=1):
+            self._write_excel_row(worksheet, row_idx, item, formats)
+
+        self._add_summary_sheet(workbook, data)
+
+        workbook.close()
+        logger.info("Exported %s records to %s", len(data), output_path)
+        return output_path
+
+    async def stream_excel(
+        self,
+        data: AsyncIterable[Dict[str, Any]],
+        output_path: str,
+        sheet_name: str = "Candidates",
+        batch_rows: int = EXCEL_WRITE_BATCH_ROWS
+    ) -> str:
+        """
+        Export candidate data to Excel as documents arrive
+
+        The workbook is opened in xlsxwriter's ``constant_memory`` mode, which
+        flushes each row to disk once the next one starts, and the summary
+        sheet is computed from running totals, so memory does not grow with
+        the number of rows. Cell formatting and file writes are CPU/disk work,
+        so rows are handed to a worker thread in batches of ``batch_rows``
+        and the event loop only collects documents.
+
+        Args:
+            data: Async iterable of candidate result dictionaries (e.g. a Mongo cursor)
+            output_path: File path to save Excel file
+            sheet_name: Name of the worksheet
+            batch_rows: Rows buffered before each write to the worksheet
+
+        Returns:
+            File path to saved Excel file
+        """
+        self._require_xlsx()
+
+        workbook = xlsxwriter.Workbook(output_path, EXCEL_WORKBOOK_OPTIONS)
+        worksheet, formats = self._start_candidates_sheet(workbook, sheet_name)
+
+        total = 0
+        stats = _SummaryStats()
+
+        def _write_batch(first_row: int, batch: List[Dict[str, Any]]) -> None:
+            for offset, item in enumerate(batch):
+                self._write_excel_row(worksheet, first_row + offset, item, formats)
+
+        batch: List[Dict[str, Any]] = []
+        async for item in data:
+            batch.append(item)
+            stats.add(item)
+            if len(batch) >= batch_rows:
+                # Batches run one at a time, so rows still reach the sheet in order.
+                await asyncio.to_thread(_write_batch, total + 1, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            await asyncio.to_thread(_write_batch, total + 1, batch)
+            total += len(batch)
+
+        def _finish() -> None:
+            self._write_summary_sheet(workbook, stats)
+            # Zipping the package is blocking file I/O.
+            workbook.close()
+
+        await asyncio.to_thread(_finish)
+        logger.info("Streamed %s records to %s", total, output_path)
+        return output_path
+
+    @staticmethod
+    def _require_xlsx() -> None:
         if not XLSX_SUPPORT:
             raise ImportError(
                 "xlsxwriter is required for Excel export. "
                 "Install with: pip install xlsxwriter"
             )
 
-        if not data:
-            logger.warning("No data to export")
-            return ""
-
-        # Create workbook
-        workbook = xlsxwriter.Workbook(output_path)
+    @staticmethod
+    def _start_candidates_sheet(workbook, sheet_name: str):
+        """Add the candidates worksheet with headers and column widths; return it with its cell formats."""
         worksheet = workbook.add_worksheet(sheet_name)
 
         # Define formats
@@ -181,33 +348,32 @@ class DataExporter:
             'valign': 'vcenter'
         })
 
-        score_format = workbook.add_format({
-            'num_format': '0',
-            'bold': True,
-            'border': 1
-        })
-
-        high_score_format = workbook.add_format({
-            'num_format': '0',
-            'bold': True,
-            'bg_color': '#C6EFCE',  # Light green
-            'font_color': '#006100',
-            'border': 1
-        })
-
-        low_score_format = workbook.add_format({
-            'num_format': '0',
-            'bold': True,
-            'bg_color': '#FFC7CE',  # Light red
-            'font_color': '#9C0006',
-            'border': 1
-        })
-
-        cell_format = workbook.add_format({
-            'border': 1,
-            'text_wrap': True,
-            'valign': 'top'
-        })
+        formats = {
+            "score": workbook.add_format({
+                'num_format': '0',
+                'bold': True,
+                'border': 1
+            }),
+            "high_score": workbook.add_format({
+                'num_format': '0',
+                'bold': True,
+                'bg_color': '#C6EFCE',  # Light green
+                'font_color': '#006100',
+                'border': 1
+            }),
+            "low_score": workbook.add_format({
+                'num_format': '0',
+                'bold': True,
+                'bg_color': '#FFC7CE',  # Light red
+                'font_color': '#9C0006',
+                'border': 1
+            }),
+            "cell": workbook.add_format({
+                'border': 1,
+                'text_wrap': True,
+                'valign': 'top'
+            }),
+        }
 
         # Define columns
         columns = [
@@ -255,75 +421,50 @@ class DataExporter:
         # Freeze header row
         worksheet.freeze_panes(1, 0)
 
-        # Write data rows
-        for row_idx, item in enumerate(data, start=1):
-            evaluation = item.get("evaluation", {})
-            skills_match = item.get("skills_match", {})
-
-            # Extract data
-            row_data = [
-                item.get("timestamp", ""),
-                item.get("candidate_name", ""),
-                item.get("candidate_email", ""),
-                item.get("job_title", ""),
-                item.get("evaluation_score", evaluation.get("score", "")),
-                evaluation.get("decision", ""),
-                item.get("summary", ""),
-                item.get("cv_link", ""),
-                "; ".join(evaluation.get("strengths", [])),
-                "; ".join(evaluation.get("gaps", [])),
-                "; ".join(skills_match.get("strong", [])),
-                "; ".join(skills_match.get("missing", [])),
-                evaluation.get("reasoning", ""),
-                item.get("processing_time_seconds", "")
-            ]
-
-            # Write cells with appropriate formatting
-            for col, value in enumerate(row_data):
-                if col == 4:  # Score column
-                    score = value if isinstance(value, (int, float)) else 0
-                    if score >= 70:
-                        worksheet.write(row_idx, col, score, high_score_format)
-                    elif score < 50:
-                        worksheet.write(row_idx, col, score, low_score_format)
-                    else:
-                        worksheet.write(row_idx, col, score, score_format)
-                else:
-                    worksheet.write(row_idx, col, value, cell_format)
-
-        # Add summary sheet
-        self._add_summary_sheet(workbook, data)
-
-        workbook.close()
-        logger.info(f"Exported {len(data)} records to {output_path}")
-        return output_path
+        return worksheet, formats
+
+    @classmethod
+    def _write_excel_row(cls, worksheet, row_idx: int, item: Dict[str, Any], formats: Dict[str, Any]) -> None:
+        """Write one candidate row; same columns as the CSV export."""
+        row = cls._csv_row(item)
+        value = row[_SCORE_COL]
+        score = value if isinstance(value, (int, float)) else 0
+        if score >= 70:
+            score_format = formats["high_score"]
+        elif score < 50:
+            score_format = formats["low_score"]
+        else:
+            score_format = formats["score"]
+        # Three calls per row: the plain cells either side of the score, then the score.
+        worksheet.write_row(row_idx, 0, row[:_SCORE_COL], formats["cell"])
+        worksheet.write_number(row_idx, _SCORE_COL, score, score_format)
+        worksheet.write_row(row_idx, _SCORE_COL + 1, row[_SCORE_COL + 1:], formats["cell"])
 
     def _add_summary_sheet(self, workbook, data: List[Dict[str, Any]]):
         """Add summary statistics sheet to Excel workbook"""
-        summary_sheet = workbook.add_worksheet("Summary")
+        stats = _SummaryStats()
+        for item in data:
+            stats.add(item)
+        self._write_summary_sheet(workbook, stats)
 
-        # Calculate statistics
-        total_candidates = len(data)
-        successful = [d for d in data if d.get("success", True)]
-        scores = [
-            d.get("evaluation_score", 0)
-            for d in successful
-            if isinstance(d.get("evaluation_score"), (int, float))
-        ]
+    @staticmethod
+    def _write_summary_sheet(workbook, stats: _SummaryStats):
+        """Write the summary statistics sheet from precomputed totals"""
+        summary_sheet = workbook.add_worksheet("Summary")
 
-        if scores:
-            avg_score = sum(scores) / len(scores)
-            max_score = max(scores)
-            min_score = min(scores)
-            high_scorers = len([s for s in scores if s >= 70])
-            low_scorers = len([s for s in scores if s < 50])
+        if stats.scored:
+            avg_score = stats.score_sum / stats.scored
+            max_score = stats.max_score
+            min_score = stats.min_score
+            high_scorers = stats.high
+            low_scorers = stats.low
         else:
             avg_score = max_score = min_score = high_scorers = low_scorers = 0
 
         # Write summary
         summary_data = [
-            ["Total Candidates", total_candidates],
-            ["Successful Evaluations", len(successful)],
+            ["Total Candidates", stats.total],
+            ["Successful Evaluations", stats.successful],
             ["", ""],
             ["Average Score", f"{avg_score:.1f}"],
             ["Highest Score", max_score],
@@ -331,7 +472,7 @@ class DataExporter:
             ["", ""],
             ["High Scorers (>=70)", high_scorers],
             ["Low Scorers (<50)", low_scorers],
-            ["Mid Range (50-69)", len(scores) - high_scorers - low_scorers],
+            ["Mid Range (50-69)", stats.scored - high_scorers - low_scorers],
         ]
 
         header_format = workbook.add_format({
@@ -400,22 +541,26 @@ class DataExporter:
 
         # Export summary statistics
         summary_file = output_path / f"summary_{batch_id}_{timestamp}.txt"
-        with open(summary_file, 'w') as f:
-            f.write(f"Batch ID: {batch_id}\n")
-            f.write(f"Timestamp: {batch_result.get('completed_at', 'N/A')}\n")
-            f.write(f"=" * 50 + "\n\n")
-            f.write(f"Total Candidates: {batch_result.get('total_candidates', 0)}\n")
-            f.write(f"Successful: {batch_result.get('successful', 0)}\n")
-            f.write(f"Failed: {batch_result.get('failed', 0)}\n")
-            f.write(f"Average Score: {batch_result.get('average_score', 0):.1f}\n")
-            f.write(f"Highest Score: {batch_result.get('highest_score', 0)}\n")
-            f.write(f"Lowest Score: {batch_result.get('lowest_score', 0)}\n")
-            f.write(f"Total Processing Time: {batch_result.get('total_processing_time_seconds', 0):.1f}s\n")
-            f.write(f"Average Processing Time: {batch_result.get('average_processing_time_seconds', 0):.1f}s\n")
+        lines = [
+            f"Batch ID: {batch_id}",
+            f"Timestamp: {batch_result.get('completed_at', 'N/A')}",
+            "=" * 50,
+            "",
+            f"Total Candidates: {batch_result.get('total_candidates', 0)}",
+            f"Successful: {batch_result.get('successful', 0)}",
+            f"Failed: {batch_result.get('failed', 0)}",
+            f"Average Score: {batch_result.get('average_score') or 0:.1f}",
+            f"Highest Score: {batch_result.get('highest_score', 0)}",
+            f"Lowest Score: {batch_result.get('lowest_score', 0)}",
+            f"Total Processing Time: {batch_result.get('total_processing_time_seconds', 0):.1f}s",
+            f"Average Processing Time: {batch_result.get('average_processing_time_seconds', 0):.1f}s",
+        ]
+        # One write for the whole summary
+        summary_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
         export_files["summary"] = str(summary_file)
 
-        logger.info(f"Exported batch results to: {export_files}")
+        logger.info("Exported batch results to: %s", export_files)
         return export_files
 
 
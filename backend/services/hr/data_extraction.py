@@ -7,13 +7,16 @@ Extracts structured data from CV files (PDF, DOCX) by:
 """
 
 from backend.config import Config
-from backend.services.llm_provider import get_cached_llm
+from backend.services.llm_provider import ainvoke_json, get_cached_llm
+from backend.utils.pdf_text import pdf_to_text
+from backend.utils.ttl_cache import TTLCache
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
 import asyncio
+import copy
+import hashlib
 import json
 import logging
 import re
@@ -24,6 +27,18 @@ logger = logging.getLogger(__name__)
 # Simple patterns for fallback when LLM is unavailable
 EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
 
+# CV text sent to the LLM is capped to avoid token limits.
+CV_TEXT_LIMIT = 12000
+# A cut backs up to a paragraph/sentence/line break only within this many trailing characters.
+CV_TRUNCATE_WINDOW = 2000
+
+_RE_SPACES = re.compile(r"[ \t\f\v]+")
+_RE_BLANKLINES = re.compile(r"\n\s*\n\s*")
+
+# sha256 of the CV text sent to the LLM -> extraction result, see extract_cv_data.
+# Per-process, so a prompt or model change (which needs a restart) starts empty.
+_extraction_cache = TTLCache(ttl=Config.CV_EXTRACTION_CACHE_TTL, maxsize=1024)
+
 
 # ============================================================================
 # PYDANTIC MODELS FOR EXTRACTION
@@ -74,15 +89,13 @@ class CVExtraction(BaseModel):
 # ============================================================================
 
 def _pdf_to_text(file_path: str) -> str:
-    """Extract text from a PDF file using PyPDF2."""
-    from PyPDF2 import PdfReader
-    reader = PdfReader(file_path)
-    parts = []
-    for page in reader.pages:
-        text = page.extract_text()
-        if text:
-            parts.append(text)
-    return "\n".join(parts) or ""
+    """Extract text from a PDF file using PyPDF2, with OCR for scanned PDFs (see backend.utils.pdf_text)."""
+    return pdf_to_text(
+        file_path,
+        parallel_min_pages=Config.PDF_PARALLEL_MIN_PAGES,
+        max_workers=Config.PDF_PARALLEL_WORKERS,
+        ocr_fallback=Config.PDF_OCR_FALLBACK,
+    )
 
 
 def _docx_to_text(file_path: str) -> str:
@@ -138,6 +151,35 @@ Extract the following from the CV text and return valid JSON only (no markdown,
 
 Use empty string "" for missing optional fields. Use empty arrays [] when none found."""
 
+# The schema instructions never change, so render them (and the full system prompt) once.
+CV_EXTRACTION_PROMPT = (
+    CV_EXTRACTION_SYSTEM + "\n\n" + JsonOutputParser(pydantic_object=CVExtraction).get_format_instructions()
+)
+
+
+def _truncate_cv(text: str, limit: int = CV_TEXT_LIMIT) -> str:
+    """Normalize whitespace and cap the CV text at ``limit`` characters.
+
+    PDF text layers are full of padding spaces and blank lines, which cost
+    tokens without adding anything, so those are collapsed first. If the text
+    is still too long it is cut at the last paragraph, sentence or line break
+    near the limit rather than mid-word; the top of the CV (contact details,
+    recent experience) is what survives.
+    """
+    text = _RE_SPACES.sub(" ", text)
+    text = _RE_BLANKLINES.sub("\n\n", text).strip()
+    if len(text) <= limit:
+        return text
+
+    head = text[:limit]
+    floor = max(0, limit - CV_TRUNCATE_WINDOW)
+    for sep in ("\n\n", ". ", "\n", " "):
+        cut = head.rfind(sep, floor)
+        if cut > 0:
+            # Keep the full stop, drop the break.
+            return head[:cut + 1 if sep == ". " else cut].rstrip()
+    return head
+
 
 async def extract_cv_data(cv_file_path: str) -> dict:
     """
@@ -146,56 +188,64 @@ async def extract_cv_data(cv_file_path: str) -> dict:
     Converts the document to text (PDF/DOCX), then uses the LLM to produce
     structured data matching the CVExtraction schema. No LlamaCloud API key required.
 
+    Successful extractions are cached by a hash of the CV text, so re-uploading
+    the same CV skips the LLM call.
+
     Args:
         cv_file_path: Path to the CV file (PDF or DOCX).
 
     Returns:
         Dictionary with keys: personal_info, experience, education, skills.
     """
-    logger.info(f"Extracting data from CV: {cv_file_path}")
+    logger.info("Extracting data from CV: %s", cv_file_path)
 
     try:
         # Parsing PDFs/DOCX is CPU/IO-bound and synchronous; run off the event loop.
         text = await asyncio.to_thread(_file_to_text, cv_file_path)
     except (FileNotFoundError, ValueError) as e:
-        logger.error(f"CV file error: {e}")
+        logger.error("CV file error: %s", e)
         return _get_mock_extraction(cv_file_path)
 
     if not text or not text.strip():
         logger.warning("CV file produced no text. Returning mock data.")
         return _get_mock_extraction(cv_file_path)
 
+    cv_text = _truncate_cv(text)
+    cache_key = (
+        hashlib.sha256(cv_text.encode()).hexdigest() if Config.CV_EXTRACTION_CACHE_TTL > 0 else None
+    )
+    if cache_key:
+        cached = _extraction_cache.get(cache_key)
+        if cached is not None:
+            logger.info("CV extraction cache hit for %s", cv_file_path)
+            # Copies in and out, so a caller editing its result can't change later hits.
+            return copy.deepcopy(cached)
+
     try:
         llm = get_cached_llm(
             provider=Config.LLM_PROVIDER,
             temperature=Config.EXTRACTION_TEMP,
             max_tokens=2000,
+            json_mode=True,
         )
-        parser = JsonOutputParser(pydantic_object=CVExtraction)
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", CV_EXTRACTION_SYSTEM + "\n\n{format_instructions}"),
-            ("human", "CV text:\n\n{cv_text}"),
-        ])
-
-        chain = prompt | llm | parser
-        result = await chain.ainvoke({
-            "cv_text": text[:12000],  # cap length to avoid token limits
-            "format_instructions": parser.get_format_instructions(),
-        })
+        result = await ainvoke_json(llm, CV_EXTRACTION_PROMPT, f"CV text:\n\n{cv_text}")
 
         if isinstance(result, dict):
             data = result
         else:
             data = result.model_dump() if hasattr(result, "model_dump") else dict(result)
 
-        return {
+        extraction = {
             "personal_info": data.get("personal_info", {}),
             "experience": data.get("experience", []),
             "education": data.get("education", []),
             "skills": data.get("skills", {}),
         }
+        if cache_key:
+            _extraction_cache.set(cache_key, copy.deepcopy(extraction))
+        return extraction
     except Exception as e:
-        logger.error(f"CV extraction failed: {e}")
+        logger.error("CV extraction failed: %s", e)
         return _get_fallback_extraction(cv_file_path, text)
 
 
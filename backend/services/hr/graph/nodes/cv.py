@@ -20,7 +20,7 @@ async def extract_cv_data_node(state: Dict[str, Any]) -> Dict[str, Any]:
 
         extracted_data = await extract_cv_data(cv_file_path)
         state["extracted_cv_data"] = extracted_data
-        logger.info(f"CV data extracted for {state.get('candidate_name')}")
+        logger.info("CV data extracted for %s", state.get('candidate_name'))
 
     except Exception as e:
         error_msg = f"CV extraction error: {str(e)}"
@@ -57,7 +57,7 @@ async def generate_summary_node(state: Dict[str, Any]) -> Dict[str, Any]:
             summary_parts.append(f"Key technical skills include: {', '.join(tech_skills[:5])}. ")
 
         state["summary"] = "".join(summary_parts)
-        logger.info(f"Summary generated for {state.get('candidate_name')}")
+        logger.info("Summary generated for %s", state.get('candidate_name'))
 
     except Exception as e:
         error_msg = f"Summary generation error: {str(e)}"
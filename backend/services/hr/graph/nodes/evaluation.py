@@ -4,16 +4,30 @@
 
 import logging
 import re
+import unicodedata
 from typing import Dict, Any
 
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 
 from backend.schemas.hr import CandidateEvaluation
-from backend.services.llm_provider import create_evaluation_llm
+from backend.services.llm_provider import ainvoke_json, create_evaluation_llm
 
 logger = logging.getLogger(__name__)
 
+# Rendered once: the schema instructions are the same for every evaluation.
+EVALUATION_SYSTEM = (
+    "You are an expert HR evaluator. Evaluate the candidate based on their summary "
+    "and the job requirements. You must respond with ONLY a single valid JSON object, "
+    "no markdown, no extra text. Include: score (1-100), reasoning, strengths (list of strings), "
+    "gaps (list of strings), and decision (string, e.g. hire/not hire).\n\n"
+    + JsonOutputParser(pydantic_object=CandidateEvaluation).get_format_instructions()
+)
+
+
+def _skill_key(skill: str) -> str:
+    """Comparison key for a skill name: trimmed, Unicode-normalized and case-folded."""
+    return unicodedata.normalize("NFKD", skill.strip()).casefold()
+
 
 def _parse_evaluation_fallback(raw: str) -> Dict[str, Any]:
     """Extract score and reasoning from markdown-style LLM output when JSON parsing fails."""
@@ -47,23 +61,16 @@ async def evaluate_candidate_node(state: Dict[str, Any]) -> Dict[str, Any]:
             return state
 
         llm = create_evaluation_llm()
-        parser = JsonOutputParser(pydantic_object=CandidateEvaluation)
-        format_instructions = parser.get_format_instructions()
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are an expert HR evaluator. Evaluate the candidate based on their summary "
-                      "and the job requirements. You must respond with ONLY a single valid JSON object, "
-                      "no markdown, no extra text. Include: score (1-100), reasoning, strengths (list of strings), "
-                      "gaps (list of strings), and decision (string, e.g. hire/not hire).\n\n{format_instructions}"),
-            ("human", "Candidate Summary:\n{summary}\n\nJob Description:\n{job_description}")
-        ])
-
-        chain = prompt.partial(format_instructions=format_instructions) | llm | parser
-        result = await chain.ainvoke({"summary": summary, "job_description": job_description})
+        result = await ainvoke_json(
+            llm,
+            EVALUATION_SYSTEM,
+            # Job first: it is the same for every candidate in a batch, so it extends the cached prefix.
+            f"Job Description:\n{job_description}\n\nCandidate Summary:\n{summary}",
+        )
 
         state["evaluation"] = result
         state["evaluation_score"] = result.get("score", 50)
-        logger.info(f"Candidate evaluated with score: {state['evaluation_score']}/100")
+        logger.info("Candidate evaluated with score: %s/100", state['evaluation_score'])
 
     except Exception as e:
         error_msg = f"Evaluation error: {str(e)}"
@@ -77,9 +84,9 @@ async def evaluate_candidate_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 result = _parse_evaluation_fallback(raw_text)
                 state["evaluation"] = result
                 state["evaluation_score"] = result.get("score", 50)
-                logger.info(f"Parsed evaluation from markdown fallback, score: {state['evaluation_score']}/100")
+                logger.info("Parsed evaluation from markdown fallback, score: %s/100", state['evaluation_score'])
             except Exception as fallback_err:
-                logger.warning(f"Fallback parse failed: {fallback_err}")
+                logger.warning("Fallback parse failed: %s", fallback_err)
                 state["evaluation"] = {"score": 50, "reasoning": f"Evaluation failed: {str(e)}"}
                 state["evaluation_score"] = 50
         else:
@@ -104,18 +111,19 @@ async def skills_match_node(state: Dict[str, Any]) -> Dict[str, Any]:
         tech_skills = candidate_skills.get("technical_skills", [])
         tools = candidate_skills.get("tools", [])
 
-        all_candidate_skills = set(tech_skills + tools)
-        required_skills = set(job_skills.tech_skills)
+        candidate_keys = {_skill_key(s) for s in tech_skills + tools if isinstance(s, str)}
+        # dict.fromkeys: de-duplicated like a set, but keeps the job's order.
+        required_skills = dict.fromkeys(job_skills.tech_skills)
 
-        strong_matches = [s for s in required_skills if s.lower() in [cs.lower() for cs in all_candidate_skills]]
-        missing_skills = list(required_skills - set(strong_matches))
+        strong_matches = [s for s in required_skills if _skill_key(s) in candidate_keys]
+        missing_skills = [s for s in required_skills if _skill_key(s) not in candidate_keys]
 
         state["skills_match"] = {
             "strong": strong_matches,
             "partial": [],
             "missing": missing_skills
         }
-        logger.info(f"Skills matched: {len(strong_matches)} strong, {len(missing_skills)} missing")
+        logger.info("Skills matched: %s strong, %s missing", len(strong_matches), len(missing_skills))
 
     except Exception as e:
         error_msg = f"Skills matching error: {str(e)}"
@@ -144,7 +152,7 @@ async def score_decision_node(state: Dict[str, Any]) -> Dict[str, Any]:
             state["notify_hr"] = False
             state["notification_message"] = f"Low score candidate ({score}/100)"
 
-        logger.info(f"Decision made: {state['tag']}, notify_hr: {state['notify_hr']}")
+        logger.info("Decision made: %s, notify_hr: %s", state['tag'], state['notify_hr'])
 
     except Exception as e:
         error_msg = f"Score decision error: {str(e)}"
@@ -5,14 +5,16 @@
 import logging
 from typing import Dict, Any
 
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.prompts import ChatPromptTemplate
-
 from backend.schemas.hr import JobSkills
-from backend.services.llm_provider import create_job_skills_llm
+from backend.services.llm_provider import ainvoke_json, create_job_skills_llm
 
 logger = logging.getLogger(__name__)
 
+JOB_SKILLS_SYSTEM = (
+    "Extract technical and soft skills required for this job position. "
+    "Return as JSON with 'tech_skills' and 'soft_skills' arrays."
+)
+
 
 async def extract_job_skills(job_description: str) -> JobSkills:
     """Run the LLM once to extract required skills from a job description.
@@ -25,17 +27,8 @@ async def extract_job_skills(job_description: str) -> JobSkills:
         return JobSkills(tech_skills=[], soft_skills=[])
 
     llm = create_job_skills_llm()
-    parser = JsonOutputParser(pydantic_object=JobSkills)
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "Extract technical and soft skills required for this job position. "
-                  "Return as JSON with 'tech_skills' and 'soft_skills' arrays."),
-        ("human", "Job Description:\n{job_description}")
-    ])
-
-    chain = prompt | llm | parser
-    result = await chain.ainvoke({"job_description": job_description})
-    logger.info(f"Job skills extracted: {len(result.get('tech_skills', []))} technical skills")
+    result = await ainvoke_json(llm, JOB_SKILLS_SYSTEM, f"Job Description:\n{job_description}")
+    logger.info("Job skills extracted: %s technical skills", len(result.get('tech_skills', [])))
     return JobSkills(**result)
 
 
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 async def fan_out_notifications(state: Dict[str, Any]) -> Dict[str, Any]:
     """Fan out for parallel notifications"""
-    logger.info(f"Fanning out notifications for {state.get('candidate_name')}")
+    logger.info("Fanning out notifications for %s", state.get('candidate_name'))
     return state
 
 
@@ -22,7 +22,7 @@ async def send_hr_email_node(state: Dict[str, Any]) -> Dict[str, Any]:
             candidate_name = state.get("candidate_name", "candidate")
             score = state.get("evaluation_score", 0)
             message = state.get("notification_message", "")
-            logger.info(f"📧 Email would be sent to {hr_email}: {candidate_name} - {message} (Score: {score})")
+            logger.info("📧 Email would be sent to %s: %s - %s (Score: %s)", hr_email, candidate_name, message, score)
         else:
             logger.info("Email notification skipped (notify_hr=False)")
     except Exception as e:
@@ -39,7 +39,7 @@ async def send_slack_notification_node(state: Dict[str, Any]) -> Dict[str, Any]:
             candidate_name = state.get("candidate_name", "candidate")
             score = state.get("evaluation_score", 0)
             tag = state.get("tag", "unknown")
-            logger.info(f"💬 Slack notification: {candidate_name} ({tag}, Score: {score})")
+            logger.info("💬 Slack notification: %s (%s, Score: %s)", candidate_name, tag, score)
         else:
             logger.info("Slack notification skipped (notify_hr=False)")
     except Exception as e:
@@ -54,7 +54,7 @@ async def send_whatsapp_node(state: Dict[str, Any]) -> Dict[str, Any]:
     try:
         if state.get("notify_hr"):
             candidate_name = state.get("candidate_name", "candidate")
-            logger.info(f"📱 WhatsApp: New candidate {candidate_name}")
+            logger.info("📱 WhatsApp: New candidate %s", candidate_name)
         else:
             logger.info("WhatsApp notification skipped (notify_hr=False)")
     except Exception as e:
@@ -38,7 +38,9 @@ async def save_candidate_to_mongodb(state: Dict[str, Any]) -> Dict[str, Any]:
 
         result = await collection.insert_one(doc)
         state["candidate_id"] = str(result.inserted_id)
-        logger.info(f"Candidate saved to MongoDB: {state['candidate_id']}")
+        # Raw ObjectId for callers that update the document next (no re-parse of candidate_id).
+        state["_candidate_oid"] = result.inserted_id
+        logger.info("Candidate saved to MongoDB: %s", state['candidate_id'])
 
     except Exception as e:
         error_msg = f"Save candidate to MongoDB error: {str(e)}"
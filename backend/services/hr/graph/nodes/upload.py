@@ -29,7 +29,7 @@ async def upload_cv_node(state: Dict[str, Any]) -> Dict[str, Any]:
             state["cv_file_url"] = result.get("file_url", "")
             state["cv_link"] = result.get("file_url", "")
             state["cv_object_name"] = result.get("object_name", "")
-            logger.info(f"CV uploaded successfully: {result.get('object_name')}")
+            logger.info("CV uploaded successfully: %s", result.get('object_name'))
         else:
             state["errors"].append(f"CV upload failed: {result.get('error', 'Unknown error')}")
 
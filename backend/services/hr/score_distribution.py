@@ -0,0 +1,73 @@
+# ============================================================================
+# Evaluation writes and per-job score distribution
+# ============================================================================
+
+"""
+Evaluation persistence and the per-job score histogram.
+
+The histogram is computed on read with a ``$bucket`` aggregation over the
+job's ``candidate_evaluations``. The (job_id, score) index serves both the
+``$match`` and the ``score`` field the buckets read, so the aggregation is a
+covered index scan over that one job's entries and never drifts from the
+evaluations themselves.
+"""
+
+from typing import Any, Dict, List
+
+from pymongo import UpdateOne
+
+SCORE_RANGES = ["0-49", "50-59", "60-69", "70-79", "80-89", "90-100"]
+# Lower bound of each range; 101 closes the last range so a score of 100 is counted.
+_BOUNDARIES = [0, 50, 60, 70, 80, 90, 101]
+
+
+async def save_evaluations(evaluations_collection: Any, eval_docs: List[Dict[str, Any]]) -> None:
+    """Upsert (candidate_id, job_id) evaluations with a single unordered bulk_write."""
+    if not eval_docs:
+        return
+    await evaluations_collection.bulk_write(
+        [
+            UpdateOne({"candidate_id": d["candidate_id"], "job_id": d["job_id"]}, {"$set": d}, upsert=True)
+            for d in eval_docs
+        ],
+        ordered=False,
+    )
+
+
+async def get_job_score_counts(db: Any, job_id: str) -> Dict[str, int]:
+    """Return {range: count} for one job's evaluations."""
+    pipeline = [
+        {"$match": {"job_id": job_id}},
+        # Only the indexed fields, so the planner can answer from the index alone.
+        {"$project": {"_id": 0, "score": 1}},
+        {
+            "$bucket": {
+                "groupBy": "$score",
+                "boundaries": _BOUNDARIES,
+                "default": "other",
+                "output": {"count": {"$sum": 1}},
+            }
+        },
+    ]
+    result = await (await db.candidate_evaluations.aggregate(pipeline)).to_list(None)
+    # $bucket omits empty buckets, so map by lower bound, not position.
+    by_bound = dict(zip(_BOUNDARIES, SCORE_RANGES))
+    counts = {label: 0 for label in SCORE_RANGES}
+    for bucket in result:
+        label = by_bound.get(bucket.get("_id"))
+        if label:
+            counts[label] = bucket.get("count", 0)
+    return counts
+
+
+def distribution_rows(counts: Dict[str, int]) -> List[Dict[str, Any]]:
+    """Turn {range: count} into the analytics response rows, with percentages."""
+    total = sum(counts.values())
+    return [
+        {
+            "range": label,
+            "count": counts.get(label, 0),
+            "percentage": round((counts.get(label, 0) / total) * 100, 2) if total else 0,
+        }
+        for label in SCORE_RANGES
+    ]
@@ -73,7 +73,7 @@ def map_job_to_candidate_skills(
         "total_candidate_skills": len(candidate_skills)
     }
 
-    logger.info(f"Skills matching complete: {match_percentage:.2f}% match")
+    logger.info("Skills matching complete: %.2f%% match", match_percentage)
 
     return result
 
@@ -17,7 +17,7 @@ class CVUploadService:
 
     def __init__(self):
         self.storage = get_storage()
-        logger.info(f"CV Upload Service initialized with {Config.STORAGE_TYPE} storage")
+        logger.info("CV Upload Service initialized with %s storage", Config.STORAGE_TYPE)
 
     def upload_cv_file(
         self,
@@ -40,7 +40,7 @@ class CVUploadService:
                 filename=filename,
                 folder="cvs"
             )
-            logger.info(f"CV uploaded successfully: {result.get('object_name')}")
+            logger.info("CV uploaded successfully: %s", result.get('object_name'))
             return {
                 "success": True,
                 "file_url": result.get("signed_url"),
@@ -48,7 +48,7 @@ class CVUploadService:
                 "expires_in_hours": result.get("expires_in_hours", 24)
             }
         except Exception as e:
-            logger.error(f"CV upload failed: {str(e)}")
+            logger.error("CV upload failed: %s", e)
             return {"success": False, "error": str(e)}
 
     def upload_cv_bytes(self, file_data: bytes, filename: str) -> Dict[str, Any]:
@@ -66,7 +66,7 @@ class CVUploadService:
                 "expires_in_hours": result.get("expires_in_hours", 24)
             }
         except Exception as e:
-            logger.error(f"CV upload failed: {str(e)}")
+            logger.error("CV upload failed: %s", e)
             return {"success": False, "error": str(e)}
 
     def get_cv_url(self, object_name: str) -> str:
@@ -76,7 +76,7 @@ class CVUploadService:
         try:
             return self.storage.delete_file(object_name)
         except Exception as e:
-            logger.error(f"Failed to delete CV: {str(e)}")
+            logger.error("Failed to delete CV: %s", e)
             return False
 
 
@@ -10,7 +10,10 @@ Supports:
 Note: Google Gemini support has been removed
 """
 
+from langchain_core.exceptions import OutputParserException
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.utils.json import parse_json_markdown
 from langchain_openai import ChatOpenAI, AzureChatOpenAI
 from langchain_anthropic import ChatAnthropic
 # Google Gemini support removed - langchain_google_genai import commented out
@@ -20,6 +23,8 @@ from pydantic import SecretStr
 import os
 from enum import Enum
 from functools import lru_cache
+from json import JSONDecodeError
+from typing import Any, Optional
 
 
 # ============================================================================
@@ -249,6 +254,22 @@ class LLMFactory:
 # CACHED FACTORY
 # ============================================================================
 
+def _json_mode_kwargs(provider: Optional[str]) -> dict:
+    """Constructor kwargs that make the provider return a bare JSON object.
+
+    Anthropic has no JSON mode; its replies still go through the JSON parser
+    (and the evaluation node's markdown fallback).
+    """
+    if os.getenv("LLM_JSON_MODE", "true").lower() != "true":
+        return {}
+    provider = (provider or os.getenv("LLM_PROVIDER", "openai")).lower()
+    if provider in (LLMProvider.OPENAI, LLMProvider.AZURE_OPENAI):
+        return {"model_kwargs": {"response_format": {"type": "json_object"}}}
+    if provider == LLMProvider.OLLAMA:
+        return {"format": "json"}
+    return {}
+
+
 @lru_cache(maxsize=32)
 def get_cached_llm(
     provider: str = None,
@@ -257,6 +278,7 @@ def get_cached_llm(
     max_tokens: int = 1000,
     api_key: str = None,
     base_url: str = None,
+    json_mode: bool = False,
 ) -> BaseChatModel:
     """Return a shared LLM client for the given configuration.
 
@@ -264,6 +286,9 @@ def get_cached_llm(
     so caching by (provider, model, temperature, max_tokens, ...) avoids
     re-instantiating a new client (and its HTTP session) on every request.
     Only hashable args are accepted so the result can be memoized.
+
+    ``json_mode`` requests the provider's JSON-only output mode, for prompts
+    whose reply is parsed as JSON (see ainvoke_json).
     """
     return LLMFactory.create_llm(
         provider=provider,
@@ -272,9 +297,41 @@ def get_cached_llm(
         max_tokens=max_tokens,
         api_key=api_key,
         base_url=base_url,
+        **(_json_mode_kwargs(provider) if json_mode else {}),
     )
 
 
+# ============================================================================
+# JSON PROMPTS
+# ============================================================================
+
+async def ainvoke_json(llm: BaseChatModel, system: str, human: str) -> Any:
+    """Send one system + human message pair and parse the reply as JSON.
+
+    Same result as ``ChatPromptTemplate | llm | JsonOutputParser`` for a fixed
+    prompt, without building a Runnable chain per call. Replies wrapped in a
+    markdown code block are accepted; anything else that is not JSON raises
+    ``OutputParserException("Invalid json output: ...")`` as the parser did.
+
+    ``system`` should be the constant part of the prompt and ``human`` the
+    per-call data, so providers can reuse their prompt cache for the shared
+    prefix. OpenAI does that automatically; Anthropic needs the system block
+    marked with ``cache_control``.
+    """
+    if isinstance(llm, ChatAnthropic):
+        system_message = SystemMessage(
+            content=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        )
+    else:
+        system_message = SystemMessage(content=system)
+    response = await llm.ainvoke([system_message, HumanMessage(content=human)])
+    text = response.text.strip()
+    try:
+        return parse_json_markdown(text)
+    except JSONDecodeError as e:
+        raise OutputParserException(f"Invalid json output: {text}", llm_output=text) from e
+
+
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
@@ -319,7 +376,8 @@ def create_job_skills_llm(
         model=model,
         temperature=0.0,
         max_tokens=600,
-        api_key=api_key
+        api_key=api_key,
+        json_mode=True,
     )
 
 
@@ -363,7 +421,8 @@ def create_evaluation_llm(
         model=model,
         temperature=0.4,
         max_tokens=600,
-        api_key=api_key
+        api_key=api_key,
+        json_mode=True,
     )
 
 
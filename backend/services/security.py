@@ -6,12 +6,23 @@
 JWT token creation and password hashing utilities
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 import bcrypt
 from backend.config import Config
 
+# bcrypt releases the GIL while hashing, so a thread pool sized to the CPU count
+# hashes in parallel without competing with the default executor used by
+# FastAPI/asyncio.to_thread for everything else.
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt",
+)
+
 
 def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt."""
@@ -33,6 +44,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the dedicated bcrypt pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the dedicated bcrypt pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _BCRYPT_POOL, verify_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None
@@ -4,7 +4,8 @@
 
 import io
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
 from datetime import timedelta
 
 try:
@@ -18,6 +19,9 @@ from backend.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Bytes per chunk when streaming an object back to a client.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class MinIOStorage:
     """MinIO 存储服务类"""
@@ -63,7 +67,7 @@ class MinIOStorage:
                 }
                 self.client.set_bucket_policy(self.bucket_name, json.dumps(policy))
         except S3Error as e:
-            logger.error(f"存储桶操作失败: {str(e)}")
+            logger.error("存储桶操作失败: %s", e)
             raise
 
     def upload_file(
@@ -84,7 +88,7 @@ class MinIOStorage:
             )
             return object_name
         except S3Error as e:
-            logger.error(f"文件上传失败: {str(e)}")
+            logger.error("文件上传失败: %s", e)
             raise
 
     def upload_pdf(
@@ -114,7 +118,7 @@ class MinIOStorage:
                 "expires_in_hours": 24
             }
         except S3Error as e:
-            logger.error(f"生成预签名 URL 失败: {str(e)}")
+            logger.error("生成预签名 URL 失败: %s", e)
             raise
 
     def get_file_url(
@@ -129,7 +133,7 @@ class MinIOStorage:
                 expires=expires
             )
         except S3Error as e:
-            logger.error(f"生成预签名 URL 失败: {str(e)}")
+            logger.error("生成预签名 URL 失败: %s", e)
             raise
 
     def download_file(self, object_name: str) -> bytes:
@@ -138,11 +142,46 @@ class MinIOStorage:
                 bucket_name=self.bucket_name,
                 object_name=object_name
             )
-            return response.read()
+            try:
+                return response.read()
+            finally:
+                response.close()
+                response.release_conn()
+        except S3Error as e:
+            logger.error("文件下载失败: %s", e)
+            raise
+
+    def download_file_stream(
+        self,
+        object_name: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Tuple[Optional[int], Iterator[bytes]]:
+        """Open an object for streaming; returns (size in bytes or None, chunk iterator).
+
+        The GET is issued here (blocking), so errors such as a missing object
+        surface before any response is started. The iterator releases the
+        connection when exhausted or closed.
+        """
+        try:
+            response = self.client.get_object(
+                bucket_name=self.bucket_name,
+                object_name=object_name
+            )
         except S3Error as e:
-            logger.error(f"文件下载失败: {str(e)}")
+            logger.error("文件下载失败: %s", e)
             raise
 
+        length = response.headers.get("Content-Length")
+
+        def _chunks() -> Iterator[bytes]:
+            try:
+                yield from response.stream(chunk_size)
+            finally:
+                response.close()
+                response.release_conn()
+
+        return (int(length) if length else None), _chunks()
+
     def delete_file(self, object_name: str) -> bool:
         try:
             self.client.remove_object(
@@ -151,7 +190,7 @@ class MinIOStorage:
             )
             return True
         except S3Error as e:
-            logger.error(f"文件删除失败: {str(e)}")
+            logger.error("文件删除失败: %s", e)
             return False
 
     def list_files(self, prefix: str = "", recursive: bool = False) -> list:
@@ -163,7 +202,7 @@ class MinIOStorage:
             )
             return [obj.object_name for obj in objects]
         except S3Error as e:
-            logger.error(f"列出文件失败: {str(e)}")
+            logger.error("列出文件失败: %s", e)
             return []
 
     def get_public_url(self, object_name: str) -> str:
@@ -186,9 +225,23 @@ class StorageService:
     def download_file(self, object_name: str) -> bytes:
         return self.backend.download_file(object_name)
 
+    def download_file_stream(
+        self,
+        object_name: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Tuple[Optional[int], Iterator[bytes]]:
+        return self.backend.download_file_stream(object_name, chunk_size)
+
     def delete_file(self, object_name: str) -> bool:
         return self.backend.delete_file(object_name)
 
 
+@lru_cache(maxsize=None)
 def get_storage() -> StorageService:
+    """Shared StorageService for the process.
+
+    Building one creates a MinIO client and checks the bucket over the network,
+    so it is done once; the MinIO client is thread-safe. A failed build raises
+    and is not cached, so the next call retries.
+    """
     return StorageService()
@@ -0,0 +1,62 @@
+# ============================================================================
+# RESPONSE COMPRESSION
+# ============================================================================
+
+"""
+GZip response compression that skips formats which are already compressed.
+
+PDFs and .xlsx workbooks (a zip archive) barely shrink under gzip, so
+compressing them only costs CPU, and a compressed stream also loses its
+Content-Length. Responses with those content types are passed through
+untouched; everything else goes through Starlette's GZipMiddleware as usual.
+
+Only GZipMiddleware's public behaviour is relied on: it leaves responses
+that already carry a Content-Encoding alone. Inside it, precompressed
+responses are tagged ``Content-Encoding: identity``; outside it, the tag is
+removed again before the response reaches the client.
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content-type prefixes sent as-is.
+PRECOMPRESSED_CONTENT_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/vnd.openxmlformats-officedocument.",
+)
+
+_IDENTITY = (b"content-encoding", b"identity")
+
+
+class SelectiveGZipMiddleware:
+    """GZipMiddleware that leaves PRECOMPRESSED_CONTENT_TYPES responses alone."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(self._tag_precompressed, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_untagged(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [h for h in message.get("headers", []) if (h[0].lower(), h[1].lower()) != _IDENTITY]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.gzip(scope, receive, send_untagged)
+
+    async def _tag_precompressed(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_tagged(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                content_type = headers.get("content-type", "")
+                if "content-encoding" not in headers and content_type.startswith(PRECOMPRESSED_CONTENT_TYPES):
+                    message = {**message, "headers": [*message.get("headers", []), _IDENTITY]}
+            await send(message)
+
+        await self.app(scope, receive, send_tagged)
@@ -0,0 +1,50 @@
+# ============================================================================
+# HTML TO PLAIN TEXT
+# ============================================================================
+
+"""
+Convert job-description HTML into readable plain text.
+
+Block elements become paragraph breaks, list items become "• " bullets and
+<br> becomes a newline. BeautifulSoup does the walk, on lxml's C parser when
+it is installed.
+"""
+
+import re
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# lxml's C parser is much faster than html.parser; fall back when it isn't installed.
+_BS4_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+_BLOCK_TAGS = ('p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+               'ul', 'ol', 'blockquote', 'pre', 'hr')
+_RE_WS = re.compile(r'[ \t]+')
+_RE_BLANKLINES = re.compile(r'\n{3,}')
+
+
+def _extract_bs4(html: str) -> str:
+    soup = BeautifulSoup(html, _BS4_PARSER)
+    for tag in soup.find_all(_BLOCK_TAGS):
+        tag.insert_before('\n\n')
+        tag.insert_after('\n\n')
+    for li in soup.find_all('li'):
+        li.insert_before('\n• ')
+    for br in soup.find_all('br'):
+        br.replace_with('\n')
+    return soup.get_text()
+
+
+@lru_cache(maxsize=512)
+def html_to_text(html: str) -> str:
+    """Return the plain-text rendering of ``html`` with normalized whitespace.
+
+    Memoized: the same job post is re-validated on every batch run and
+    dashboard poll, so repeat descriptions skip the parse.
+    """
+    text = _extract_bs4(html)
+    text = _RE_WS.sub(' ', text)
+    text = _RE_BLANKLINES.sub('\n\n', text)
+    text = '\n'.join(line.strip() for line in text.split('\n'))
+    return text.strip()
@@ -0,0 +1,48 @@
+# ============================================================================
+# JSON LOG FORMATTER
+# ============================================================================
+
+"""
+One-line JSON log records for log shippers, rendered with orjson.
+
+Enabled with LOG_FORMAT=json. Records keep the stdlib logging API, so the
+message is still only %-formatted once a handler actually emits it.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+import orjson
+
+
+class JSONFormatter(logging.Formatter):
+    """Render a LogRecord as a single JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+def configure_logging(fmt: str = "text", level: int = logging.INFO) -> None:
+    """Configure the root logger for plain-text (default) or JSON output.
+
+    Uses ``force=True`` because modules imported earlier may already have
+    called ``logging.basicConfig``, which would make a plain call a no-op.
+    """
+    if fmt == "json":
+        handler = logging.StreamHandler()
+        handler.setFormatter(JSONFormatter())
+        logging.basicConfig(level=level, handlers=[handler], force=True)
+    else:
+        logging.basicConfig(
+            level=level,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            force=True,
+        )
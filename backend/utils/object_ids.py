@@ -0,0 +1,46 @@
+# ============================================================================
+# OBJECTID PARSING
+# ============================================================================
+
+"""
+Parse batches of id strings into ObjectIds before any database work.
+
+Invalid ids are dropped up front, so callers can short-circuit when nothing
+valid is left instead of sending a query (or raising InvalidId mid-request).
+"""
+
+import re
+from typing import Any, Dict, Iterable
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+_OBJECT_ID_RE = re.compile(r"[0-9a-fA-F]{24}")
+
+
+def is_object_id(value: Any) -> bool:
+    """True if ``value`` is a 24-hex-digit ObjectId string.
+
+    Path parameters are always str, so this covers what ObjectId.is_valid
+    accepts for them without constructing an ObjectId or raising.
+    """
+    return isinstance(value, str) and _OBJECT_ID_RE.fullmatch(value) is not None
+
+
+def parse_object_ids(ids: Iterable) -> Dict[str, ObjectId]:
+    """Map each valid id string to its ObjectId, parsing every id once.
+
+    Invalid or empty ids are dropped; duplicates collapse to one entry.
+    """
+    oid_map: Dict[str, ObjectId] = {}
+    for cid in ids:
+        if not cid:
+            continue
+        key = str(cid)
+        if key in oid_map:
+            continue
+        try:
+            oid_map[key] = ObjectId(key)
+        except (InvalidId, TypeError):
+            continue
+    return oid_map
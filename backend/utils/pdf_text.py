@@ -0,0 +1,160 @@
+# ============================================================================
+# PDF TEXT EXTRACTION
+# ============================================================================
+
+"""
+Plain text from PDF files with PyPDF2.
+
+PyPDF2 is pure Python, so page extraction holds the GIL and extra threads do
+not help. Long PDFs are split into page ranges that a small process pool
+extracts in parallel, each worker reopening the file itself; short ones (the
+usual 1-3 page CV) are read in-process, where a round trip to the pool would
+cost more than it saves.
+
+Scanned PDFs have no text layer. When the text layer yields (almost)
+nothing and pdf2image + pytesseract are installed, pages are rendered and
+OCR'd instead; text PDFs never pay for it.
+
+Workers are spawned, so each one re-imports the parent's ``__main__`` (the
+whole app when it was started as ``python -m backend.main``) and this module
+before it can run anything. That cost is paid once: the app creates the pool
+at startup with start_pdf_pool() and closes it with shutdown_pdf_pool() on
+exit. Without a started pool, every PDF is read in-process.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+# Optional dependencies for OCR of scanned PDFs (also need the poppler and tesseract binaries)
+try:
+    import pytesseract
+    from pdf2image import convert_from_path
+    OCR_SUPPORT = True
+except ImportError:
+    OCR_SUPPORT = False
+
+logger = logging.getLogger(__name__)
+
+# Below this many non-whitespace characters the text layer is treated as missing.
+OCR_MIN_TEXT_CHARS = 50
+
+# Shared page-extraction pool; see start_pdf_pool / shutdown_pdf_pool.
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _pages_text(file_path: str, start: int, stop: int) -> List[str]:
+    """Text of pages [start, stop); runs in a pool worker or in-process."""
+    from PyPDF2 import PdfReader
+    reader = PdfReader(file_path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _new_pool(max_workers: int) -> ProcessPoolExecutor:
+    # spawn rather than fork: the server process runs threads (asyncio's default
+    # executor, DB drivers) and forking a threaded process is unsafe.
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def start_pdf_pool(max_workers: int) -> None:
+    """Create the shared page-extraction pool (no-op below 2 workers or if already started)."""
+    global _pool, _pool_workers
+    if max_workers < 2:
+        return
+    with _pool_lock:
+        if _pool is None:
+            _pool = _new_pool(max_workers)
+            _pool_workers = max_workers
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the shared pool, cancelling queued work and waiting for its workers to exit."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool, _pool, _pool_workers = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def pdf_to_text(
+    file_path: str,
+    parallel_min_pages: int = 0,
+    max_workers: int = 1,
+    ocr_fallback: bool = True,
+) -> str:
+    """Extract text from a PDF, OCR'ing it if the text layer is empty.
+
+    Args:
+        file_path: Path to the PDF.
+        parallel_min_pages: Page count from which the started process pool is used (0 disables).
+        max_workers: OCR threads.
+        ocr_fallback: OCR scanned PDFs when pdf2image/pytesseract are installed.
+    """
+    text = _text_layer(file_path, parallel_min_pages)
+    if len("".join(text.split())) >= OCR_MIN_TEXT_CHARS or not ocr_fallback:
+        return text
+    if not OCR_SUPPORT:
+        logger.warning("No text layer in %s and OCR is not installed (pdf2image, pytesseract)", file_path)
+        return text
+    logger.info("No text layer in %s; falling back to OCR", file_path)
+    try:
+        return _ocr_text(file_path, max_workers)
+    except Exception as e:
+        # e.g. poppler/tesseract binaries missing; keep whatever the text layer had.
+        logger.warning("OCR failed for %s: %s", file_path, e)
+        return text
+
+
+def _text_layer(file_path: str, parallel_min_pages: int) -> str:
+    """Text layer of the PDF, split across the process pool when it is long."""
+    from PyPDF2 import PdfReader
+    reader = PdfReader(file_path)
+    page_count = len(reader.pages)
+
+    with _pool_lock:
+        pool, workers = _pool, _pool_workers
+    if pool is None or parallel_min_pages <= 0 or page_count < parallel_min_pages:
+        parts = [page.extract_text() or "" for page in reader.pages]
+        return "\n".join(filter(None, parts))
+
+    # One contiguous range per worker, so each reopens and parses the file once.
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    try:
+        chunks = list(pool.map(_pages_text, [file_path] * len(ranges), *zip(*ranges)))
+    except BrokenProcessPool as e:
+        logger.warning("PDF worker pool broken (%s); extracting %s in-process", e, file_path)
+        _replace_broken_pool(pool)
+        chunks = [_pages_text(file_path, start, stop) for start, stop in ranges]
+    except RuntimeError:
+        if _pool is pool:
+            raise
+        # The pool was shut down mid-call (app stopping); finish in-process.
+        chunks = [_pages_text(file_path, start, stop) for start, stop in ranges]
+    return "\n".join(filter(None, (text for chunk in chunks for text in chunk)))
+
+
+def _replace_broken_pool(pool: ProcessPoolExecutor) -> None:
+    """Swap a broken shared pool for a fresh one, unless it was already replaced or shut down."""
+    global _pool
+    with _pool_lock:
+        if _pool is not pool:
+            return
+        _pool = _new_pool(_pool_workers)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _ocr_text(file_path: str, max_workers: int) -> str:
+    """Render each page and OCR it; tesseract runs as a subprocess, so threads overlap."""
+    images = convert_from_path(file_path, thread_count=max(1, max_workers))
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(images)))) as executor:
+        parts = list(executor.map(pytesseract.image_to_string, images))
+    return "\n".join(part.strip() for part in parts if part and part.strip())
@@ -0,0 +1,30 @@
+# ============================================================================
+# EAGER TASK FAN-OUT
+# ============================================================================
+
+"""
+Eagerly started tasks for fan-out (``gather_eager``, ``start_eager``).
+
+An eager task runs synchronously until its first real suspension, so work
+items that finish without blocking (invalid input, duplicates, cache hits)
+complete at creation time instead of each waiting for a loop iteration.
+Scoped to the call rather than installed as the loop's task factory, so the
+rest of the app keeps normal scheduling.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Coroutine, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+def start_eager(coros: Iterable[Coroutine[Any, Any, T]]) -> List["asyncio.Task[T]"]:
+    """Start each coroutine as an eager task on the running loop."""
+    loop = asyncio.get_running_loop()
+    return [asyncio.Task(c, loop=loop, eager_start=True) for c in coros]
+
+
+async def gather_eager(coros: Iterable[Coroutine[Any, Any, T]]) -> List[T]:
+    """Start each coroutine as an eager task and return their results in order."""
+    tasks: List[Awaitable[T]] = start_eager(coros)
+    return list(await asyncio.gather(*tasks))
@@ -1,3 +1,6 @@
+import os
+import time
+import uuid
 from ulid import ULID
 from datetime import datetime
 
@@ -16,4 +19,16 @@ def is_valid_ulid(ulid_str: str) -> bool:
         ULID.from_str(ulid_str)
         return True
     except (ValueError, AttributeError):
-        return False
\ No newline at end of file
+        return False
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562): 48-bit Unix ms timestamp + random bits"""
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                              # version
+    value |= ((rand >> 62) & 0xFFF) << 64           # rand_a (12 bits)
+    value |= 0b10 << 62                             # RFC 4122/9562 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF           # rand_b (62 bits)
+    return uuid.UUID(int=value)
@@ -67,7 +67,7 @@ class WebhookManager:
                 self.subscriptions[event_type] = []
             self.subscriptions[event_type].append(webhook_url)
 
-        logger.info(f"Webhook subscribed: {webhook_url} for events: {[e.value for e in event_types]}")
+        logger.info("Webhook subscribed: %s for events: %s", webhook_url, [e.value for e in event_types])
 
         return {
             "subscription_id": subscription_id,
@@ -106,7 +106,7 @@ class WebhookManager:
                     self.subscriptions[event].remove(webhook_url)
                     removed_count += 1
 
-        logger.info(f"Webhook unsubscribed: {webhook_url} from {removed_count} events")
+        logger.info("Webhook unsubscribed: %s from %s events", webhook_url, removed_count)
 
         return {
             "webhook_url": webhook_url,
@@ -132,7 +132,7 @@ class WebhookManager:
             List of delivery results
         """
         if event_type not in self.subscriptions:
-            logger.warning(f"No subscribers for event: {event_type}")
+            logger.warning("No subscribers for event: %s", event_type)
             return []
 
         webhook_urls = self.subscriptions[event_type]
@@ -180,7 +180,7 @@ class WebhookManager:
                             break
 
                     except httpx.TimeoutException:
-                        logger.warning(f"Webhook timeout: {url}")
+                        logger.warning("Webhook timeout: %s", url)
                         if attempt < self.max_retries - 1:
                             continue
                         else:
@@ -193,7 +193,7 @@ class WebhookManager:
                             })
 
                     except Exception as e:
-                        logger.error(f"Webhook error: {url} - {str(e)}")
+                        logger.error("Webhook error: %s - %s", url, e)
                         delivery_results.append({
                             "webhook_url": url,
                             "status_code": None,
@@ -206,8 +206,8 @@ class WebhookManager:
         # Log results
         successful = sum(1 for r in delivery_results if r.get("success"))
         logger.info(
-            f"Webhook sent: {event_type.value} to {len(webhook_urls)} subscribers, "
-            f"{successful} successful"
+            "Webhook sent: %s to %s subscribers, %s successful",
+            event_type.value, len(webhook_urls), successful,
         )
 
         return delivery_results
@@ -373,7 +373,7 @@ def subscribe_to_webhook(
         try:
             event_enums.append(WebhookEventType(event_type))
         except ValueError:
-            logger.warning(f"Invalid event type: {event_type}")
+            logger.warning("Invalid event type: %s", event_type)
 
     return webhook_manager.subscribe(webhook_url, event_enums)
 
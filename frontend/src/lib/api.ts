@@ -102,6 +102,8 @@ export const jobsAPI = {
 // Candidates API
 export const candidatesAPI = {
   list: (params?: any) => api.get('/api/candidates', { params }),
+  /** Total matching candidates for the given filters (job_id, min_score, max_score). */
+  count: (params?: any) => api.get('/api/candidates/count', { params }),
   get: (id: string) => api.get(`/api/candidates/${id}`),
   /** Export candidates. Pass FormData with optional job_id, format (csv|xlsx), min_score, max_score. */
   export: (formData: FormData) =>
@@ -154,8 +156,8 @@ export const batchAPI = {
 
 // My Resumes API (job seeker: list and view own uploaded resumes)
 export const myResumesAPI = {
-  list: (params?: { limit?: number; skip?: number }) =>
-    api.get<{ total: number; resumes: any[] }>('/api/my-resumes', { params }),
+  list: (params?: { limit?: number; after?: string }) =>
+    api.get<{ total: number; next_cursor: string | null; resumes: any[] }>('/api/my-resumes', { params }),
   get: (id: string) => api.get<any>(`/api/my-resumes/${id}`),
   /** Get download URL for attachment (same-origin with auth). Use downloadUrl from get() for preview. */
   downloadUrl: (id: string) => `${api.defaults.baseURL}/api/my-resumes/${id}/download`,
@@ -24,12 +24,16 @@ interface Candidate {
 }
 
 interface CandidatesResponse {
-  total: number;
   limit: number;
   offset: number;
+  has_more: boolean;
   candidates: Candidate[];
 }
 
+interface CandidatesCountResponse {
+  total: number;
+}
+
 export function CandidatesPage() {
   const [jobId, setJobId] = useState<string>('');
   const [minScore, setMinScore] = useState<string>('');
@@ -40,21 +44,35 @@ export function CandidatesPage() {
   const [exporting, setExporting] = useState(false);
   const [exportFormat, setExportFormat] = useState<'csv' | 'xlsx'>('csv');
 
+  const filterParams = () => {
+    const params: Record<string, string | number> = {};
+    if (jobId) params.job_id = jobId;
+    const min = minScore.trim() ? parseInt(minScore, 10) : undefined;
+    const max = maxScore.trim() ? parseInt(maxScore, 10) : undefined;
+    if (min !== undefined && !Number.isNaN(min)) params.min_score = min;
+    if (max !== undefined && !Number.isNaN(max)) params.max_score = max;
+    return params;
+  };
+
   const { data, isLoading, error, refetch } = useQuery<CandidatesResponse>({
     queryKey: ['candidates', jobId, minScore, maxScore, sortBy, sortOrder, page],
     queryFn: async () => {
-      const params: Record<string, string | number> = {
+      const res = await candidatesAPI.list({
+        ...filterParams(),
         limit: PAGE_SIZE,
         offset: page * PAGE_SIZE,
         sort_by: sortBy,
         sort_order: sortOrder,
-      };
-      if (jobId) params.job_id = jobId;
-      const min = minScore.trim() ? parseInt(minScore, 10) : undefined;
-      const max = maxScore.trim() ? parseInt(maxScore, 10) : undefined;
-      if (min !== undefined && !Number.isNaN(min)) params.min_score = min;
-      if (max !== undefined && !Number.isNaN(max)) params.max_score = max;
-      const res = await candidatesAPI.list(params);
+      });
+      return res.data;
+    },
+  });
+
+  // Total is fetched once per filter set, not on every page/sort change.
+  const { data: countData } = useQuery<CandidatesCountResponse>({
+    queryKey: ['candidates-count', jobId, minScore, maxScore],
+    queryFn: async () => {
+      const res = await candidatesAPI.count(filterParams());
       return res.data;
     },
   });
@@ -69,8 +87,9 @@ export function CandidatesPage() {
 
   const jobs = jobsData?.jobs ?? [];
   const candidates = data?.candidates ?? [];
-  const total = data?.total ?? 0;
-  const totalPages = Math.ceil(total / PAGE_SIZE);
+  const total = countData?.total ?? 0;
+  const hasMore = data?.has_more ?? false;
+  const totalPages = Math.max(Math.ceil(total / PAGE_SIZE), page + (hasMore ? 2 : 1));
 
   const handleExport = async () => {
     setExporting(true);
@@ -269,8 +288,8 @@ export function CandidatesPage() {
                 <Button
                   variant="outline"
                   size="sm"
-                  onClick={() => setPage((p) => Math.min(totalPages - 1, p + 1))}
-                  disabled={page >= totalPages - 1}
+                  onClick={() => setPage((p) => p + 1)}
+                  disabled={!hasMore}
                 >
                   Next
                 </Button>
@@ -7,57 +7,55 @@ Run this script after starting PostgreSQL to:
 2. Create default admin user
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from backend.core.database import init_db, SessionLocal
+from backend.core.database import engine, init_db, SessionLocal
 from backend.crud.user import create_user, get_user_by_email
 from backend.schemas.auth import UserCreate, UserRole
 from backend.config import Config
 
 
-def create_default_admin():
+async def create_default_admin():
     """Create default admin user if not exists"""
-    db = SessionLocal()
-
-    try:
-        # Check if admin already exists
-        existing_admin = get_user_by_email(db, "admin@hr-automation.com")
-        if existing_admin:
-            print("✅ Admin user already exists")
-            print(f"   Email: admin@hr-automation.com")
-            return
-
-        # Create default admin
-        admin_user = UserCreate(
-            email="admin@hr-automation.com",
-            name="System Administrator",
-            password="admin123",  # CHANGE THIS AFTER FIRST LOGIN!
-            role=UserRole.ADMIN,
-            is_active=True,
-            is_superuser=True
-        )
-
-        created_admin = create_user(db, admin_user)
-        print("✅ Default admin user created successfully")
-        print(f"   Email: {created_admin.email}")
-        print(f"   Name: {created_admin.name}")
-        print(f"   Role: {created_admin.role}")
-        print(f"   Password: admin123 (CHANGE THIS AFTER FIRST LOGIN!)")
-        print(f"\n   Login at: http://localhost:8000/docs")
-        print(f"   Use POST /api/auth/token with username=admin@hr-automation.com and password=admin123")
-
-    except Exception as e:
-        print(f"❌ Error creating admin user: {e}")
-        raise
-    finally:
-        db.close()
-
-
-def main():
+    async with SessionLocal() as db:
+        try:
+            # Check if admin already exists
+            existing_admin = await get_user_by_email(db, "admin@hr-automation.com")
+            if existing_admin:
+                print("✅ Admin user already exists")
+                print(f"   Email: admin@hr-automation.com")
+                return
+
+            # Create default admin
+            admin_user = UserCreate(
+                email="admin@hr-automation.com",
+                name="System Administrator",
+                password="admin123",  # CHANGE THIS AFTER FIRST LOGIN!
+                role=UserRole.ADMIN,
+                is_active=True,
+                is_superuser=True
+            )
+
+            created_admin = await create_user(db, admin_user)
+            print("✅ Default admin user created successfully")
+            print(f"   Email: {created_admin.email}")
+            print(f"   Name: {created_admin.name}")
+            print(f"   Role: {created_admin.role}")
+            print(f"   Password: admin123 (CHANGE THIS AFTER FIRST LOGIN!)")
+            print(f"\n   Login at: http://localhost:8000/docs")
+            print(f"   Use POST /api/auth/token with username=admin@hr-automation.com and password=admin123")
+
+        except Exception as e:
+            print(f"❌ Error creating admin user: {e}")
+            raise
+
+
+async def main():
     """Main initialization function"""
     print("=" * 80)
     print("INITIALIZING AUTHENTICATION DATABASE")
@@ -72,13 +70,13 @@ def main():
     try:
         # Initialize database tables
         print("🔧 Creating database tables...")
-        init_db()
+        await init_db()
         print("✅ Database tables created successfully")
         print()
 
         # Create default admin
         print("👤 Creating default admin user...")
-        create_default_admin()
+        await create_default_admin()
         print()
 
         print("=" * 80)
@@ -105,7 +103,9 @@ def main():
         print("3. Verify POSTGRES_SERVER, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB")
         print()
         sys.exit(1)
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""Tests for the verified-JWT cache in backend.core.dependencies."""
+
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from backend.config import Config
+from backend.core import dependencies
+from backend.utils.ttl_cache import TTLCache
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def tokens(monkeypatch):
+    """Fake JWT decoding: token strings map to payloads; records each decode."""
+    payloads = {}
+    decoded = []
+    clock = [NOW]
+
+    def fake_decode(token):
+        decoded.append(token)
+        payload = payloads.get(token)
+        # jose rejects expired tokens itself.
+        if payload is None or payload.get("exp", clock[0] + 1) <= clock[0]:
+            return None
+        return payload
+
+    monkeypatch.setattr(dependencies, "decode_access_token", fake_decode)
+    monkeypatch.setattr(dependencies, "_OFFLOAD_JWT_DECODE", False)
+    monkeypatch.setattr(dependencies.time, "time", lambda: clock[0])
+    monkeypatch.setattr(Config, "AUTH_TOKEN_CACHE_TTL", 30)
+    monkeypatch.setattr(dependencies, "_token_cache", TTLCache(ttl=30, maxsize=100))
+    return SimpleNamespace(payloads=payloads, decoded=decoded, clock=clock)
+
+
+def _payload(sub, exp):
+    return {"sub": sub, "exp": exp, "role": "job_seeker"}
+
+
+async def test_verified_token_is_cached(tokens):
+    tokens.payloads["t1"] = _payload("a@x.io", NOW + 600)
+
+    assert await dependencies._token_subject("t1") == "a@x.io"
+    assert await dependencies._token_subject("t1") == "a@x.io"
+    assert tokens.decoded == ["t1"]
+
+
+async def test_cached_token_stops_at_its_own_exp(tokens):
+    tokens.payloads["t1"] = _payload("a@x.io", NOW + 10)
+    assert await dependencies._token_subject("t1") == "a@x.io"
+
+    tokens.clock[0] = NOW + 11
+    assert await dependencies._token_subject("t1") is None
+    # The expired entry was dropped and the token re-checked, not served from cache.
+    assert tokens.decoded == ["t1", "t1"]
+    assert len(dependencies._token_cache) == 0
+
+
+async def test_invalid_tokens_are_not_cached(tokens):
+    tokens.payloads["bad-shape"] = {"sub": "a@x.io"}
+
+    assert await dependencies._token_subject("garbage") is None
+    assert await dependencies._token_subject("garbage") is None
+    assert await dependencies._token_subject("bad-shape") is None
+    assert tokens.decoded == ["garbage", "garbage", "bad-shape"]
+    assert len(dependencies._token_cache) == 0
+
+
+async def test_cache_is_bounded_by_maxsize(tokens, monkeypatch):
+    monkeypatch.setattr(dependencies, "_token_cache", TTLCache(ttl=30, maxsize=2))
+    for name in ("t1", "t2", "t3"):
+        tokens.payloads[name] = _payload(f"{name}@x.io", NOW + 600)
+        await dependencies._token_subject(name)
+
+    assert len(dependencies._token_cache) == 2
+    await dependencies._token_subject("t1")  # evicted, so decoded again
+    assert tokens.decoded == ["t1", "t2", "t3", "t1"]
+
+
+async def test_zero_ttl_disables_cache(tokens, monkeypatch):
+    monkeypatch.setattr(Config, "AUTH_TOKEN_CACHE_TTL", 0)
+    tokens.payloads["t1"] = _payload("a@x.io", NOW + 600)
+
+    await dependencies._token_subject("t1")
+    await dependencies._token_subject("t1")
+    assert tokens.decoded == ["t1", "t1"]
+
+
+async def test_cached_token_still_resolves_user_through_user_cache(tokens, monkeypatch):
+    table = {"a@x.io": SimpleNamespace(id=uuid.uuid4(), email="a@x.io")}
+
+    @asynccontextmanager
+    async def fake_session():
+        yield None
+
+    async def fake_load(db, email):
+        return table.get(email)
+
+    monkeypatch.setattr(dependencies, "SessionLocal", fake_session)
+    monkeypatch.setattr(dependencies, "_load_user_detached", fake_load)
+    monkeypatch.setattr(Config, "AUTH_USER_CACHE_TTL", 5)
+    dependencies._user_cache.clear()
+    tokens.payloads["t1"] = _payload("a@x.io", NOW + 600)
+
+    user = table["a@x.io"]
+    assert await dependencies._resolve_user("t1") is user
+
+    # Deleting the user takes effect although the token itself is still cached.
+    del table["a@x.io"]
+    dependencies.invalidate_cached_user(user_id=str(user.id))
+    assert await dependencies._resolve_user("t1") is None
+    assert tokens.decoded == ["t1"]
+    dependencies._user_cache.clear()
@@ -0,0 +1,102 @@
+"""Tests for the per-worker authenticated-user cache in backend.core.dependencies."""
+
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from backend.config import Config
+from backend.core import dependencies
+
+
+@pytest.fixture
+def users(monkeypatch):
+    """Fake users table; records how often the database is queried."""
+    table = {}
+    calls = []
+
+    @asynccontextmanager
+    async def fake_session():
+        yield None
+
+    async def fake_load(db, email):
+        calls.append(email)
+        return table.get(email)
+
+    async def fake_subject(token):
+        return token or None
+
+    monkeypatch.setattr(dependencies, "SessionLocal", fake_session)
+    monkeypatch.setattr(dependencies, "_load_user_detached", fake_load)
+    monkeypatch.setattr(dependencies, "_token_subject", fake_subject)
+    monkeypatch.setattr(Config, "AUTH_USER_CACHE_TTL", 5)
+    dependencies._user_cache.clear()
+    yield SimpleNamespace(table=table, calls=calls)
+    dependencies._user_cache.clear()
+
+
+def _user(email, **fields):
+    return SimpleNamespace(id=uuid.uuid4(), email=email, is_active=True, **fields)
+
+
+async def test_user_is_cached_between_requests(users):
+    users.table["a@x.io"] = _user("a@x.io")
+
+    first = await dependencies._resolve_user("a@x.io")
+    second = await dependencies._resolve_user("a@x.io")
+
+    assert first is second is users.table["a@x.io"]
+    assert users.calls == ["a@x.io"]
+
+
+async def test_invalidate_by_email_reloads_user(users):
+    users.table["a@x.io"] = _user("a@x.io", role="job_seeker")
+    await dependencies._resolve_user("a@x.io")
+
+    users.table["a@x.io"] = _user("a@x.io", role="admin")
+    dependencies.invalidate_cached_user(email="a@x.io")
+
+    user = await dependencies._resolve_user("a@x.io")
+    assert user.role == "admin"
+    assert users.calls == ["a@x.io", "a@x.io"]
+
+
+async def test_invalidate_by_user_id_drops_deleted_user(users):
+    user = _user("a@x.io")
+    users.table["a@x.io"] = user
+    await dependencies._resolve_user("a@x.io")
+
+    del users.table["a@x.io"]
+    dependencies.invalidate_cached_user(user_id=str(user.id))
+
+    assert await dependencies._resolve_user("a@x.io") is None
+
+
+async def test_missing_user_is_cached_until_invalidated(users):
+    assert await dependencies._resolve_user("new@x.io") is None
+    assert await dependencies._resolve_user("new@x.io") is None
+    assert users.calls == ["new@x.io"]
+
+    # Registration clears the cached "no such user".
+    users.table["new@x.io"] = _user("new@x.io")
+    dependencies.invalidate_cached_user(email="new@x.io")
+    assert await dependencies._resolve_user("new@x.io") is users.table["new@x.io"]
+
+
+async def test_invalidate_by_user_id_skips_missing_user_entries(users):
+    await dependencies._resolve_user("gone@x.io")
+    dependencies.invalidate_cached_user(user_id=str(uuid.uuid4()))
+    assert await dependencies._resolve_user("gone@x.io") is None
+    assert users.calls == ["gone@x.io"]
+
+
+async def test_zero_ttl_disables_cache(users, monkeypatch):
+    monkeypatch.setattr(Config, "AUTH_USER_CACHE_TTL", 0)
+    users.table["a@x.io"] = _user("a@x.io")
+
+    await dependencies._resolve_user("a@x.io")
+    await dependencies._resolve_user("a@x.io")
+
+    assert users.calls == ["a@x.io", "a@x.io"]
+    assert len(dependencies._user_cache) == 0
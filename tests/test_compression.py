@@ -0,0 +1,72 @@
+"""Tests for backend.utils.compression.SelectiveGZipMiddleware."""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import FileResponse, JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from backend.utils.compression import SelectiveGZipMiddleware
+
+XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+@pytest.fixture
+def client(tmp_path):
+    workbook = tmp_path / "export.xlsx"
+    workbook.write_bytes(b"x" * 5000)
+
+    def pdf(request):
+        return StreamingResponse(
+            iter([b"a" * 3000, b"b" * 3000]),
+            media_type="application/pdf",
+            headers={"Content-Length": "6000"},
+        )
+
+    def xlsx(request):
+        return FileResponse(workbook, media_type=XLSX)
+
+    def json(request):
+        return JSONResponse({"data": "x" * 5000})
+
+    def small(request):
+        return JSONResponse({"ok": True})
+
+    app = Starlette(routes=[Route("/pdf", pdf), Route("/xlsx", xlsx), Route("/json", json), Route("/small", small)])
+    app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
+    return TestClient(app)
+
+
+def _get(client, path):
+    return client.get(path, headers={"Accept-Encoding": "gzip"})
+
+
+def test_pdf_is_not_compressed_and_keeps_content_length(client):
+    response = _get(client, "/pdf")
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == "6000"
+    assert response.content == b"a" * 3000 + b"b" * 3000
+
+
+def test_xlsx_is_not_compressed(client):
+    response = _get(client, "/xlsx")
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == "5000"
+
+
+def test_json_is_gzipped(client):
+    response = _get(client, "/json")
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < 5000
+    assert response.json() == {"data": "x" * 5000}
+
+
+def test_small_json_is_not_compressed(client):
+    response = _get(client, "/small")
+    assert "content-encoding" not in response.headers
+
+
+def test_client_without_gzip_gets_plain_responses(client):
+    for path in ("/pdf", "/json"):
+        response = client.get(path, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
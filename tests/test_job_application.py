@@ -0,0 +1,27 @@
+"""Tests for JobApplication's HTML-to-text description."""
+
+from backend.schemas.hr_api import JobApplication
+
+HTML = "<p>Backend engineer</p><ul><li>Python</li><li>MongoDB</li></ul>"
+TEXT = "Backend engineer\n\n• Python\n• MongoDB"
+
+
+def test_description_derived_from_html_when_missing():
+    job = JobApplication(title="Dev", descriptionHTML=HTML)
+    assert job.description == TEXT
+
+
+def test_html_in_both_fields_is_converted():
+    # create_job stores the raw request body as description and description_html.
+    job = JobApplication(title="Dev", descriptionHTML=HTML, description=HTML)
+    assert job.description == TEXT
+
+
+def test_stored_derived_description_is_kept():
+    job = JobApplication(title="Dev", descriptionHTML=HTML, description="Edited summary")
+    assert job.description == "Edited summary"
+
+
+def test_plain_text_in_both_fields_is_unchanged():
+    job = JobApplication(title="Dev", descriptionHTML="Plain text job", description="Plain text job")
+    assert job.description == "Plain text job"
@@ -0,0 +1,32 @@
+"""Tests for backend.utils.object_ids."""
+
+from bson import ObjectId
+
+from backend.utils.object_ids import is_object_id, parse_object_ids
+
+VALID = "64b7f0c2a1b2c3d4e5f60718"
+
+
+def test_parse_object_ids_drops_invalid_and_empty_ids():
+    result = parse_object_ids([VALID, "not-an-id", "", None, "64b7f0c2a1b2c3d4e5f6071", "zz" * 12])
+    assert result == {VALID: ObjectId(VALID)}
+
+
+def test_parse_object_ids_collapses_duplicates():
+    oid = ObjectId(VALID)
+    result = parse_object_ids([VALID, VALID, oid])
+    assert result == {VALID: oid}
+
+
+def test_parse_object_ids_with_nothing_valid_is_empty():
+    assert parse_object_ids(["nope", "", None]) == {}
+    assert parse_object_ids([]) == {}
+
+
+def test_is_object_id():
+    assert is_object_id(VALID)
+    assert is_object_id(VALID.upper())
+    assert not is_object_id(VALID + "0")
+    assert not is_object_id("g" * 24)
+    assert not is_object_id(ObjectId(VALID))
+    assert not is_object_id(None)
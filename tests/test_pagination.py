@@ -0,0 +1,197 @@
+"""Tests for list pagination in the my-resumes and candidates routes."""
+
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from backend.api.routes import candidates as candidates_routes
+from backend.api.routes.candidates import get_candidates_router
+from backend.api.routes.my_resumes import (
+    _decode_cursor,
+    _encode_cursor,
+    _keyset_after,
+    get_my_resumes_router,
+)
+
+
+def _matches(doc, query):
+    """The subset of MongoDB filter semantics the list routes use."""
+    for key, cond in query.items():
+        if key == "$or":
+            if not any(_matches(doc, q) for q in cond):
+                return False
+        elif key == "$and":
+            if not all(_matches(doc, q) for q in cond):
+                return False
+        elif isinstance(cond, dict):
+            value = doc.get(key)
+            # $lt never matches null/missing (different BSON type bracket).
+            if value is None or not value < cond["$lt"]:
+                return False
+        elif doc.get(key) != cond:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs, calls):
+        self.docs = docs
+        self.calls = calls
+
+    def sort(self, key, direction=None):
+        keys = key if isinstance(key, list) else [(key, direction)]
+        self.calls.append(("sort", keys))
+        for field, order in reversed(keys):
+            # Descending order puts null/missing last, as MongoDB does.
+            self.docs.sort(key=lambda d: (d.get(field) is not None, d.get(field) or ""), reverse=order < 0)
+        return self
+
+    def skip(self, n):
+        self.calls.append(("skip", n))
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.calls.append(("limit", n))
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+
+    def find(self, query, projection=None):
+        self.calls.append(("find", query))
+        return FakeCursor([dict(d) for d in self.docs if _matches(d, query)], self.calls)
+
+    async def count_documents(self, query):
+        return sum(1 for d in self.docs if _matches(d, query))
+
+
+def _endpoint(router, path):
+    return next(r.endpoint for r in router.routes if r.path == path)
+
+
+# ---------------------------------------------------------------------------
+# my-resumes: keyset cursor on (timestamp desc, _id desc)
+# ---------------------------------------------------------------------------
+
+USER = SimpleNamespace(id="u1", email="me@x.io")
+
+
+def _resume(ts, **fields):
+    return {"_id": ObjectId(), "timestamp": ts, "user_id": "u1", **fields}
+
+
+@pytest.fixture
+def resumes():
+    docs = [
+        _resume("2024-05-03"),
+        _resume("2024-05-02"),
+        _resume("2024-05-02"),  # same timestamp: ordered by _id
+        _resume("2024-05-01"),
+        _resume(None),
+        _resume(None),
+        # Legacy row owned by email only.
+        {"_id": ObjectId(), "timestamp": "2024-04-30", "candidate_email": "me@x.io"},
+        # Someone else's.
+        {"_id": ObjectId(), "timestamp": "2024-05-04", "user_id": "u2"},
+    ]
+    return FakeCollection(docs)
+
+
+def test_cursor_round_trip():
+    oid = ObjectId()
+    assert _decode_cursor(_encode_cursor("2024-05-01T10:00:00", oid)) == ("2024-05-01T10:00:00", oid)
+    assert _decode_cursor(_encode_cursor(None, oid)) == (None, oid)
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "", _encode_cursor("2024", ObjectId())[:-4] + "AAAA"])
+def test_invalid_cursor_is_400(token):
+    with pytest.raises(HTTPException) as exc:
+        _decode_cursor(token)
+    assert exc.value.status_code == 400
+
+
+def test_keyset_after_null_timestamp_stays_among_nulls():
+    oid = ObjectId()
+    assert _keyset_after((None, oid)) == {"timestamp": None, "_id": {"$lt": oid}}
+
+
+async def test_my_resumes_pages_cover_every_row_once(resumes):
+    list_my_resumes = _endpoint(get_my_resumes_router(SimpleNamespace(candidates=resumes)), "/my-resumes")
+    owned = [d for d in resumes.docs if d.get("user_id") == "u1" or d.get("candidate_email") == "me@x.io"]
+    expected = [str(d["_id"]) for d in FakeCursor(list(owned), []).sort([("timestamp", -1), ("_id", -1)]).docs]
+
+    seen, after = [], None
+    while True:
+        page = await list_my_resumes(current_user=USER, limit=2, after=after)
+        assert page["total"] == len(owned)
+        assert len(page["resumes"]) <= 2
+        seen += [r["_id"] for r in page["resumes"]]
+        after = page["next_cursor"]
+        if after is None:
+            break
+
+    assert seen == expected
+
+
+async def test_my_resumes_last_page_has_no_cursor(resumes):
+    list_my_resumes = _endpoint(get_my_resumes_router(SimpleNamespace(candidates=resumes)), "/my-resumes")
+    page = await list_my_resumes(current_user=USER, limit=7, after=None)
+    assert len(page["resumes"]) == 7
+    assert page["next_cursor"] is None
+    assert ("limit", 8) in resumes.calls
+
+
+async def test_my_resumes_rejects_bad_cursor(resumes):
+    list_my_resumes = _endpoint(get_my_resumes_router(SimpleNamespace(candidates=resumes)), "/my-resumes")
+    with pytest.raises(HTTPException) as exc:
+        await list_my_resumes(current_user=USER, limit=2, after="garbage")
+    assert exc.value.status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# candidates: offset paging with an over-fetched row for has_more
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def candidates(monkeypatch):
+    coll = FakeCollection([{"_id": str(i), "timestamp": f"2024-05-{i:02d}"} for i in range(1, 6)])
+    monkeypatch.setattr(candidates_routes, "get_str_id_collection", lambda db, name: coll)
+    return coll
+
+
+async def _list_candidates(**params):
+    get_candidates = _endpoint(get_candidates_router(SimpleNamespace()), "/candidates")
+    args = dict(job_id=None, min_score=None, max_score=None, limit=50, offset=0,
+                sort_by="timestamp", sort_order="desc")
+    return await get_candidates(**{**args, **params})
+
+
+async def test_candidates_has_more_from_extra_row(candidates):
+    page = await _list_candidates(limit=2, offset=0)
+    assert [c["_id"] for c in page["candidates"]] == ["5", "4"]
+    assert page["has_more"] is True
+    assert ("limit", 3) in candidates.calls
+
+
+async def test_candidates_last_page(candidates):
+    page = await _list_candidates(limit=2, offset=4)
+    assert [c["_id"] for c in page["candidates"]] == ["1"]
+    assert page["has_more"] is False
+    assert ("skip", 4) in candidates.calls
+
+
+async def test_candidates_exact_fit_has_no_more(candidates):
+    page = await _list_candidates(limit=5, offset=0)
+    assert len(page["candidates"]) == 5
+    assert page["has_more"] is False
@@ -0,0 +1,85 @@
+"""Tests for backend.services.hr.score_distribution."""
+
+from types import SimpleNamespace
+
+from pymongo import UpdateOne
+
+from backend.services.hr.score_distribution import (
+    SCORE_RANGES,
+    distribution_rows,
+    get_job_score_counts,
+    save_evaluations,
+)
+
+
+class FakeEvaluations:
+    def __init__(self, buckets=None):
+        self.buckets = buckets or []
+        self.pipelines = []
+        self.writes = []
+
+    async def bulk_write(self, ops, ordered=True):
+        self.writes.append((ops, ordered))
+
+    async def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        buckets = self.buckets
+
+        class _Cursor:
+            async def to_list(self, length):
+                return buckets
+
+        return _Cursor()
+
+
+async def test_save_evaluations_upserts_by_candidate_and_job():
+    coll = FakeEvaluations()
+    docs = [
+        {"candidate_id": "c1", "job_id": "j1", "score": 80},
+        {"candidate_id": "c2", "job_id": "j1", "score": None},
+    ]
+
+    await save_evaluations(coll, docs)
+
+    [(ops, ordered)] = coll.writes
+    assert ordered is False
+    assert ops == [
+        UpdateOne({"candidate_id": "c1", "job_id": "j1"}, {"$set": docs[0]}, upsert=True),
+        UpdateOne({"candidate_id": "c2", "job_id": "j1"}, {"$set": docs[1]}, upsert=True),
+    ]
+
+
+async def test_save_evaluations_skips_empty_batch():
+    coll = FakeEvaluations()
+    await save_evaluations(coll, [])
+    assert coll.writes == []
+
+
+async def test_job_score_counts_maps_buckets_by_lower_bound():
+    coll = FakeEvaluations(buckets=[
+        {"_id": 50, "count": 2},
+        {"_id": 90, "count": 1},  # 90-100, including a score of 100
+        {"_id": "other", "count": 4},  # missing or out-of-range scores
+    ])
+    db = SimpleNamespace(candidate_evaluations=coll)
+
+    counts = await get_job_score_counts(db, "j1")
+
+    assert counts == {"0-49": 0, "50-59": 2, "60-69": 0, "70-79": 0, "80-89": 0, "90-100": 1}
+    [pipeline] = coll.pipelines
+    assert pipeline[0] == {"$match": {"job_id": "j1"}}
+    assert pipeline[-1]["$bucket"]["boundaries"] == [0, 50, 60, 70, 80, 90, 101]
+
+
+def test_distribution_rows_percentages():
+    rows = distribution_rows({"50-59": 1, "90-100": 3})
+
+    assert [r["range"] for r in rows] == SCORE_RANGES
+    by_range = {r["range"]: r for r in rows}
+    assert by_range["50-59"] == {"range": "50-59", "count": 1, "percentage": 25.0}
+    assert by_range["90-100"]["percentage"] == 75.0
+    assert by_range["0-49"] == {"range": "0-49", "count": 0, "percentage": 0.0}
+
+
+def test_distribution_rows_empty():
+    assert all(r["percentage"] == 0 for r in distribution_rows({}))
@@ -0,0 +1,56 @@
+"""Tests for backend.utils.tasks."""
+
+import asyncio
+
+import pytest
+
+from backend.utils.tasks import gather_eager, start_eager
+
+
+async def test_gather_eager_returns_results_in_order():
+    async def work(n):
+        if n % 2:
+            await asyncio.sleep(0)
+        return n * 10
+
+    assert await gather_eager(work(n) for n in range(5)) == [0, 10, 20, 30, 40]
+
+
+async def test_gather_eager_propagates_first_error():
+    async def ok():
+        await asyncio.sleep(0)
+        return "ok"
+
+    async def fails():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await gather_eager([ok(), fails(), ok()])
+
+
+async def test_gather_eager_propagates_error_raised_after_suspension():
+    async def fails_later():
+        await asyncio.sleep(0)
+        raise RuntimeError("late")
+
+    with pytest.raises(RuntimeError, match="late"):
+        await gather_eager([fails_later()])
+
+
+async def test_start_eager_runs_until_first_suspension():
+    events = []
+
+    async def work(name, block):
+        events.append(name)
+        if block:
+            await asyncio.sleep(0)
+            events.append(name + " resumed")
+        return name
+
+    tasks = start_eager([work("a", False), work("b", True)])
+
+    # Both ran synchronously at creation; "a" never suspended, so it is already done.
+    assert events == ["a", "b"]
+    assert tasks[0].done() and not tasks[1].done()
+    assert await asyncio.gather(*tasks) == ["a", "b"]
+    assert events == ["a", "b", "b resumed"]
@@ -0,0 +1,77 @@
+"""Tests for backend.utils.ttl_cache.TTLCache."""
+
+import pytest
+
+from backend.utils import ttl_cache
+from backend.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+
+    clock[0] += 0.2
+    assert cache.get("a") is None
+    assert cache.get("a", "default") == "default"
+    assert len(cache) == 0
+
+
+def test_set_refreshes_expiry(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    clock[0] += 8
+    cache.set("a", 2)
+    clock[0] += 8
+    assert cache.get("a") == 2
+
+
+def test_maxsize_evicts_least_recently_used(clock):
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_returns_and_removes(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert cache.get("a") is None
+
+
+def test_discard_where_removes_matching_values(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+    cache.set("c", {"id": 1})
+
+    cache.discard_where(lambda v: v["id"] == 1)
+
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert cache.get("b") == {"id": 2}
+
+
+def test_clear(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    cache.clear()
+    assert len(cache) == 0